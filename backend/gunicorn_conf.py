@@ -0,0 +1,145 @@
+"""
+Gunicorn configuration: ``gunicorn -c backend/gunicorn_conf.py``.
+
+Workers and threads are sized from the container's cgroup CPU and memory
+limits. The app is preloaded in the master and its objects are moved out of
+the garbage collector's reach (``gc.freeze()``) before forking, so workers
+keep sharing those pages instead of copying them on the first collection.
+Workers are recycled after ``max_requests`` (with jitter) or as soon as their
+RSS grows past ``GUNICORN_MAX_WORKER_RSS_MB``.
+
+Environment:
+    GUNICORN_WORKER_CLASS   "gthread" (default) or "asgi" (uvicorn worker,
+                            needs ``uvicorn`` installed)
+    GUNICORN_WORKERS        fixed worker count instead of the sizing below
+    GUNICORN_THREADS        threads per gthread worker (default 4)
+    GUNICORN_WORKER_MEMORY_MB   expected steady-state RSS per worker (default 160)
+    GUNICORN_MAX_WORKER_RSS_MB  recycle a worker above this RSS (default 2.5x the above)
+    GUNICORN_MAX_REQUESTS   recycle after this many requests (default 5000, 0 = never)
+"""
+import gc
+import math
+import os
+
+CGROUP_ROOT = "/sys/fs/cgroup"
+# Memory kept free for the master process, page cache and migrations
+RESERVED_MEMORY_MB = 128
+ASGI_WORKER_CLASS = "uvicorn.workers.UvicornWorker"
+
+
+def _read(path):
+    try:
+        with open(path) as handle:
+            return handle.read().strip()
+    except OSError:
+        return None
+
+
+def cpu_limit(root=CGROUP_ROOT):
+    """Return the CPUs available to this container (may be fractional)"""
+    quota, period = None, None
+    cpu_max = _read(os.path.join(root, "cpu.max"))  # cgroup v2: "<quota> <period>" or "max <period>"
+    if cpu_max:
+        value, _, period = cpu_max.partition(" ")
+        quota = None if value == "max" else value
+    else:  # cgroup v1
+        quota = _read(os.path.join(root, "cpu", "cpu.cfs_quota_us"))
+        period = _read(os.path.join(root, "cpu", "cpu.cfs_period_us"))
+        if quota == "-1":
+            quota = None
+
+    try:
+        available = len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS
+        available = os.cpu_count() or 1
+    if quota and period:
+        return min(available, int(quota) / int(period))
+    return available
+
+
+def memory_limit(root=CGROUP_ROOT):
+    """Return the container memory limit in MB, or None when unlimited"""
+    value = _read(os.path.join(root, "memory.max")) or _read(os.path.join(root, "memory", "memory.limit_in_bytes"))
+    if not value or value == "max":
+        return None
+    limit = int(value)
+    # cgroup v1 reports "unlimited" as a huge page-aligned number
+    if limit >= 2 ** 60:
+        return None
+    return limit // (1024 * 1024)
+
+
+def worker_count(cpus, memory_mb, worker_memory_mb, worker_class="gthread"):
+    """
+    Workers for the given limits: ``cpus + 1`` for threaded/async workers
+    (threads or the event loop provide the concurrency), capped by how many
+    workers fit into the memory limit.
+    """
+    workers = max(2, math.ceil(cpus) + 1)
+    if worker_class == "asgi":
+        workers = max(1, math.ceil(cpus))
+    if memory_mb:
+        fits = (memory_mb - RESERVED_MEMORY_MB) // worker_memory_mb
+        workers = min(workers, max(1, fits))
+    return workers
+
+
+def current_rss_mb():
+    """Resident set size of the calling process in MB (Linux only)"""
+    statm = _read("/proc/self/statm")
+    if not statm:
+        return 0
+    return int(statm.split()[1]) * os.sysconf("SC_PAGE_SIZE") // (1024 * 1024)
+
+
+_worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gthread").lower()
+_worker_memory_mb = int(os.getenv("GUNICORN_WORKER_MEMORY_MB", "160"))
+max_worker_rss_mb = int(os.getenv("GUNICORN_MAX_WORKER_RSS_MB", str(int(_worker_memory_mb * 2.5))))
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+if _worker_class == "asgi":
+    wsgi_app = "backend.asgi:application"
+    worker_class = ASGI_WORKER_CLASS
+else:
+    wsgi_app = "backend.wsgi:application"
+    worker_class = "gthread"
+    threads = int(os.getenv("GUNICORN_THREADS", "4"))
+workers = int(os.getenv("GUNICORN_WORKERS") or worker_count(
+    cpu_limit(), memory_limit(), _worker_memory_mb, _worker_class
+))
+
+preload_app = True
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "5000"))
+max_requests_jitter = max_requests // 10
+timeout = 60
+graceful_timeout = 30
+keepalive = 5
+# Heartbeat files on tmpfs instead of the container's overlay filesystem
+worker_tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+loglevel = "info"
+accesslog = "-"
+
+
+def when_ready(server):
+    # Everything imported by the preloaded app lives for the whole process:
+    # collect once, then keep the collector from touching (and copying) it
+    gc.collect()
+    gc.freeze()
+    server.log.info(
+        "Serving %s with %s %s worker(s)%s",
+        wsgi_app, workers, worker_class, f" x {threads} threads" if worker_class == "gthread" else "",
+    )
+
+
+def pre_fork(server, worker):
+    # Connections opened while importing must not be shared with the children
+    from django.db import connections
+    connections.close_all()
+    gc.freeze()
+
+
+def post_request(worker, req, environ, resp):
+    rss = current_rss_mb()
+    if max_worker_rss_mb and rss > max_worker_rss_mb:
+        worker.log.info("Recycling worker %s: RSS %s MB > %s MB", worker.pid, rss, max_worker_rss_mb)
+        worker.alive = False
@@ -67,14 +67,16 @@ BLEACH_ALLOWED_STYLES = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
+    "core.compression.CompressionMiddleware",
+    "core.replicas.ReplicaPinMiddleware",
+    "core.middleware.FullStackSessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.locale.LocaleMiddleware",  
     "django.middleware.common.CommonMiddleware",
-    "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
-    "django.contrib.messages.middleware.MessageMiddleware",
-    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "core.middleware.FullStackCsrfViewMiddleware",
+    "core.middleware.FullStackAuthenticationMiddleware",
+    "core.middleware.FullStackMessageMiddleware",
+    "core.middleware.FullStackXFrameOptionsMiddleware",
 ]
 
 ROOT_URLCONF = "backend.urls"
@@ -98,19 +100,25 @@ TEMPLATES = [
 WSGI_APPLICATION = "backend.wsgi.application"
 
 # --- DB ---
+import urllib.parse as _url
+
+
+def _database_from_url(url):
+    parsed = _url.urlparse(url)
+    return {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": parsed.path.lstrip("/"),
+        "USER": parsed.username,
+        "PASSWORD": parsed.password,
+        "HOST": parsed.hostname,
+        "PORT": str(parsed.port or 5432),
+    }
+
+
 DATABASE_URL = os.getenv("DATABASE_URL")
 if DATABASE_URL:
-    import urllib.parse as _url
-    parsed = _url.urlparse(DATABASE_URL)
     DATABASES = {
-        "default": {
-            "ENGINE": "django.db.backends.postgresql",
-            "NAME": parsed.path.lstrip("/"),
-            "USER": parsed.username,
-            "PASSWORD": parsed.password,
-            "HOST": parsed.hostname,
-            "PORT": str(parsed.port or 5432),
-        }
+        "default": _database_from_url(DATABASE_URL)
     }
 else:
     DATABASES = {
@@ -124,6 +132,24 @@ else:
         }
     }
 
+# Read replicas (core.replicas), as comma-separated database URLs. Safe requests on the
+# read-only API viewsets read from a healthy one; writes and everything else use default.
+DATABASE_REPLICAS = []
+for _replica_url in os.getenv("DATABASE_REPLICA_URLS", "").split(","):
+    if _replica_url.strip():
+        _alias = f"replica{len(DATABASE_REPLICAS) + 1}"
+        DATABASES[_alias] = {
+            **_database_from_url(_replica_url.strip()),
+            "OPTIONS": {"connect_timeout": 2},  # an unreachable replica fails its health check fast
+            "TEST": {"MIRROR": "default"},
+        }
+        DATABASE_REPLICAS.append(_alias)
+DATABASE_ROUTERS = ["core.replicas.PrimaryReplicaRouter"]
+# Reads stay on the primary this long after a client's own writes, and for everyone after cached data changes
+DATABASE_REPLICA_PIN_SECONDS = int(os.getenv("DATABASE_REPLICA_PIN_SECONDS", "10"))
+DATABASE_REPLICA_MAX_LAG = float(os.getenv("DATABASE_REPLICA_MAX_LAG", "5"))  # seconds behind the primary
+DATABASE_REPLICA_CHECK_INTERVAL = 10  # seconds between health checks of a replica, per process
+
 # --- Passwords ---
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
@@ -165,12 +191,87 @@ if USE_S3:
     AWS_S3_FILE_OVERWRITE = False
     AWS_DEFAULT_ACL = None
     AWS_S3_OBJECT_PARAMETERS = {"CacheControl": "max-age=86400"}
+    # S3-compatible stand-ins (MinIO in local-compose.yml) need an explicit endpoint
+    AWS_S3_ENDPOINT_URL = os.getenv("AWS_S3_ENDPOINT_URL") or None
+    if AWS_S3_ENDPOINT_URL:
+        AWS_S3_ADDRESSING_STYLE = "path"
     STATICFILES_STORAGE = "storages.backends.s3boto3.S3Boto3Storage"
     DEFAULT_FILE_STORAGE = "storages.backends.s3boto3.S3Boto3Storage"
     STATIC_URL = f"https://{AWS_STORAGE_BUCKET_NAME}.s3.amazonaws.com/static/"
     MEDIA_URL = f"https://{AWS_STORAGE_BUCKET_NAME}.s3.amazonaws.com/media/"
+elif os.getenv("STATIC_HASHED", "False").lower() == "true":
+    # Content-hashed names + .gz/.br siblings for nginx (immutable caching, gzip_static)
+    STATICFILES_STORAGE = "core.storage.CompressedManifestStaticFilesStorage"
+
 
 
+# --- Cache ---
+# Shared cache for all workers; without REDIS_URL each process keeps its own LocMemCache
+REDIS_URL = os.getenv("REDIS_URL")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+
+
+# --- Sitemaps & feeds ---
+FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:3000")
+SITEMAP_CHUNK_SIZE = int(os.getenv("SITEMAP_CHUNK_SIZE", "5000"))  # URLs are per language, max 50000 per file
+FEED_ITEMS = int(os.getenv("FEED_ITEMS", "50"))
+FEED_TITLE = os.getenv("FEED_TITLE", "Creadive Blog")
+FEED_DESCRIPTION = os.getenv("FEED_DESCRIPTION", "Latest posts from Creadive")
+# Cached JSON API responses (0 disables). An entry is fresh for the soft timeout and
+# until the data changes; after that it is still served (for up to API_CACHE_TIMEOUT)
+# while a single request holding the lock renders its replacement.
+API_CACHE_TIMEOUT = int(os.getenv("API_CACHE_TIMEOUT", "3600"))
+API_CACHE_SOFT_TIMEOUT = int(os.getenv("API_CACHE_SOFT_TIMEOUT", "300"))
+API_CACHE_LOCK_TIMEOUT = 30  # longest a render may hold the regeneration lock
+API_CACHE_LOCK_WAIT = 2.0  # how long a request with nothing to serve waits for the lock holder
+# Stateless public paths (matched against request.path_info): their responses are
+# brotli/gzip compressed (core.compression) and they are served without session, CSRF,
+# auth, message and X-Frame-Options middleware (core.middleware); everything else,
+# the admin included, runs the full stack uncompressed
+STATELESS_PATHS = ("/api/", "/sitemap", "/feeds/")
+# Smallest body core.compression compresses
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+# warm_cache (run by the entrypoint): concurrent requests, and detail pages per viewset
+WARM_CACHE_WORKERS = int(os.getenv("WARM_CACHE_WORKERS", "4"))
+WARM_CACHE_DETAILS = int(os.getenv("WARM_CACHE_DETAILS", "20"))
+# Most objects one ?ids=... bulk request may ask for
+BULK_IDS_MAX = int(os.getenv("BULK_IDS_MAX", "100"))
+# Related posts: matches kept per post, and the default/maximum the API returns
+RELATED_POSTS_STORED = int(os.getenv("RELATED_POSTS_STORED", "24"))
+RELATED_POSTS_LIMIT = int(os.getenv("RELATED_POSTS_LIMIT", "4"))
+RELATED_POSTS_MAX_LIMIT = 12
+# Safety net only: entries are retired by version bumps on every change
+SYNDICATION_CACHE_TIMEOUT = int(os.getenv("SYNDICATION_CACHE_TIMEOUT", "86400"))
+
+# Purge webhook to the frontend after content changes (disabled when unset).
+# Changes are debounced per process and coalesced into one POST.
+FRONTEND_PURGE_URL = os.getenv("FRONTEND_PURGE_URL")
+FRONTEND_PURGE_TOKEN = os.getenv("FRONTEND_PURGE_TOKEN", "")
+FRONTEND_PURGE_DEBOUNCE = float(os.getenv("FRONTEND_PURGE_DEBOUNCE", "2"))
+FRONTEND_PURGE_MAX_DELAY = float(os.getenv("FRONTEND_PURGE_MAX_DELAY", "10"))
+FRONTEND_PURGE_RETRIES = int(os.getenv("FRONTEND_PURGE_RETRIES", "4"))
+FRONTEND_PURGE_BACKOFF = 1.0  # seconds, doubled per retry
+FRONTEND_PURGE_TIMEOUT = 5
+
+# --- Admin ---
+# Changelists switch from COUNT(*) to Postgres planner estimates above this many rows
+ADMIN_ESTIMATED_COUNT_THRESHOLD = int(os.getenv("ADMIN_ESTIMATED_COUNT_THRESHOLD", "10000"))
+ADMIN_FILTER_CHOICES_TIMEOUT = int(os.getenv("ADMIN_FILTER_CHOICES_TIMEOUT", "300"))
+# Rows fetched per server-side cursor round trip by streaming exports
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", "2000"))
+# Admin image fields upload straight to the bucket (presigned multipart) when S3 is used
+DIRECT_UPLOADS = USE_S3 and os.getenv("DIRECT_UPLOADS", "True").lower() == "true"
+DIRECT_UPLOAD_PART_SIZE = int(os.getenv("DIRECT_UPLOAD_PART_SIZE", str(8 * 1024 * 1024)))
+DIRECT_UPLOAD_MAX_SIZE = int(os.getenv("DIRECT_UPLOAD_MAX_SIZE", str(5 * 1024 * 1024 * 1024)))
+DIRECT_UPLOAD_URL_EXPIRES = int(os.getenv("DIRECT_UPLOAD_URL_EXPIRES", "3600"))
+DIRECT_UPLOAD_TOKEN_MAX_AGE = int(os.getenv("DIRECT_UPLOAD_TOKEN_MAX_AGE", "86400"))
+
 
 # --- DRF ---
 REST_FRAMEWORK = {
@@ -226,6 +327,16 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 REST_FRAMEWORK = {
     # ... your existing DRF settings
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    # orjson-backed drop-ins for DRF's JSONRenderer/JSONParser (core.renderers)
+    "DEFAULT_RENDERER_CLASSES": [
+        "core.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "core.renderers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
 }
 
 SPECTACULAR_SETTINGS = {
@@ -234,4 +345,8 @@ SPECTACULAR_SETTINGS = {
     "VERSION": "1.0.0",
     "SERVE_INCLUDE_SCHEMA": False,  # optional
     "COMPONENT_SPLIT_REQUEST": True, # optional, better schema separation
-}
\ No newline at end of file
+}
+# Prebuilt schema artifacts (manage.py build_schema), one directory per code version.
+# CODE_VERSION (e.g. the git SHA) defaults to a digest of the project sources.
+CODE_VERSION = os.getenv("CODE_VERSION", "")
+SCHEMA_CACHE_DIR = os.getenv("SCHEMA_CACHE_DIR", str(BASE_DIR / ".schema"))
\ No newline at end of file
@@ -3,9 +3,14 @@ from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import path, include
 from django.conf.urls.i18n import i18n_patterns
+from core.feeds import blog_feed
+from core.sitemaps import sitemap_index, sitemap_section
 
 urlpatterns = [
     path("api/", include("core.urls")),
+    path("sitemap.xml", sitemap_index, name="sitemap-index"),
+    path("sitemap-<str:section>-<int:page>.xml", sitemap_section, name="sitemap-section"),
+    path("feeds/blog/<str:language>/<str:kind>.xml", blog_feed, name="blog-feed"),
 ]
 
 urlpatterns += i18n_patterns(
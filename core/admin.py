@@ -1,10 +1,20 @@
 from django import forms
 from django.contrib import admin
+from django.core.exceptions import PermissionDenied
+from django.http import HttpResponseBadRequest
+from django.urls import path
 from django.utils.html import format_html_join, format_html
 from ckeditor.widgets import CKEditorWidget
 from django import forms
 from modeltranslation.admin import TranslationAdmin
 from adminsortable2.admin import SortableAdminMixin, SortableInlineAdminMixin 
+from .admin_utils import (
+    BulkOrderAdminMixin,
+    BulkOrderInlineFormSet,
+    ChangeListPerformanceMixin,
+    DirectUploadAdminMixin,
+)
+from .exports import CONTACT_INQUIRY_COLUMNS, EXPORT_FORMATS, export_response, filter_contact_inquiries
 from .models import (
     BlogPost,
     PortfolioItem,
@@ -27,6 +37,7 @@ from .models import (
 class ServiceFeatureInline(SortableInlineAdminMixin, admin.TabularInline):  # ✅ sortable inline
     """Inline admin for service features"""
     model = ServiceFeature
+    formset = BulkOrderInlineFormSet
     extra = 1
     ordering = ['order', 'id']
 
@@ -38,6 +49,7 @@ class ServiceFeatureInline(SortableInlineAdminMixin, admin.TabularInline):  # 
 class SocialLinkInline(SortableInlineAdminMixin, admin.TabularInline):  # ✅ sortable inline
     """Inline admin for social links"""
     model = SocialLink
+    formset = BulkOrderInlineFormSet
     extra = 1
     ordering = ['order', 'id']
 
@@ -47,13 +59,13 @@ class SocialLinkInline(SortableInlineAdminMixin, admin.TabularInline):  # ✅ so
 
 
 # --- Shared Admin Mixins ---
-class TimeStampedAdmin(admin.ModelAdmin):
+class TimeStampedAdmin(ChangeListPerformanceMixin, admin.ModelAdmin):
     """Base admin class for timestamped models"""
     readonly_fields = ("createdAt", "updatedAt")
     ordering = ("-createdAt",)
 
 
-class OrderedAdmin(SortableAdminMixin, admin.ModelAdmin):  # ✅ make all ordered models sortable
+class OrderedAdmin(ChangeListPerformanceMixin, DirectUploadAdminMixin, BulkOrderAdminMixin, SortableAdminMixin, admin.ModelAdmin):  # ✅ make all ordered models sortable
     """Base admin class for ordered models"""
     readonly_fields = ("createdAt", "updatedAt")
     ordering = ("order", "id")
@@ -80,7 +92,7 @@ class RelationshipDisplayMixin:
 
 # --- Admin Registrations ---
 @admin.register(Tag)
-class TagAdmin(admin.ModelAdmin):
+class TagAdmin(ChangeListPerformanceMixin, admin.ModelAdmin):
     list_display = ('name', 'slug')
     search_fields = ('name',)
     prepopulated_fields = {'slug': ('name',)}
@@ -94,7 +106,7 @@ class CategoryAdmin(OrderedAdmin):  # ✅ sortable
 
 
 @admin.register(Technology)
-class TechnologyAdmin(admin.ModelAdmin):
+class TechnologyAdmin(ChangeListPerformanceMixin, admin.ModelAdmin):
     list_display = ('name', 'slug')
     search_fields = ('name',)
     prepopulated_fields = {'slug': ('name',)}
@@ -204,6 +216,38 @@ class ContactInquiryAdmin(OrderedAdmin):
     list_display = ("id", "fullName", "email", "phone", "status", "createdAt")
     list_filter = ("status", "createdAt")
     search_fields = ("fullName", "email", "phone", "company", "subject")
+    actions = ["export_csv", "export_xlsx"]
+
+    def get_urls(self):
+        urls = [
+            path(
+                "export/",
+                self.admin_site.admin_view(self.export_view),
+                name="core_contactinquiry_export",
+            ),
+        ]
+        return urls + super().get_urls()
+
+    def export_view(self, request):
+        """Stream all inquiries as ?format=csv|xlsx, filtered by status, date_from and date_to"""
+        if not self.has_view_permission(request):
+            raise PermissionDenied
+        export_format = request.GET.get("format", "csv")
+        if export_format not in EXPORT_FORMATS:
+            return HttpResponseBadRequest(f"Unknown format: {export_format}")
+        try:
+            queryset = filter_contact_inquiries(self.model.objects.all(), request.GET)
+        except ValueError as exc:
+            return HttpResponseBadRequest(str(exc))
+        return export_response(queryset, CONTACT_INQUIRY_COLUMNS, export_format, "contact-inquiries")
+
+    @admin.action(description="Export selected inquiries to CSV", permissions=["view"])
+    def export_csv(self, request, queryset):
+        return export_response(queryset, CONTACT_INQUIRY_COLUMNS, "csv", "contact-inquiries")
+
+    @admin.action(description="Export selected inquiries to Excel", permissions=["view"])
+    def export_xlsx(self, request, queryset):
+        return export_response(queryset, CONTACT_INQUIRY_COLUMNS, "xlsx", "contact-inquiries")
 
 
 @admin.register(FAQ)
@@ -0,0 +1,301 @@
+import json
+from contextvars import ContextVar
+
+from adminsortable2.admin import CustomInlineFormSet
+from django.conf import settings
+from django.contrib import admin
+from django.core import signing
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist, PermissionDenied
+from django.core.paginator import Paginator
+from django.db import connections, models, router, transaction
+from django.http import Http404, JsonResponse
+from django.urls import path, reverse
+from django.utils import timezone
+from django.utils.functional import cached_property
+from django.utils.translation import get_language
+from django.views.decorators.http import require_POST
+
+from .signals import order_changed
+from .uploads import DirectUploadImageField, DirectUploadWidget, abort_upload, complete_upload, start_upload
+
+
+def estimate_count(queryset):
+    """
+    Return the Postgres planner's row estimate for ``queryset``, or None when
+    no estimate is available (other backends, never-analyzed tables).
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+
+    with connection.cursor() as cursor:
+        if not queryset.query.where:
+            # Unfiltered changelist: read the table statistics directly
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+        else:
+            sql, params = queryset.order_by().query.sql_with_params()
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        row = cursor.fetchone()
+
+    if row is None:
+        return None
+    if isinstance(row[0], int):
+        estimate = row[0]
+    else:
+        plan = row[0] if isinstance(row[0], list) else json.loads(row[0])
+        estimate = plan[0]["Plan"]["Plan Rows"]
+    return estimate if estimate >= 0 else None
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator that uses planner estimates instead of COUNT(*) above a threshold"""
+
+    @cached_property
+    def count(self):
+        estimate = estimate_count(self.object_list)
+        if estimate is not None and estimate > settings.ADMIN_ESTIMATED_COUNT_THRESHOLD:
+            return estimate
+        return super().count
+
+
+def _cached_choices(field, build):
+    key = "admin-filter-choices:{}:{}:{}".format(field.model._meta.label_lower, field.name, get_language())
+    choices = cache.get(key)
+    if choices is None:
+        choices = list(build())
+        cache.set(key, choices, settings.ADMIN_FILTER_CHOICES_TIMEOUT)
+    return choices
+
+
+class CachedRelatedFieldListFilter(admin.RelatedFieldListFilter):
+    """RelatedFieldListFilter whose choice list is cached for a short time"""
+
+    def field_choices(self, field, request, model_admin):
+        return _cached_choices(field, lambda: super(CachedRelatedFieldListFilter, self).field_choices(
+            field, request, model_admin
+        ))
+
+
+class CachedAllValuesFieldListFilter(admin.AllValuesFieldListFilter):
+    """AllValuesFieldListFilter whose DISTINCT value list is cached for a short time"""
+
+    def __init__(self, field, request, params, model, model_admin, field_path):
+        super().__init__(field, request, params, model, model_admin, field_path)
+        self.lookup_choices = _cached_choices(field, lambda: self.lookup_choices)
+
+
+class ChangeListPerformanceMixin:
+    """
+    Keep changelists at a bounded number of cheap queries: estimated counts,
+    no second unfiltered COUNT(*), and cached filter choice lists.
+    """
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_list_filter(self, request):
+        list_filter = []
+        for spec in super().get_list_filter(request):
+            if isinstance(spec, str) and "__" not in spec:
+                field = self.model._meta.get_field(spec)
+                if field.is_relation:
+                    spec = (spec, CachedRelatedFieldListFilter)
+                elif not field.choices and field.get_internal_type() in ("CharField", "TextField"):
+                    spec = (spec, CachedAllValuesFieldListFilter)
+            list_filter.append(spec)
+        return list_filter
+
+
+def bulk_update_order(model, items, order_field="order", extra_filters=None):
+    """
+    Apply ``items`` (``[(pk, position), ...]``) with a single
+    ``UPDATE ... FROM (VALUES ...)`` and send ``order_changed`` once after
+    commit. Returns the number of rows whose position actually changed.
+
+    No ``save()`` runs, so there is no ``post_save``: the ``auto_now``
+    fields (``updatedAt``) of the moved rows are set by the same statement,
+    and receivers react to ``order_changed`` instead.
+    """
+    items = [(int(pk), int(position)) for pk, position in items]
+    if extra_filters:
+        allowed = set(
+            model._default_manager.filter(pk__in=[pk for pk, _ in items], **extra_filters)
+            .values_list("pk", flat=True)
+        )
+        items = [(pk, position) for pk, position in items if pk in allowed]
+    if not items:
+        return 0
+
+    using = router.db_for_write(model)
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    table = quote(model._meta.db_table)
+    pk_column = quote(model._meta.pk.column)
+    order_column = quote(model._meta.get_field(order_field).column)
+    touched = [quote(field.column) for field in model._meta.concrete_fields if getattr(field, "auto_now", False)]
+    assignments = "".join(f", {column} = %s" for column in touched)
+    values = ", ".join(["(%s, %s)"] * len(items))
+    sql = (
+        f"UPDATE {table} SET {order_column} = v.position{assignments} "
+        f"FROM (VALUES {values}) AS v(pk, position) "
+        f"WHERE {table}.{pk_column} = v.pk AND {table}.{order_column} IS DISTINCT FROM v.position"
+    )
+    now = timezone.now()
+    params = [now for _ in touched] + [value for item in items for value in item]
+
+    with transaction.atomic(using=using):
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            updated = cursor.rowcount
+        pks = [pk for pk, _ in items]
+        transaction.on_commit(lambda: order_changed.send(sender=model, pks=pks), using=using)
+    return updated
+
+
+# (startorder, endorder, extra_model_filters) of the moves of the "move to page" action in progress
+_pending_moves = ContextVar("pending_moves", default=None)
+
+
+class BulkOrderAdminMixin:
+    """
+    Mixin for SortableAdminMixin admins that applies drag-and-drop and
+    "move to page" reorders as one bulk statement instead of row by row.
+    """
+
+    def _update_order(self, updated_items, extra_model_filters):
+        return bulk_update_order(self.model, updated_items, self.default_order_field, extra_model_filters)
+
+    def _bulk_move(self, request, queryset, method):
+        # adminsortable2 moves the selected objects one _move_item() at a time;
+        # collect those moves and apply them all at once
+        moves = []
+        token = _pending_moves.set(moves)
+        try:
+            super()._bulk_move(request, queryset, method)
+        finally:
+            _pending_moves.reset(token)
+        if moves:
+            self._apply_moves([(startorder, endorder) for startorder, endorder, _ in moves], moves[0][2])
+
+    def _move_item(self, startorder, endorder, extra_model_filters):
+        if endorder == startorder:
+            return self.model.objects.none()
+        pending = _pending_moves.get()
+        if pending is not None:
+            pending.append((startorder, endorder, extra_model_filters))
+            return {}
+        return self._apply_moves([(startorder, endorder)], extra_model_filters)
+
+    def _apply_moves(self, moves, extra_model_filters):
+        """
+        Replay ``moves`` (``[(startorder, endorder), ...]``, each shifting
+        the rows in between by one) on the positions in memory and write the
+        result with one ``bulk_update_order``. Returns ``{pk: new position}``
+        of the rows that moved.
+        """
+        rank_field = self.default_order_field
+        filters = {
+            f"{rank_field}__gte": min(min(move) for move in moves),
+            f"{rank_field}__lte": max(max(move) for move in moves),
+            **(extra_model_filters or {}),
+        }
+        with transaction.atomic():
+            original = dict(self.model.objects.filter(**filters).values_list("pk", rank_field))
+            positions = dict(original)
+            for startorder, endorder in moves:
+                if endorder == startorder:
+                    continue
+                moving = [pk for pk, position in positions.items() if position == startorder]
+                if not moving:
+                    raise self.model.DoesNotExist(f"No {self.model._meta.object_name} at position {startorder}.")
+                if len(moving) > 1:
+                    raise self.model.MultipleObjectsReturned(
+                        f"Detected non-unique values in field '{rank_field}' used for sorting this model.\n"
+                        f"Consider to run \n    python manage.py reorder {self.model._meta.label}\n"
+                        "to adjust this inconsistency."
+                    )
+                if endorder < startorder:  # Drag up
+                    low, high, delta = endorder, startorder - 1, +1
+                else:  # Drag down
+                    low, high, delta = startorder + 1, endorder, -1
+                for pk, position in positions.items():
+                    if low <= position <= high:
+                        positions[pk] = position + delta
+                positions[moving[0]] = endorder
+            moved = {pk: position for pk, position in positions.items() if position != original[pk]}
+            bulk_update_order(self.model, moved.items(), rank_field)
+        return moved
+
+
+class BulkOrderInlineFormSet(CustomInlineFormSet):
+    """
+    Sortable inline formset that saves pure position changes in one
+    statement. Those rows are not saved one by one, so they send no
+    ``post_save``; see ``bulk_update_order``.
+    """
+
+    def save_existing_objects(self, commit=True):
+        self._reordered = []
+        saved_instances = super().save_existing_objects(commit)
+        if self._reordered:
+            bulk_update_order(self.model, self._reordered, self.default_order_field)
+        return saved_instances
+
+    def save_existing(self, form, obj, commit=True):
+        if commit and form.changed_data == [self.default_order_field]:
+            self._reordered.append((obj.pk, getattr(obj, self.default_order_field)))
+            return obj
+        return super().save_existing(form, obj, commit)
+
+
+class DirectUploadAdminMixin:
+    """
+    Upload image fields straight from the browser to the bucket with
+    presigned multipart uploads (``settings.DIRECT_UPLOADS``); the form only
+    receives a signed token naming the stored object.
+    """
+    direct_upload_steps = ("start", "complete", "abort")
+
+    def get_urls(self):
+        info = self.opts.app_label, self.opts.model_name
+        urls = [
+            path(
+                "direct-upload/<str:step>/",
+                self.admin_site.admin_view(require_POST(self.direct_upload_view)),
+                name="%s_%s_direct_upload" % info,
+            ),
+        ]
+        return urls + super().get_urls()
+
+    def formfield_for_dbfield(self, db_field, request, **kwargs):
+        if settings.DIRECT_UPLOADS and isinstance(db_field, models.ImageField):
+            url_name = "admin:%s_%s_direct_upload" % (self.opts.app_label, self.opts.model_name)
+            urls = {step: reverse(url_name, args=[step]) for step in self.direct_upload_steps}
+            kwargs["form_class"] = DirectUploadImageField
+            kwargs["widget"] = DirectUploadWidget(db_field, urls)
+        return super().formfield_for_dbfield(db_field, request, **kwargs)
+
+    def direct_upload_view(self, request, step):
+        if step not in self.direct_upload_steps:
+            raise Http404
+        if not (self.has_add_permission(request) or self.has_change_permission(request)):
+            raise PermissionDenied
+
+        try:
+            payload = json.loads(request.body)
+            field = self.model._meta.get_field(payload["field"])
+            if not isinstance(field, models.ImageField):
+                raise ValueError("Not an image field")
+            if step == "start":
+                result = start_upload(field, payload["filename"], payload["size"], payload.get("contentType", ""))
+            elif step == "complete":
+                result = {"token": complete_upload(field, payload["token"], payload["parts"])}
+            else:
+                abort_upload(field, payload["token"])
+                result = {}
+        except (KeyError, TypeError, ValueError, FieldDoesNotExist, signing.BadSignature) as exc:
+            return JsonResponse({"error": str(exc)}, status=400)
+        return JsonResponse(result)
@@ -6,4 +6,5 @@ class CoreConfig(AppConfig):
     name = 'core'
 
     def ready(self):
-        from .translation import BlogPostTO 
+        from .translation import BlogPostTO
+        from . import receivers  # noqa: F401 
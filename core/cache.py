@@ -0,0 +1,172 @@
+"""
+Version-keyed caching.
+
+Cached artifacts embed the current version of the data they were built
+from in their key; bumping the version after a change makes every older
+entry unreachable at once, without tracking or deleting individual keys.
+"""
+import hashlib
+import time
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.cache import patch_vary_headers
+
+from .compression import precompress
+
+VERSION_TIMEOUT = None  # versions must outlive the entries keyed by them
+
+
+def _version_name(name):
+    # Models are versioned under their label, e.g. "core.blogpost"
+    return getattr(getattr(name, "_meta", None), "label_lower", name)
+
+
+def _initial_version():
+    # Never restart at a number older entries may still be stored under
+    # (e.g. after the version key was evicted)
+    return time.time_ns() // 1000
+
+
+def get_version(name):
+    """Return the current version of ``name`` (a string or a model)"""
+    key = f"version:{_version_name(name)}"
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _initial_version(), VERSION_TIMEOUT)
+        version = cache.get(key)
+    return version
+
+
+def get_versions(names):
+    """``{name: version}`` of ``names``, read in one round trip"""
+    keys = {f"version:{_version_name(name)}": name for name in names}
+    found = cache.get_many(keys)
+    versions = {}
+    for key, name in keys.items():
+        versions[name] = found[key] if key in found else get_version(name)
+    return versions
+
+
+def bump_version(name):
+    """Invalidate everything cached under ``name`` (a string or a model)"""
+    key = f"version:{_version_name(name)}"
+    try:
+        return cache.incr(key)
+    except ValueError:  # not set yet, or evicted
+        cache.add(key, _initial_version(), VERSION_TIMEOUT)
+        return cache.get(key)
+
+
+def versioned_key(names, *parts):
+    """Build a cache key embedding the current versions of ``names``"""
+    return ":".join(str(part) for part in (version_stamp(names), *parts))
+
+
+def cached_stream(key, stream, content_type, timeout):
+    """
+    Serve the bytes cached under ``key``, or stream ``stream()`` (an iterable
+    of str chunks) to the client while collecting it, and its precompressed
+    variants, for the cache.
+    """
+    entry = cache.get(key)
+    if isinstance(entry, dict):
+        response = HttpResponse(entry["content"], content_type=content_type)
+        response.precompressed = entry["encoded"]
+        return response
+
+    def tee():
+        chunks = []
+        for chunk in stream():
+            chunk = chunk.encode()
+            chunks.append(chunk)
+            yield chunk
+        content = b"".join(chunks)
+        cache.set(key, {"content": content, "encoded": precompress(content)}, timeout)
+
+    return StreamingHttpResponse(tee(), content_type=content_type)
+
+
+def version_stamp(names):
+    """String identifying the current versions of ``names``"""
+    return ",".join(f"{_version_name(name)}={version}" for name, version in get_versions(names).items())
+
+
+def response_cache_key(request, language):
+    """Key of a cached API response: a digest of the path, canonical query string and language"""
+    query = urlencode(sorted((key, value) for key in request.GET for value in request.GET.getlist(key)))
+    digest = hashlib.sha256(f"{request.path}?{query}".encode()).hexdigest()
+    return f"response:{language}:{digest}"
+
+
+def _build_response(entry):
+    response = HttpResponse(entry["content"], content_type=entry["content_type"])
+    patch_vary_headers(response, ("Accept",))
+    response.precompressed = entry.get("encoded", {})
+    return response
+
+
+def _wait_for_entry(key, lock_key, stamp):
+    """Poll for the entry another worker is rendering, until it appears or the lock is gone"""
+    deadline = time.monotonic() + settings.API_CACHE_LOCK_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(0.05)
+        entry = cache.get(key)
+        if entry is not None and entry["stamp"] == stamp:
+            return entry
+        if cache.get(lock_key) is None:
+            break
+    return None
+
+
+def cached_response(key, stamp, render):
+    """
+    Stale-while-revalidate response cache.
+
+    An entry is fresh for ``API_CACHE_SOFT_TIMEOUT`` seconds and while
+    ``stamp`` (the data versions it was rendered from) is current; it is kept
+    for ``API_CACHE_TIMEOUT`` seconds. Once it is stale, the request that
+    takes the ``cache.add`` lock re-renders it with ``render()`` while every
+    other request keeps getting the stale copy. Without any copy, the others
+    wait briefly for the lock holder, then render themselves, so a lock holder
+    that fails or dies costs latency but never an error. A re-render that
+    finds the object gone (404/410) evicts the entry instead.
+    """
+    entry = cache.get(key)
+    if entry is not None and entry["stamp"] == stamp and entry["fresh_until"] > time.time():
+        return _build_response(entry)
+
+    lock_key = f"lock:{key}"
+    if cache.add(lock_key, 1, settings.API_CACHE_LOCK_TIMEOUT):
+        try:
+            return _store_response(key, stamp, render())
+        finally:
+            cache.delete(lock_key)
+
+    if entry is not None:
+        return _build_response(entry)
+    entry = _wait_for_entry(key, lock_key, stamp)
+    if entry is not None:
+        return _build_response(entry)
+    return render()
+
+
+def _store_response(key, stamp, response):
+    if response.status_code in (404, 410):
+        # Gone: the stale copy must not be served to anyone while the lock is held
+        cache.delete(key)
+    elif response.status_code == 200:
+        if hasattr(response, "render"):
+            response.render()
+        entry = {
+            "stamp": stamp,
+            "fresh_until": time.time() + settings.API_CACHE_SOFT_TIMEOUT,
+            "content_type": response["Content-Type"],
+            "content": response.content,
+            "encoded": precompress(response.content),
+        }
+        cache.set(key, entry, settings.API_CACHE_TIMEOUT)
+        response.precompressed = entry["encoded"]
+    return response
@@ -0,0 +1,140 @@
+"""
+HTTP response compression.
+
+``CompressionMiddleware`` encodes the responses under ``STATELESS_PATHS``
+with brotli or gzip, whichever the client's ``Accept-Encoding`` prefers,
+once the body reaches ``COMPRESSION_MIN_SIZE`` bytes. Cached responses are
+encoded once when they are stored (``precompress``) at a higher level than a
+live response could afford, and a cache hit hands the stored bytes over as
+``response.precompressed`` so it costs no compression at all.
+"""
+import gzip
+import re
+import zlib
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+
+from .middleware import stateless
+
+try:
+    import brotli
+except ImportError:  # gzip only without the optional dependency
+    brotli = None
+
+# (live, stored) compression levels; stored bodies are compressed once and served many times
+GZIP_LEVELS = (6, 9)
+BROTLI_QUALITIES = (5, 9)
+
+COMPRESSIBLE_TYPES = re.compile(r"^(text/|application/([\w.+-]*\+)?(json|xml|javascript)\b)")
+
+
+def _encoders():
+    """``{encoding: (live, stored)}`` in server preference order"""
+    encoders = {}
+    if brotli is not None:
+        encoders["br"] = tuple(
+            lambda data, quality=quality: brotli.compress(data, quality=quality) for quality in BROTLI_QUALITIES
+        )
+    encoders["gzip"] = tuple(
+        lambda data, level=level: gzip.compress(data, compresslevel=level, mtime=0) for level in GZIP_LEVELS
+    )
+    return encoders
+
+
+ENCODERS = _encoders()
+
+
+def negotiate(accept_encoding):
+    """The encoding in ``ENCODERS`` the ``Accept-Encoding`` header prefers, or None"""
+    weights, default = {}, 0.0
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        weight = 1.0
+        match = re.search(r"q=([0-9.]+)", params)
+        if match:
+            try:
+                weight = float(match.group(1))
+            except ValueError:
+                continue
+        if coding == "*":
+            default = weight
+        else:
+            weights[coding] = weight
+    candidates = [(weights.get(coding, default), coding) for coding in ENCODERS]
+    # max() keeps the first of equal weights, i.e. the server preference
+    weight, coding = max(candidates, key=lambda candidate: candidate[0])
+    return coding if weight > 0 else None
+
+
+def compressible(response):
+    return (
+        not response.has_header("Content-Encoding")
+        and bool(COMPRESSIBLE_TYPES.match(response.get("Content-Type", "")))
+    )
+
+
+def precompress(content):
+    """``{encoding: bytes}`` of ``content`` for the cache, keeping only encodings that make it smaller"""
+    if len(content) < settings.COMPRESSION_MIN_SIZE:
+        return {}
+    variants = {}
+    for coding, (_, stored) in ENCODERS.items():
+        encoded = stored(content)
+        if len(encoded) < len(content):
+            variants[coding] = encoded
+    return variants
+
+
+def _stream(coding, chunks):
+    if coding == "br":
+        compressor = brotli.Compressor(quality=BROTLI_QUALITIES[0])
+        for chunk in chunks:
+            # flush() so every chunk reaches the client as soon as it is produced
+            yield compressor.process(chunk) + compressor.flush()
+        yield compressor.finish()
+    else:
+        compressor = zlib.compressobj(GZIP_LEVELS[0], zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        for chunk in chunks:
+            yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        yield compressor.flush()
+
+
+class CompressionMiddleware:
+    """Brotli/gzip compression of API, sitemap and feed responses"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if not stateless(request) or not compressible(response):
+            return response
+        patch_vary_headers(response, ("Accept-Encoding",))
+        coding = negotiate(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if coding is None:
+            return response
+
+        if response.streaming:
+            response.streaming_content = _stream(coding, response.streaming_content)
+            del response["Content-Length"]
+        else:
+            encoded = getattr(response, "precompressed", {}).get(coding)
+            if encoded is None:
+                if len(response.content) < settings.COMPRESSION_MIN_SIZE:
+                    return response
+                encoded = ENCODERS[coding][0](response.content)
+                if len(encoded) >= len(response.content):
+                    return response
+            response.content = encoded
+            response["Content-Length"] = str(len(encoded))
+
+        # The encoded body is no longer byte-for-byte what a strong ETag promised
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response["ETag"] = "W/" + etag
+        response["Content-Encoding"] = coding
+        return response
@@ -0,0 +1,97 @@
+"""
+Published blog post counts per month, category and tag.
+
+``BlogPostCount`` holds one row per non-empty bucket. Signal receivers call
+``refresh_counts`` with just the buckets a change can affect, which recounts
+those buckets through the indexes and upserts the results, so the archive
+and taxonomy endpoints read a handful of rows instead of grouping the posts
+table on every request.
+"""
+from datetime import date
+
+from django.db import transaction
+from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models.functions import TruncMonth
+
+from .models import BlogPost, BlogPostCount
+
+MONTH, CATEGORY, TAG = "month", "category", "tag"
+
+
+def month_key(value):
+    """Bucket key of a date: YYYYMM"""
+    return value.year * 100 + value.month
+
+
+def _month_range(key):
+    year, month = divmod(key, 100)
+    end = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+    return Q(date__gte=date(year, month, 1), date__lt=end)
+
+
+def _count_months(keys):
+    condition = Q()
+    for key in keys:
+        condition |= _month_range(key)
+    rows = (
+        BlogPost.objects.filter(condition, status="published")
+        .annotate(month=TruncMonth("date")).values_list("month").annotate(count=Count("*")).order_by()
+    )
+    return {month_key(month): count for month, count in rows}
+
+
+def _count_links(through, column, keys):
+    rows = (
+        through.objects.filter(**{f"{column}__in": keys}, blogpost__status="published")
+        .values_list(column).annotate(count=Count("*")).order_by()
+    )
+    return dict(rows)
+
+
+def _count(kind, keys):
+    if kind == MONTH:
+        return _count_months(keys)
+    if kind == CATEGORY:
+        return _count_links(BlogPost.categories.through, "category_id", keys)
+    return _count_links(BlogPost.tags.through, "tag_id", keys)
+
+
+def refresh_counts(kind, keys):
+    """Recount the ``kind`` buckets ``keys``; empty buckets are removed"""
+    keys = {key for key in keys if key is not None}
+    if not keys:
+        return
+    counts = _count(kind, keys)
+    with transaction.atomic():
+        BlogPostCount.objects.filter(kind=kind, key__in=keys - counts.keys()).delete()
+        BlogPostCount.objects.bulk_create(
+            [BlogPostCount(kind=kind, key=key, count=count) for key, count in counts.items()],
+            update_conflicts=True, unique_fields=["kind", "key"], update_fields=["count"],
+        )
+
+
+def refresh_post_counts(months=(), category_ids=(), tag_ids=()):
+    refresh_counts(MONTH, months)
+    refresh_counts(CATEGORY, category_ids)
+    refresh_counts(TAG, tag_ids)
+
+
+def rebuild_counts():
+    """Recount every bucket from scratch"""
+    with transaction.atomic():
+        BlogPostCount.objects.all().delete()
+        months = BlogPost.objects.filter(status="published").dates("date", "month")
+        refresh_counts(MONTH, {month_key(month) for month in months})
+        refresh_counts(CATEGORY, BlogPost.categories.through.objects.values_list("category_id", flat=True).distinct())
+        refresh_counts(TAG, BlogPost.tags.through.objects.values_list("tag_id", flat=True).distinct())
+
+
+def counts(kind):
+    """``{key: count}`` of the non-empty ``kind`` buckets"""
+    return dict(BlogPostCount.objects.filter(kind=kind).values_list("key", "count"))
+
+
+def with_counts(queryset, kind):
+    """Category/Tag ``queryset`` limited to non-empty buckets and annotated with ``post_count``"""
+    count = BlogPostCount.objects.filter(kind=kind, key=OuterRef("pk")).values("count")
+    return queryset.annotate(post_count=Subquery(count)).filter(post_count__gt=0)
@@ -0,0 +1,197 @@
+"""
+Streaming CSV/XLSX exports.
+
+Rows come from ``values_list().iterator(chunk_size=...)`` (a server-side
+cursor on Postgres) and are written to the response as they are read, so
+memory stays constant regardless of the table size. The XLSX workbook is a
+zip written to an unseekable stream, with inline strings instead of a shared
+string table that would need every value up front.
+"""
+import csv
+import re
+import zipfile
+from datetime import date, datetime
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from .models import ContactInquiry
+
+CONTACT_INQUIRY_COLUMNS = (
+    ("id", "ID"),
+    ("createdAt", "Created at"),
+    ("fullName", "Full name"),
+    ("email", "Email"),
+    ("phone", "Phone"),
+    ("company", "Company"),
+    ("subject", "Subject"),
+    ("status", "Status"),
+)
+
+# Characters spreadsheet applications treat as the start of a formula
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+# Control characters that are not allowed in XML 1.0
+ILLEGAL_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def filter_contact_inquiries(queryset, params):
+    """
+    Apply the ``status``, ``date_from`` and ``date_to`` (YYYY-MM-DD, on
+    ``createdAt``) filters from ``params``; raises ValueError on bad input.
+    """
+    status = params.get("status")
+    if status:
+        if status not in dict(ContactInquiry.STATUS_CHOICES):
+            raise ValueError(f"Unknown status: {status}")
+        queryset = queryset.filter(status=status)
+    for param, lookup in (("date_from", "createdAt__date__gte"), ("date_to", "createdAt__date__lte")):
+        value = params.get(param)
+        if value:
+            parsed = parse_date(value)
+            if parsed is None:
+                raise ValueError(f"{param} must be a date (YYYY-MM-DD)")
+            queryset = queryset.filter(**{lookup: parsed})
+    return queryset
+
+
+def export_rows(queryset, columns):
+    """Yield tuples of ``columns`` without loading the queryset into memory"""
+    fields = [field for field, _ in columns]
+    return queryset.values_list(*fields).iterator(chunk_size=settings.EXPORT_CHUNK_SIZE)
+
+
+def _cell_text(value):
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return timezone.localtime(value).strftime("%Y-%m-%d %H:%M:%S") if timezone.is_aware(value) else str(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def _safe_text(value):
+    text = _cell_text(value)
+    # Keep user-submitted values from being evaluated as formulas
+    return "'" + text if text.startswith(FORMULA_PREFIXES) else text
+
+
+class Echo:
+    """File-like object whose write() returns the data, for csv.writer"""
+
+    def write(self, value):
+        return value
+
+
+def stream_csv(rows, columns):
+    writer = csv.writer(Echo())
+    # BOM so spreadsheet applications detect UTF-8
+    yield "\ufeff" + writer.writerow([label for _, label in columns])
+    for row in rows:
+        yield writer.writerow([value if isinstance(value, int) else _safe_text(value) for value in row])
+
+
+class ZipStream:
+    """Unseekable write target for zipfile that hands out what was written so far"""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '</Types>'
+)
+XLSX_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{name}" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    '</Relationships>'
+)
+
+
+def _xlsx_row(values):
+    cells = []
+    for value in values:
+        if isinstance(value, int) and not isinstance(value, bool):
+            cells.append(f"<c><v>{value}</v></c>")
+        else:
+            text = escape(ILLEGAL_XML_CHARS.sub("", _cell_text(value)))
+            cells.append(f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>')
+    return f"<row>{''.join(cells)}</row>"
+
+
+def stream_xlsx(rows, columns, sheet_name="Export"):
+    stream = ZipStream()
+    with zipfile.ZipFile(stream, "w", compression=zipfile.ZIP_DEFLATED) as workbook:
+        workbook.writestr("[Content_Types].xml", XLSX_CONTENT_TYPES)
+        workbook.writestr("_rels/.rels", XLSX_ROOT_RELS)
+        workbook.writestr("xl/workbook.xml", XLSX_WORKBOOK.format(name=escape(sheet_name)))
+        workbook.writestr("xl/_rels/workbook.xml.rels", XLSX_WORKBOOK_RELS)
+        yield stream.drain()
+
+        with workbook.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as sheet:
+            sheet.write(
+                b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+            )
+            sheet.write(_xlsx_row([label for _, label in columns]).encode())
+            for index, row in enumerate(rows, 1):
+                sheet.write(_xlsx_row(row).encode())
+                if index % settings.EXPORT_CHUNK_SIZE == 0:
+                    yield stream.drain()
+            sheet.write(b"</sheetData></worksheet>")
+    yield stream.drain()
+
+
+EXPORT_FORMATS = {
+    "csv": (stream_csv, "text/csv; charset=utf-8"),
+    "xlsx": (stream_xlsx, "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+}
+
+
+def export_response(queryset, columns, export_format, filename):
+    """StreamingHttpResponse downloading ``queryset`` as ``export_format`` ("csv" or "xlsx")"""
+    writer, content_type = EXPORT_FORMATS[export_format]
+    response = StreamingHttpResponse(writer(export_rows(queryset, columns), columns), content_type=content_type)
+    response["Content-Disposition"] = f'attachment; filename="{filename}.{export_format}"'
+    return response
@@ -0,0 +1,63 @@
+"""
+Per-language RSS and Atom feeds of published blog posts, built from a
+``values()`` iterator with the translated columns resolved in SQL and cached
+until the next BlogPost change.
+"""
+from datetime import datetime, time, timezone
+
+from django.conf import settings
+from django.http import Http404
+from django.utils.feedgenerator import Atom1Feed, Rss201rev2Feed
+
+from .cache import cached_stream, versioned_key
+from .i18n import localized_expression
+from .models import BlogPost
+
+FEED_CLASSES = {"rss": Rss201rev2Feed, "atom": Atom1Feed}
+
+
+def blog_feed_rows(language):
+    """Latest published posts as dicts with ``title``, ``excerpt`` and slug in ``language``"""
+    queryset = (
+        BlogPost.objects.filter(status="published")
+        .order_by("-date", "-id")
+        .annotate(
+            feed_title=localized_expression(BlogPost, "title", language),
+            feed_excerpt=localized_expression(BlogPost, "excerpt", language),
+        )
+        .values("pk", f"slug_{language}", "date", "updatedAt", "feed_title", "feed_excerpt")
+    )
+    return queryset[:settings.FEED_ITEMS].iterator(chunk_size=settings.FEED_ITEMS)
+
+
+def blog_feed(request, language, kind):
+    """``feeds/blog/<language>/<rss|atom>.xml``"""
+    if kind not in FEED_CLASSES or language not in dict(settings.LANGUAGES):
+        raise Http404
+    feed_class = FEED_CLASSES[kind]
+    # Without the query string, so arbitrary ?... cannot grow the cache one entry per variant
+    feed_url = request.build_absolute_uri(request.path)
+    key = versioned_key((BlogPost,), "feed", kind, language, feed_url)
+    frontend_url = settings.FRONTEND_URL.rstrip("/")
+
+    def stream():
+        feed = feed_class(
+            title=settings.FEED_TITLE,
+            link=f"{frontend_url}/{language}/blog",
+            description=settings.FEED_DESCRIPTION,
+            language=language,
+            feed_url=feed_url,
+        )
+        for row in blog_feed_rows(language):
+            link = f"{frontend_url}/{language}/blog/{row[f'slug_{language}'] or row['pk']}"
+            feed.add_item(
+                title=row["feed_title"],
+                link=link,
+                description=row["feed_excerpt"],
+                unique_id=link,
+                pubdate=datetime.combine(row["date"], time.min, tzinfo=timezone.utc),
+                updateddate=row["updatedAt"],
+            )
+        yield feed.writeString("utf-8")
+
+    return cached_stream(key, stream, feed_class.content_type, settings.SYNDICATION_CACHE_TIMEOUT)
@@ -0,0 +1,74 @@
+import operator
+from functools import reduce
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.db.models.constants import LOOKUP_SEP
+from rest_framework import filters
+
+
+class ExistsSearchFilter(filters.SearchFilter):
+    """
+    SearchFilter that matches multi-valued relations (M2M and reverse FK)
+    through one correlated EXISTS per lookup.
+
+    Local columns are matched on the outer row directly, so the outer query
+    never joins the related tables and returns exactly one row per object
+    without DISTINCT over wide columns such as ``content``.
+    """
+
+    def get_relation_subquery(self, queryset, orm_lookup, term):
+        """Return an EXISTS expression for a lookup spanning a multi-valued relation, or None"""
+        opts = queryset.model._meta
+        relation_name, _, remote_lookup = orm_lookup.partition(LOOKUP_SEP)
+        try:
+            field = opts.get_field(relation_name)
+        except FieldDoesNotExist:
+            return None
+        if not (field.many_to_many or field.one_to_many) or not remote_lookup:
+            return None
+
+        if field.auto_created and not field.concrete:
+            # Reverse relation, e.g. Service.service_features -> ServiceFeature.service
+            back_reference = field.field.name
+        else:
+            # Forward M2M, e.g. BlogPost.categories -> Category.blog_posts
+            back_reference = field.related_query_name()
+
+        related = field.related_model._default_manager.filter(
+            **{back_reference: models.OuterRef("pk"), remote_lookup: term}
+        )
+        return models.Exists(related)
+
+    def build_condition(self, queryset, orm_lookup, term):
+        """Build the condition matching a single term against a single lookup"""
+        subquery = self.get_relation_subquery(queryset, orm_lookup, term)
+        if subquery is not None:
+            return models.Q(subquery)
+        if self.must_call_distinct(queryset, [orm_lookup.rsplit(LOOKUP_SEP, 1)[0]]):
+            # Deeper multi-valued path (fk__m2m__name): correlate on our own pk
+            matches = queryset.model._default_manager.filter(
+                pk=models.OuterRef("pk"), **{orm_lookup: term}
+            )
+            return models.Q(models.Exists(matches))
+        return models.Q(**{orm_lookup: term})
+
+    def filter_queryset(self, request, queryset, view):
+        search_fields = self.get_search_fields(view, request)
+        search_terms = self.get_search_terms(request)
+
+        if not search_fields or not search_terms:
+            return queryset
+
+        orm_lookups = [
+            self.construct_search(str(search_field), queryset)
+            for search_field in search_fields
+        ]
+
+        conditions = (
+            reduce(
+                operator.or_,
+                (self.build_condition(queryset, orm_lookup, term) for orm_lookup in orm_lookups)
+            ) for term in search_terms
+        )
+        return queryset.filter(reduce(operator.and_, conditions))
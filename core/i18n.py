@@ -0,0 +1,99 @@
+from django.db import models
+from django.db.models import Prefetch, Value
+from django.db.models.functions import Coalesce, NullIf
+from django.utils import translation
+from modeltranslation.settings import AVAILABLE_LANGUAGES
+from modeltranslation.translator import NotRegistered, translator
+from modeltranslation.utils import build_localized_fieldname, get_language, resolution_order
+
+# ``?lang=all`` asks read endpoints for every translation of translated fields
+LANGUAGE_PARAM = "lang"
+ALL_LANGUAGES = "all"
+
+
+def wants_all_languages(request):
+    """Return True if ``request`` asks for every translation at once"""
+    return request is not None and request.query_params.get(LANGUAGE_PARAM) == ALL_LANGUAGES
+
+
+def get_translated_fields(model):
+    """Return the names of the fields registered for translation on ``model``"""
+    try:
+        return tuple(translator.get_options_for_model(model).fields)
+    except NotRegistered:
+        return ()
+
+
+def inactive_translation_columns(model, language=None):
+    """
+    Return the translation columns of ``model`` that are never read when
+    rendering ``language``: the original (untranslated) columns and every
+    language outside the active language's fallback chain.
+    """
+    language = language or get_language()
+    columns = []
+    for field_name in get_translated_fields(model):
+        readable = resolution_order(language, getattr(model, field_name).fallback_languages)
+        columns.append(field_name)
+        columns.extend(
+            build_localized_fieldname(field_name, lang)
+            for lang in AVAILABLE_LANGUAGES
+            if lang not in readable
+        )
+    return columns
+
+
+def localized_expression(model, field_name, language=None):
+    """
+    Database expression reading translated ``field_name`` of ``model`` the way
+    the translation descriptor does: the first non-empty value along the
+    language's fallback chain, else an empty string.
+    """
+    language = language or get_language()
+    order = resolution_order(language, getattr(model, field_name).fallback_languages)
+    columns = [NullIf(build_localized_fieldname(field_name, lang), Value("")) for lang in order]
+    return Coalesce(*columns, Value(""), output_field=models.TextField())
+
+
+def defer_inactive_translations(queryset, language=None):
+    """
+    Restrict ``queryset`` (and its plain prefetches of translated models) to
+    the columns needed for ``language`` and its fallbacks.
+    """
+    model = queryset.model
+    columns = inactive_translation_columns(model, language)
+    if columns:
+        # MultilingualQuerySet.defer() expands an original field name to all of
+        # its translations, so go through the base implementation to defer
+        # exactly these columns.
+        queryset = models.QuerySet.defer(queryset, *columns)
+
+    lookups = []
+    for lookup in queryset._prefetch_related_lookups:
+        if isinstance(lookup, str) and "__" not in lookup:
+            related_model = model._meta.get_field(lookup).related_model
+            if get_translated_fields(related_model):
+                related = defer_inactive_translations(related_model._default_manager.all(), language)
+                lookup = Prefetch(lookup, queryset=related)
+        lookups.append(lookup)
+    if lookups:
+        queryset = queryset.prefetch_related(None).prefetch_related(*lookups)
+    return queryset
+
+
+def get_translations(instance, field_name):
+    """
+    Return ``{language: value}`` for a translated field, each value resolved
+    with the same fallbacks a request in that language would get.
+    """
+    values = {}
+    for language in AVAILABLE_LANGUAGES:
+        with translation.override(language):
+            values[language] = getattr(instance, field_name)
+    return values
+
+
+def get_list_translations(instances, field_name):
+    """Return ``{language: [value, ...]}`` of a translated field across ``instances``, as ``get_translations``"""
+    translations = [get_translations(instance, field_name) for instance in instances]
+    return {language: [values[language] for values in translations] for language in AVAILABLE_LANGUAGES}
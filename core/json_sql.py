@@ -0,0 +1,237 @@
+"""
+Database-side JSON assembly for hot list endpoints (Postgres).
+
+A ``DatabaseJSONSerializer`` compiles its ``serializer_class`` (a
+ModelSerializer) into one ``json_build_object`` per row, with nested
+reverse foreign keys as correlated ``array_to_json(ARRAY(...))`` subqueries,
+and has Postgres aggregate the rows of the (filtered, ordered) queryset into
+the finished JSON array. The view returns those bytes as they are: one query
+and no Python object per row.
+
+The payload equals the serializer's output as JSON (same keys in the same
+order, same values) but is spaced the way Postgres prints JSON. Whatever
+cannot be reproduced exactly in SQL makes ``render()`` return None so the
+caller can fall back: datetimes outside UTC, signed or otherwise
+non-prefix storage URLs, file names that would need URL quoting, and
+fields the serializer computes in Python (``SerializerMethodField``s
+without a ``get_<name>_sql()`` here).
+"""
+from datetime import timezone as dt_timezone
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connections, models
+from django.db.models import Case, ExpressionWrapper, F, Func, OuterRef, Q, Subquery, Value, When
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+from .i18n import get_translated_fields, localized_expression
+from .models import ServiceFeature, SocialLink
+from .serializers import (
+    FAQSerializer, ServiceFeatureSerializer, ServiceSerializer, SocialLinkSerializer, TeamMemberSerializer,
+)
+
+PLAIN_FIELDS = (serializers.CharField, serializers.IntegerField, serializers.BooleanField, serializers.ChoiceField)
+# Storage names joined to the storage's URL prefix unchanged (what filepath_to_uri and urljoin leave alone)
+URL_SAFE_NAME = r"^[A-Za-z0-9_-][A-Za-z0-9_.-]*(/[A-Za-z0-9_-][A-Za-z0-9_.-]*)*$"
+URL_PROBE = "probe/name.png"
+
+
+class Unsupported(Exception):
+    """The serializer output cannot be reproduced in SQL"""
+
+
+class JSONBuildObject(Func):
+    function = "json_build_object"
+    output_field = models.JSONField()
+
+    def __init__(self, pairs):
+        super().__init__(*(part for key, expression in pairs for part in (Value(key), expression)))
+
+
+class JSONBuildArray(Func):
+    function = "json_build_array"
+    output_field = models.JSONField()
+
+
+class JSONArray(Subquery):
+    """The subquery's single column as a JSON array, in the subquery's order"""
+    template = "array_to_json(ARRAY(%(subquery)s))"
+    output_field = models.JSONField()
+
+
+class JSONPairsObject(Subquery):
+    """JSON object from a subquery of ``json_build_array(key, value)`` rows, keys in the subquery's order"""
+    template = (
+        "(SELECT COALESCE(json_object_agg(item.pair->>0, item.pair->1 ORDER BY item.position), '{}') "
+        "FROM unnest(ARRAY(%(subquery)s)) WITH ORDINALITY AS item(pair, position))"
+    )
+    output_field = models.JSONField()
+
+
+class ISODateTime(Func):
+    """DRF's ISO 8601 form of a UTC timestamp column: ``Z`` suffix, microseconds only when non-zero"""
+    template = (
+        "to_char(%(expressions)s AT TIME ZONE 'UTC', 'YYYY-MM-DD\"T\"HH24:MI:SS') || "
+        "CASE WHEN to_char(%(expressions)s, 'US') = '000000' THEN '' ELSE '.' || to_char(%(expressions)s, 'US') END "
+        "|| 'Z'"
+    )
+    output_field = models.TextField()
+
+
+class ISODate(Func):
+    template = "to_char(%(expressions)s, 'YYYY-MM-DD')"
+    output_field = models.TextField()
+
+
+class DatabaseJSONSerializer:
+    """Compiles ``serializer_class``'s list representation into a single Postgres query"""
+    serializer_class = None
+    # {field name: DatabaseJSONSerializer of the reverse foreign key it renders}
+    nested = {}
+
+    def __init__(self, context=None):
+        self.context = context or {}
+        self.model = self.serializer_class.Meta.model
+        # Boolean expressions that must all hold for the output to be exact
+        self.checks = []
+        try:
+            self.pairs = self._compile(self.serializer_class(context=self.context))
+        except Unsupported:
+            self.pairs = None
+
+    def _compile(self, serializer):
+        translated = get_translated_fields(self.model)
+        pairs = []
+        for name, field in serializer.fields.items():
+            if name in self.nested:
+                relation = self.model._meta.get_field(field.source)
+                child = self.nested[name](self.context)
+                if child.pairs is None or child.checks:
+                    raise Unsupported(name)
+                pairs.append((name, JSONArray(child.related_rows(relation))))
+            elif isinstance(field, serializers.SerializerMethodField):
+                method = getattr(self, f"get_{name}_sql", None)
+                if method is None:
+                    raise Unsupported(name)
+                pairs.append((name, method()))
+            else:
+                pairs.append((name, self._field_expression(field, translated)))
+        return pairs
+
+    def _field_expression(self, field, translated):
+        source = field.source
+        display = source.startswith("get_") and source.endswith("_display")
+        if display:
+            source = source[len("get_"):-len("_display")]
+        try:
+            model_field = self.model._meta.get_field(source)
+        except FieldDoesNotExist:
+            raise Unsupported(source)
+
+        if display:
+            choices = model_field.flatchoices
+            return Case(
+                *(When(**{model_field.attname: value}, then=Value(str(label))) for value, label in choices),
+                default=F(model_field.attname),
+            )
+        if source in translated:
+            return localized_expression(self.model, source)
+        column = F(model_field.attname)
+        if isinstance(model_field, models.FileField):
+            return self._file_expression(model_field)
+        if isinstance(field, PLAIN_FIELDS):
+            return column
+        if isinstance(field, serializers.DateTimeField):
+            output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+            field_timezone = field.timezone if hasattr(field, "timezone") else field.default_timezone()
+            if output_format is None or output_format.lower() != ISO_8601 or not _is_utc(field_timezone):
+                raise Unsupported(source)
+            return ISODateTime(column)
+        if isinstance(field, serializers.DateField):
+            output_format = getattr(field, "format", api_settings.DATE_FORMAT)
+            if output_format is None or output_format.lower() != ISO_8601:
+                raise Unsupported(source)
+            return ISODate(column)
+        raise Unsupported(source)
+
+    def _file_expression(self, model_field):
+        probe = model_field.storage.url(URL_PROBE)
+        if not probe.endswith(URL_PROBE):
+            raise Unsupported(model_field.name)
+        prefix = probe[:-len(URL_PROBE)]
+        request = self.context.get("request")
+        if request is not None:
+            prefix = request.build_absolute_uri(prefix)
+        attname = model_field.attname
+        self.checks.append(Q(**{attname: ""}) | Q(**{f"{attname}__regex": URL_SAFE_NAME}))
+        return Case(
+            When(**{attname: ""}, then=Value(None, output_field=models.TextField())),
+            default=Func(Value(prefix), F(attname), function="concat", output_field=models.TextField()),
+        )
+
+    def related_rows(self, relation):
+        """Rows of the reverse foreign key ``relation`` belonging to the outer row, as JSON objects"""
+        return (
+            relation.related_model._default_manager.filter(**{relation.field.attname: OuterRef("pk")})
+            .annotate(v_json=JSONBuildObject(self.pairs))
+            .values("v_json")
+        )
+
+    def render(self, queryset):
+        """The JSON list of ``queryset`` as bytes, or None if it cannot be built in SQL"""
+        # The database the router reads the queryset from, which may be a replica
+        connection = connections[queryset.db]
+        if self.pairs is None or connection.vendor != "postgresql" or queryset.query.distinct:
+            return None
+        exact = ExpressionWrapper(Q(*self.checks), output_field=models.BooleanField()) if self.checks else Value(True)
+        rows = (
+            queryset.prefetch_related(None)
+            .annotate(v_item=JSONBuildArray(JSONBuildObject(self.pairs), exact))
+            .values_list("v_item")
+        )
+        sql, params = rows.query.get_compiler(connection=connection).as_sql()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT COALESCE(array_to_json(array_agg(item.pair->0 ORDER BY item.position)), '[]')::text, "
+                f"COALESCE(bool_and((item.pair->>1)::boolean), true) "
+                f"FROM unnest(ARRAY({sql})) WITH ORDINALITY AS item(pair, position)",
+                params,
+            )
+            payload, exact = cursor.fetchone()
+        return payload.encode() if exact else None
+
+
+def _is_utc(tz):
+    return tz is dt_timezone.utc or getattr(tz, "key", None) in ("UTC", "Etc/UTC")
+
+
+class ServiceFeatureDatabaseJSONSerializer(DatabaseJSONSerializer):
+    serializer_class = ServiceFeatureSerializer
+
+
+class SocialLinkDatabaseJSONSerializer(DatabaseJSONSerializer):
+    serializer_class = SocialLinkSerializer
+
+
+class ServiceDatabaseJSONSerializer(DatabaseJSONSerializer):
+    serializer_class = ServiceSerializer
+    nested = {"features": ServiceFeatureDatabaseJSONSerializer}
+
+    def get_features_list_sql(self):
+        return JSONArray(ServiceFeature.objects.filter(service=OuterRef("pk")).values("name"))
+
+
+class TeamMemberDatabaseJSONSerializer(DatabaseJSONSerializer):
+    serializer_class = TeamMemberSerializer
+    nested = {"social_links": SocialLinkDatabaseJSONSerializer}
+
+    def get_social_sql(self):
+        return JSONPairsObject(
+            SocialLink.objects.filter(team_member=OuterRef("pk"))
+            .annotate(v_pair=JSONBuildArray(F("platform"), F("url")))
+            .values("v_pair")
+        )
+
+
+class FAQDatabaseJSONSerializer(DatabaseJSONSerializer):
+    serializer_class = FAQSerializer
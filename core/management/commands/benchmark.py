@@ -0,0 +1,135 @@
+import time
+from io import BytesIO
+
+from django.core.management.base import BaseCommand
+from django.test import Client, override_settings
+from django.utils import translation
+from rest_framework import filters
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from core.filters import ExistsSearchFilter
+from core.i18n import defer_inactive_translations
+from core.management.commands.warm_cache import default_host
+from core.renderers import ORJSONParser, ORJSONRenderer
+from core.views import (
+    BlogPostViewSet, FAQViewSet, PortfolioItemViewSet, ServiceViewSet, TeamMemberViewSet, TestimonialViewSet,
+)
+
+
+class Command(BaseCommand):
+    help = "Compare timings (and query plans) of performance-sensitive code paths against the current database"
+
+    scenarios = {
+        "json": "bench_json",
+        "middleware": "bench_middleware",
+        "search": "bench_search",
+        "translations": "bench_translations",
+        "values": "bench_values",
+    }
+
+    def add_arguments(self, parser):
+        parser.add_argument("scenario", choices=sorted(self.scenarios))
+        parser.add_argument("--repeat", type=int, default=20, help="Iterations per measurement")
+        parser.add_argument("--term", default="a", help="Search term for the search scenario")
+        parser.add_argument("--language", default="az",
+                            help="Active language for the translations and values scenarios")
+        parser.add_argument("--explain", action="store_true", help="Print EXPLAIN ANALYZE output")
+
+    def handle(self, *args, **options):
+        getattr(self, self.scenarios[options["scenario"]])(options)
+
+    def measure(self, func, repeat):
+        """Return the mean wall time of ``func`` in milliseconds"""
+        func()  # warm-up
+        started = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        return (time.perf_counter() - started) * 1000 / repeat
+
+    def report(self, name, variant, millis, extra=""):
+        self.stdout.write(f"{name:<16} {variant:<13} {millis:>9.2f} ms  {extra}")
+
+    def bench_search(self, options):
+        """JOIN-based DRF search vs. correlated EXISTS search"""
+        request = Request(APIRequestFactory().get("/", {"search": options["term"]}))
+        backends = (("join", filters.SearchFilter()), ("exists", ExistsSearchFilter()))
+
+        for viewset in (BlogPostViewSet, PortfolioItemViewSet, ServiceViewSet, TeamMemberViewSet):
+            view = viewset(request=request, format_kwarg=None, action="list")
+            base = view.get_queryset()
+            for label, backend in backends:
+                queryset = backend.filter_queryset(request, base, view)
+                millis = self.measure(lambda: list(queryset.values_list("pk", flat=True)), options["repeat"])
+                self.report(viewset.__name__.replace("ViewSet", ""), label, millis, f"rows={queryset.count()}")
+                if options["explain"]:
+                    self.stdout.write(queryset.explain(analyze=True))
+                    self.stdout.write("")
+
+    def bench_translations(self, options):
+        """All translation columns vs. only those readable in the active language"""
+        viewsets = (BlogPostViewSet, PortfolioItemViewSet, ServiceViewSet, TeamMemberViewSet)
+        with translation.override(options["language"]):
+            for viewset in viewsets:
+                base = viewset.queryset.all()
+                for label, queryset in (("all", base), ("projected", defer_inactive_translations(base))):
+                    millis = self.measure(lambda: list(queryset.all()), options["repeat"])
+                    self.report(viewset.__name__.replace("ViewSet", ""), label, millis)
+
+    def bench_json(self, options):
+        """DRF's stdlib JSON renderer/parser vs. the orjson ones, on the list endpoints' serialized data"""
+        request = Request(APIRequestFactory().get("/"))
+        for viewset in (BlogPostViewSet, PortfolioItemViewSet, ServiceViewSet, TeamMemberViewSet):
+            view = viewset(request=request, format_kwarg=None, action="list")
+            data = view.get_serializer(view.get_queryset(), many=True).data
+            name = viewset.__name__.replace("ViewSet", "")
+            body = JSONRenderer().render(data)
+            for label, renderer in (("stdlib", JSONRenderer()), ("orjson", ORJSONRenderer())):
+                millis = self.measure(lambda: renderer.render(data), options["repeat"])
+                rendered = renderer.render(data)
+                self.report(name, f"render/{label}", millis, f"bytes={len(rendered)} identical={rendered == body}")
+            for label, parser in (("stdlib", JSONParser()), ("orjson", ORJSONParser())):
+                millis = self.measure(lambda: parser.parse(BytesIO(body)), options["repeat"])
+                self.report(name, f"parse/{label}", millis)
+
+    def bench_values(self, options):
+        """
+        ModelSerializer lists vs. the values()-based ValuesSerializer vs. JSON
+        assembled by Postgres, from query to rendered bytes
+        """
+        # Image URLs are built against the request host
+        request = Request(APIRequestFactory().get("/", HTTP_HOST=default_host()))
+        with translation.override(options["language"]):
+            for viewset in (ServiceViewSet, TeamMemberViewSet, TestimonialViewSet, FAQViewSet):
+                view = viewset(request=request, format_kwarg=None, action="list")
+                queryset = view.filter_queryset(view.get_queryset())
+                context = view.get_serializer_context()
+                render = JSONRenderer().render
+                variants = [
+                    ("serializer", lambda: render(view.get_serializer(queryset.all(), many=True).data)),
+                    ("values", lambda: render(view.values_serializer_class(context=context).serialize(queryset))),
+                ]
+                if getattr(view, "json_serializer_class", None) is not None:
+                    variants.append(("database", lambda: view.json_serializer_class(context=context).render(queryset)))
+                for label, func in variants:
+                    millis = self.measure(func, options["repeat"])
+                    self.report(viewset.__name__.replace("ViewSet", ""), label, millis, f"rows={queryset.count()}")
+
+    def bench_middleware(self, options):
+        """
+        Per-request latency of API and sitemap requests through the full
+        middleware stack vs. the lean one, responses served from the cache
+        """
+        paths = ("/api/faqs/", "/api/header-nav-links/", "/api/services/", "/sitemap.xml")
+        stacks = (("full", ()), ("lean", None))
+        for path in paths:
+            for label, lean_paths in stacks:
+                # The client sends no Accept-Encoding, so neither stack compresses
+                overrides = {} if lean_paths is None else {"STATELESS_PATHS": lean_paths}
+                # The handler, and with it the middleware chain, is built per client under the overrides
+                with override_settings(**overrides):
+                    client = Client(HTTP_HOST=default_host())
+                    millis = self.measure(lambda: client.get(path), options["repeat"])
+                self.report(path, label, millis)
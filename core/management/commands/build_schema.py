@@ -0,0 +1,30 @@
+import shutil
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.schema import RENDERERS, code_version, generate_schema, schema_path, write_schema
+
+
+class Command(BaseCommand):
+    help = "Prebuild the OpenAPI schema for every language and format for the current code version"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--force", action="store_true", help="Rebuild even if artifacts for this version exist")
+
+    def handle(self, *args, **options):
+        version = code_version()
+        built = 0
+        for language, _ in settings.LANGUAGES:
+            for kind in RENDERERS:
+                if not options["force"] and schema_path(language, kind).exists():
+                    continue
+                write_schema(language, kind, generate_schema(language, kind))
+                built += 1
+
+        # Artifacts of older code versions are never served again
+        for path in schema_path(settings.LANGUAGE_CODE, "yaml").parent.parent.iterdir():
+            if path.is_dir() and path.name != version:
+                shutil.rmtree(path, ignore_errors=True)
+
+        self.stdout.write(f"Schema version {version}: {built} artifact(s) built")
@@ -0,0 +1,91 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.test import Client
+from django.urls import reverse
+
+from core.models import PortfolioCategory
+from core.urls import router
+from core.views import CachedResponseMixin
+
+# Values for list actions whose URL takes an argument, by (basename, action)
+ACTION_ARGUMENTS = {
+    ("portfolio", "by_category"): lambda: {
+        "slug": PortfolioCategory.objects.filter(portfolio_category_items__isnull=False)
+        .distinct().values_list("slug", flat=True)
+    },
+}
+
+
+def warm_paths(details):
+    """API paths worth having cached: lists, list actions and the ``details`` first objects of each viewset"""
+    for _, viewset, basename in router.registry:
+        if not issubclass(viewset, CachedResponseMixin):
+            continue
+        yield reverse(f"{basename}-list")
+        recent = list(viewset.queryset.values_list("pk", flat=True)[:details])
+        for pk in recent:
+            yield reverse(f"{basename}-detail", args=[pk])
+        for action in viewset.get_extra_actions():
+            if "get" not in action.mapping:
+                continue
+            name = f"{basename}-{action.url_name}"
+            if action.detail:
+                for pk in recent:
+                    yield reverse(name, args=[pk])
+            elif (basename, action.__name__) in ACTION_ARGUMENTS:
+                for kwarg, values in ACTION_ARGUMENTS[basename, action.__name__]().items():
+                    for value in values:
+                        yield reverse(name, kwargs={kwarg: value})
+            elif "(?P<" not in action.url_path:
+                yield reverse(name)
+
+
+def default_host():
+    for host in settings.ALLOWED_HOSTS:
+        if host != "*":
+            return host.lstrip(".")
+    return "localhost"
+
+
+class Command(BaseCommand):
+    help = "Fill the API response cache in every language before the workers take traffic"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=settings.WARM_CACHE_WORKERS,
+                            help="Requests rendered concurrently")
+        parser.add_argument("--details", type=int, default=settings.WARM_CACHE_DETAILS,
+                            help="Detail pages (and their detail actions) warmed per viewset")
+        parser.add_argument("--host", default=default_host(), help="Host header sent with the requests")
+
+    def handle(self, *args, **options):
+        if isinstance(caches["default"], LocMemCache):
+            self.stderr.write("The cache is local to this process (no REDIS_URL); warming it has no effect.")
+            return
+        paths = list(dict.fromkeys(warm_paths(options["details"])))
+        jobs = [(path, language) for language, _ in settings.LANGUAGES for path in paths]
+
+        def fetch(job):
+            path, language = job
+            try:
+                response = Client().get(
+                    path, HTTP_HOST=options["host"], HTTP_ACCEPT="application/json", HTTP_ACCEPT_LANGUAGE=language,
+                )
+                return response.status_code
+            except Exception as exc:
+                self.stderr.write(f"{path} [{language}]: {exc}")
+                return None
+            finally:
+                connections.close_all()
+
+        with ThreadPoolExecutor(max_workers=max(1, options["workers"])) as executor:
+            statuses = list(executor.map(fetch, jobs))
+
+        warmed = statuses.count(200)
+        self.stdout.write(
+            f"Warmed {warmed} of {len(jobs)} responses ({len(paths)} paths x {len(settings.LANGUAGES)} languages)"
+        )
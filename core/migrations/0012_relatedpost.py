@@ -0,0 +1,52 @@
+# Generated by Django 5.0.6 on 2026-10-19 02:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_related_posts(apps, schema_editor):
+    """Store every post's top 24 related posts (shared tags x2, categories x1), as core.related does"""
+    BlogPost = apps.get_model("core", "BlogPost")
+    RelatedPost = apps.get_model("core", "RelatedPost")
+    quote = schema_editor.quote_name
+    terms = (
+        f"SELECT blogpost_id, 't' || tag_id AS term, 2 AS weight FROM {quote(BlogPost.tags.through._meta.db_table)} "
+        f"UNION ALL SELECT blogpost_id, 'c' || category_id, 1 FROM {quote(BlogPost.categories.through._meta.db_table)}"
+    )
+    schema_editor.execute(
+        f"INSERT INTO {quote(RelatedPost._meta.db_table)} (post_id, related_id, score) "
+        f"SELECT post_id, related_id, score FROM ("
+        f"  SELECT a.blogpost_id AS post_id, b.blogpost_id AS related_id, SUM(a.weight) AS score,"
+        f"         ROW_NUMBER() OVER (PARTITION BY a.blogpost_id"
+        f"                            ORDER BY SUM(a.weight) DESC, b.blogpost_id DESC) AS position"
+        f"  FROM ({terms}) a JOIN ({terms}) b ON a.term = b.term AND a.blogpost_id <> b.blogpost_id"
+        f"  GROUP BY a.blogpost_id, b.blogpost_id"
+        f") ranked WHERE position <= 24"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_alter_blogpost_content_alter_blogpost_content_az_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RelatedPost',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.PositiveIntegerField()),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_posts', to='core.blogpost')),
+                ('related', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_by', to='core.blogpost')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['post', '-score', '-related'], name='related_post_score_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='relatedpost',
+            constraint=models.UniqueConstraint(fields=('post', 'related'), name='unique_related_post'),
+        ),
+        migrations.RunPython(backfill_related_posts, migrations.RunPython.noop),
+    ]
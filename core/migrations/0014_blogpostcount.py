@@ -0,0 +1,48 @@
+# Generated by Django 5.0.6 on 2026-10-19 02:55
+
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import TruncMonth
+
+
+def backfill_counts(apps, schema_editor):
+    """Count published posts per month (YYYYMM), category and tag"""
+    BlogPost = apps.get_model("core", "BlogPost")
+    BlogPostCount = apps.get_model("core", "BlogPostCount")
+    published = BlogPost.objects.filter(status="published")
+    months = published.annotate(month=TruncMonth("date")).values_list("month").annotate(count=Count("*")).order_by()
+    rows = [BlogPostCount(kind="month", key=month.year * 100 + month.month, count=count) for month, count in months]
+    for kind, through, column in (
+        ("category", BlogPost.categories.through, "category_id"),
+        ("tag", BlogPost.tags.through, "tag_id"),
+    ):
+        links = (
+            through.objects.filter(blogpost__status="published")
+            .values_list(column).annotate(count=Count("*")).order_by()
+        )
+        rows.extend(BlogPostCount(kind=kind, key=key, count=count) for key, count in links)
+    BlogPostCount.objects.bulk_create(rows)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_blogpost_status_order_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BlogPostCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('month', 'Month'), ('category', 'Category'), ('tag', 'Tag')], max_length=10)),
+                ('key', models.PositiveIntegerField()),
+                ('count', models.PositiveIntegerField()),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='blogpostcount',
+            constraint=models.UniqueConstraint(fields=('kind', 'key'), name='unique_blogpost_count'),
+        ),
+        migrations.RunPython(backfill_counts, migrations.RunPython.noop),
+    ]
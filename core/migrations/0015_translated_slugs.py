@@ -0,0 +1,139 @@
+# Generated by Django 5.0.6 on 2026-10-19 02:58
+
+from django.conf import settings
+from django.db import migrations, models
+from django.utils.text import slugify
+
+LANGUAGES = ("en", "az", "ru")
+
+
+def backfill_slugs(apps, schema_editor):
+    """Give existing rows a unique slug per language from that language's title (else the English one)"""
+    for model_name in ("BlogPost", "PortfolioItem", "Service"):
+        model = apps.get_model("core", model_name)
+        fields = ["pk"] + [f"title_{language}" for language in LANGUAGES]
+        taken = {language: set() for language in LANGUAGES}
+        updated = []
+        for row in model.objects.order_by("pk").values(*fields).iterator(chunk_size=2000):
+            obj = model(pk=row["pk"])
+            for language in LANGUAGES:
+                value = row[f"title_{language}"] or row["title_en"] or ""
+                base = slugify(value, allow_unicode=True)[:250].strip("-") or model._meta.model_name
+                if base.isdigit():
+                    base = f"{model._meta.model_name}-{base}"
+                slug, suffix = base, 1
+                while slug in taken[language]:
+                    suffix += 1
+                    slug = f"{base}-{suffix}"
+                taken[language].add(slug)
+                setattr(obj, f"slug_{language}", slug)
+            updated.append(obj)
+        model.objects.bulk_update(updated, [f"slug_{language}" for language in LANGUAGES], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0014_blogpostcount'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='slug',
+            field=models.SlugField(allow_unicode=True, blank=True, db_index=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='slug_az',
+            field=models.SlugField(allow_unicode=True, blank=True, db_index=False, max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='slug_en',
+            field=models.SlugField(allow_unicode=True, blank=True, db_index=False, max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='slug_ru',
+            field=models.SlugField(allow_unicode=True, blank=True, db_index=False, max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name='portfolioitem',
+            name='slug',
+            field=models.SlugField(allow_unicode=True, blank=True, db_index=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='portfolioitem',
+            name='slug_az',
+            field=models.SlugField(allow_unicode=True, blank=True, db_index=False, max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name='portfolioitem',
+            name='slug_en',
+            field=models.SlugField(allow_unicode=True, blank=True, db_index=False, max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name='portfolioitem',
+            name='slug_ru',
+            field=models.SlugField(allow_unicode=True, blank=True, db_index=False, max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name='service',
+            name='slug',
+            field=models.SlugField(allow_unicode=True, blank=True, db_index=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='service',
+            name='slug_az',
+            field=models.SlugField(allow_unicode=True, blank=True, db_index=False, max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name='service',
+            name='slug_en',
+            field=models.SlugField(allow_unicode=True, blank=True, db_index=False, max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name='service',
+            name='slug_ru',
+            field=models.SlugField(allow_unicode=True, blank=True, db_index=False, max_length=255, null=True),
+        ),
+        migrations.RunPython(backfill_slugs, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='blogpost',
+            constraint=models.UniqueConstraint(condition=models.Q(('slug_en', ''), _negated=True), fields=('slug_en',), name='blogpost_slug_en_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='blogpost',
+            constraint=models.UniqueConstraint(condition=models.Q(('slug_az', ''), _negated=True), fields=('slug_az',), name='blogpost_slug_az_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='blogpost',
+            constraint=models.UniqueConstraint(condition=models.Q(('slug_ru', ''), _negated=True), fields=('slug_ru',), name='blogpost_slug_ru_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='portfolioitem',
+            constraint=models.UniqueConstraint(condition=models.Q(('slug_en', ''), _negated=True), fields=('slug_en',), name='portfolioitem_slug_en_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='portfolioitem',
+            constraint=models.UniqueConstraint(condition=models.Q(('slug_az', ''), _negated=True), fields=('slug_az',), name='portfolioitem_slug_az_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='portfolioitem',
+            constraint=models.UniqueConstraint(condition=models.Q(('slug_ru', ''), _negated=True), fields=('slug_ru',), name='portfolioitem_slug_ru_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='service',
+            constraint=models.UniqueConstraint(condition=models.Q(('slug_en', ''), _negated=True), fields=('slug_en',), name='service_slug_en_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='service',
+            constraint=models.UniqueConstraint(condition=models.Q(('slug_az', ''), _negated=True), fields=('slug_az',), name='service_slug_az_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='service',
+            constraint=models.UniqueConstraint(condition=models.Q(('slug_ru', ''), _negated=True), fields=('slug_ru',), name='service_slug_ru_unique'),
+        ),
+    ]
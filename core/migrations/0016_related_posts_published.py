@@ -0,0 +1,41 @@
+# Generated by Django 5.0.6 on 2026-10-19 03:40
+
+from django.db import migrations
+
+
+def rebuild_related_posts(apps, schema_editor):
+    """Re-rank every post's top 24 related posts among published posts only, as core.related does"""
+    BlogPost = apps.get_model("core", "BlogPost")
+    RelatedPost = apps.get_model("core", "RelatedPost")
+    quote = schema_editor.quote_name
+    terms = (
+        f"SELECT blogpost_id, 't' || tag_id AS term, 2 AS weight FROM {quote(BlogPost.tags.through._meta.db_table)} "
+        f"UNION ALL SELECT blogpost_id, 'c' || category_id, 1 FROM {quote(BlogPost.categories.through._meta.db_table)}"
+    )
+    candidates = (
+        f"SELECT links.blogpost_id, links.term, links.weight FROM ({terms}) links "
+        f"JOIN {quote(BlogPost._meta.db_table)} post ON post.id = links.blogpost_id AND post.status = 'published'"
+    )
+    table = quote(RelatedPost._meta.db_table)
+    schema_editor.execute(f"DELETE FROM {table}")
+    schema_editor.execute(
+        f"INSERT INTO {table} (post_id, related_id, score) "
+        f"SELECT post_id, related_id, score FROM ("
+        f"  SELECT a.blogpost_id AS post_id, b.blogpost_id AS related_id, SUM(a.weight) AS score,"
+        f"         ROW_NUMBER() OVER (PARTITION BY a.blogpost_id"
+        f"                            ORDER BY SUM(a.weight) DESC, b.blogpost_id DESC) AS position"
+        f"  FROM ({terms}) a JOIN ({candidates}) b ON a.term = b.term AND a.blogpost_id <> b.blogpost_id"
+        f"  GROUP BY a.blogpost_id, b.blogpost_id"
+        f") ranked WHERE position <= 24"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0015_translated_slugs'),
+    ]
+
+    operations = [
+        migrations.RunPython(rebuild_related_posts, migrations.RunPython.noop),
+    ]
@@ -1,9 +1,12 @@
 from django.conf import settings
 from django.db import models
+from django.db.models import Q
 from django.utils import timezone
 import uuid, os
 from ckeditor.fields import RichTextField
 
+from .slugs import fill_slugs, slug_columns
+
 
 class TimeStampedModel(models.Model):
     createdAt = models.DateTimeField(default=timezone.now, editable=False)
@@ -13,6 +16,26 @@ class TimeStampedModel(models.Model):
         abstract = True
 
 
+class TranslatedSlugMixin:
+    """Fills in missing per-language slugs from ``slug_source`` on save"""
+    slug_source = "title"
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        fill_slugs(self, self.slug_source)
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, *slug_columns()}
+        super().save(*args, **kwargs)
+
+
+def unique_slug_constraints(prefix):
+    """One unique index per slug language column, ignoring blanks"""
+    return [
+        models.UniqueConstraint(fields=[column], condition=~Q(**{column: ""}), name=f"{prefix}_{column}_unique")
+        for column in slug_columns()
+    ]
+
+
 class Tag(models.Model):
     """Model to represent tags for blog posts"""
     name = models.CharField(max_length=50, unique=True)
@@ -96,11 +119,12 @@ def blog_image_upload_to(instance, filename):
         unique_name = f"{uuid.uuid4().hex}{ext}"
         return f"blog_images/{unique_name}"
 
-class BlogPost(TimeStampedModel):
+class BlogPost(TranslatedSlugMixin, TimeStampedModel):
     """Blog post model with proper relationships"""
     STATUS_CHOICES = [("published", "Published"), ("draft", "Draft")]
     
     title = models.CharField(max_length=255)
+    slug = models.SlugField(max_length=255, blank=True, allow_unicode=True, db_index=False)
     excerpt = models.TextField(blank=True)
     content = RichTextField()
     date = models.DateField()
@@ -123,6 +147,10 @@ class BlogPost(TimeStampedModel):
     order = models.IntegerField(default=0)
     class Meta:
         ordering = ["-date", "-id"]
+        indexes = [
+            models.Index(fields=["status", "-date", "-id"], name="blogpost_status_order_idx"),
+        ]
+        constraints = unique_slug_constraints("blogpost")
 
     def __str__(self):
         return self.title
@@ -130,12 +158,47 @@ class BlogPost(TimeStampedModel):
     @property
     def tags_list(self):
         """Return list of tag names for backward compatibility"""
-        return list(self.tags.values_list('name', flat=True))
+        return [tag.name for tag in self.tags.all()]
     
     @property
     def categories_list(self):
         """Return list of category names for backward compatibility"""
-        return list(self.categories.values_list('name', flat=True))
+        return [category.name for category in self.categories.all()]
+
+
+class RelatedPost(models.Model):
+    """One of a blog post's top related posts by weighted tag/category overlap"""
+    post = models.ForeignKey(BlogPost, on_delete=models.CASCADE, related_name="related_posts")
+    related = models.ForeignKey(BlogPost, on_delete=models.CASCADE, related_name="related_by")
+    score = models.PositiveIntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["post", "related"], name="unique_related_post"),
+        ]
+        indexes = [
+            models.Index(fields=["post", "-score", "-related"], name="related_post_score_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.post_id} -> {self.related_id} ({self.score})"
+
+
+class BlogPostCount(models.Model):
+    """Number of published blog posts in a month (key YYYYMM), category or tag (key = pk)"""
+    KIND_CHOICES = [("month", "Month"), ("category", "Category"), ("tag", "Tag")]
+
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    key = models.PositiveIntegerField()
+    count = models.PositiveIntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["kind", "key"], name="unique_blogpost_count"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.key}: {self.count}"
 
 
 
@@ -162,9 +225,10 @@ def portfolio_image_upload_to(instance, filename):
         unique_name = f"{uuid.uuid4().hex}{ext}"
         return f"portfolio_images/{unique_name}"
 
-class PortfolioItem(TimeStampedModel):
+class PortfolioItem(TranslatedSlugMixin, TimeStampedModel):
     """Portfolio item model with proper relationships"""
     title = models.CharField(max_length=255)
+    slug = models.SlugField(max_length=255, blank=True, allow_unicode=True, db_index=False)
     description = models.TextField(blank=True)
 
 
@@ -182,6 +246,7 @@ class PortfolioItem(TimeStampedModel):
 
     class Meta:
         ordering = ["-completionDate", "id"]
+        constraints = unique_slug_constraints("portfolioitem")
 
     def __str__(self):
         return self.title
@@ -189,7 +254,7 @@ class PortfolioItem(TimeStampedModel):
     @property
     def technologies_list(self):
         """Return list of technology names for backward compatibility"""
-        return list(self.technologies.values_list('name', flat=True))
+        return [technology.name for technology in self.technologies.all()]
 
 
 def service_image_upload_to(instance, filename):
@@ -197,10 +262,11 @@ def service_image_upload_to(instance, filename):
         unique_name = f"{uuid.uuid4().hex}{ext}"
         return f"service_images/{unique_name}"
 
-class Service(TimeStampedModel):
+class Service(TranslatedSlugMixin, TimeStampedModel):
     """Service model with related features"""
     # id = models.CharField(primary_key=True, max_length=100)
     title = models.CharField(max_length=255)
+    slug = models.SlugField(max_length=255, blank=True, allow_unicode=True, db_index=False)
     description = models.TextField(blank=True)
     details = models.TextField(blank=True)
     image = models.ImageField(upload_to=service_image_upload_to, blank=True)
@@ -209,6 +275,7 @@ class Service(TimeStampedModel):
 
     class Meta:
         ordering = ["order", "id"]
+        constraints = unique_slug_constraints("service")
 
     def __str__(self):
         return self.title
@@ -216,7 +283,7 @@ class Service(TimeStampedModel):
     @property
     def features_list(self):
         """Return list of feature names for backward compatibility"""
-        return list(self.service_features.values_list('name', flat=True))
+        return [feature.name for feature in self.service_features.all()]
 
 def team_member_image_upload_to(instance, filename):
     ext = os.path.splitext(filename)[1]
@@ -0,0 +1,32 @@
+"""
+Previous/next navigation between published blog posts.
+
+Neighbours under the list ordering ``(-date, -id)`` are found with keyset
+row comparisons, ``(date, id) > (%s, %s)`` ordered the other way and limited
+to one row, which the ``(status, date, id)`` index answers with a single
+short range scan however many posts there are.
+"""
+from django.db import models
+from django.db.models import Func, Value
+
+from .models import BlogPost
+
+
+class Row(Func):
+    """SQL row constructor, ``(a, b, ...)``, comparable element by element"""
+    function = ""
+    output_field = models.Field()
+
+
+def adjacent_posts(post, queryset=None):
+    """
+    Return ``(previous, next)`` published posts around ``post`` in list order,
+    i.e. the next newer and the next older post, either of which may be None.
+    """
+    if queryset is None:
+        queryset = BlogPost.objects.all()
+    queryset = queryset.filter(status="published").alias(position=Row("date", "id"))
+    current = Row(Value(post.date), Value(post.pk))
+    previous = queryset.filter(position__gt=current).order_by("date", "id").first()
+    following = queryset.filter(position__lt=current).order_by("-date", "-id").first()
+    return previous, following
@@ -0,0 +1,206 @@
+"""
+Purge notifications to the frontend.
+
+A content change is turned into the API paths (and languages) whose
+responses it changes. Those are handed to a per-process ``PurgeQueue`` once
+the transaction commits; a background thread waits until edits have been
+quiet for ``FRONTEND_PURGE_DEBOUNCE`` seconds (but never longer than
+``FRONTEND_PURGE_MAX_DELAY``), merges everything collected so far into one
+webhook and POSTs it to ``FRONTEND_PURGE_URL``, retrying with backoff.
+
+Payload::
+
+    {"paths": {"/api/blog/": ["az", "en", "ru"], "/api/blog/7/": ["az"]}}
+"""
+import atexit
+import json
+import logging
+import threading
+import time
+import urllib.error
+import urllib.request
+
+from django.conf import settings
+from django.db import transaction
+from django.urls import reverse
+from modeltranslation.settings import AVAILABLE_LANGUAGES, DEFAULT_LANGUAGE
+from modeltranslation.utils import build_localized_fieldname
+
+from .i18n import get_translated_fields
+from .models import FAQ, BlogPost, RelatedPost, Service
+from .navigation import adjacent_posts
+from .slugs import slug_columns
+
+logger = logging.getLogger(__name__)
+
+
+# --- What a change affects -------------------------------------------------
+
+def changed_languages(instance, previous):
+    """
+    Languages whose responses change when ``instance`` is saved over the
+    ``previous`` column values (None for a new or deleted object). Editing
+    only ``title_az`` affects az; editing the default language, which the
+    others fall back to, or any untranslated field affects every language.
+    """
+    if previous is None:
+        return set(AVAILABLE_LANGUAGES)
+    translated = {
+        build_localized_fieldname(field, language): language
+        for field in get_translated_fields(type(instance))
+        for language in AVAILABLE_LANGUAGES
+    }
+    languages = set()
+    for column, old_value in previous.items():
+        if getattr(instance, column) == old_value:
+            continue
+        language = translated.get(column)
+        if language is None or language == DEFAULT_LANGUAGE:
+            return set(AVAILABLE_LANGUAGES)
+        languages.add(language)
+    return languages
+
+
+def tracked_columns(model):
+    """
+    Columns compared by ``changed_languages``: the concrete fields, with
+    translated fields represented by their per-language columns only
+    """
+    skipped = {"updatedAt", *get_translated_fields(model)}
+    return [field.attname for field in model._meta.concrete_fields if field.attname not in skipped]
+
+
+def _detail_paths(basename, instance):
+    lookups = {instance.pk, *(getattr(instance, column) for column in slug_columns())}
+    return {reverse(f"{basename}-detail", args=[lookup]) for lookup in lookups if lookup}
+
+
+def blog_post_paths(post):
+    paths = {
+        reverse("blog-list"), reverse("blog-archive"), reverse("blog-categories"), reverse("blog-tags"),
+        *_detail_paths("blog", post),
+    }
+    if post.pk is not None:
+        # Pages embedding this post: its neighbours' details and the related lists it appears in
+        for neighbour in adjacent_posts(post, BlogPost.objects.only("id", *slug_columns())):
+            if neighbour is not None:
+                paths |= _detail_paths("blog", neighbour)
+        paths.add(reverse("blog-related", args=[post.pk]))
+        for post_id in RelatedPost.objects.filter(related_id=post.pk).values_list("post_id", flat=True):
+            paths.add(reverse("blog-related", args=[post_id]))
+    return paths
+
+
+def service_paths(service):
+    return {reverse("services-list"), *_detail_paths("services", service)}
+
+
+def faq_paths(faq):
+    return {reverse("faq-list"), reverse("faq-detail", args=[faq.pk])}
+
+
+PATH_BUILDERS = {
+    BlogPost: blog_post_paths,
+    Service: service_paths,
+    FAQ: faq_paths,
+}
+
+
+def affected(instance, languages=None):
+    """``{path: languages}`` of the responses a change to ``instance`` affects"""
+    languages = set(AVAILABLE_LANGUAGES) if languages is None else set(languages)
+    if not languages:
+        return {}
+    return {path: set(languages) for path in PATH_BUILDERS[type(instance)](instance)}
+
+
+# --- Delivery --------------------------------------------------------------
+
+def send_purge(paths):
+    """POST one purge webhook; raises on network errors and non-2xx responses"""
+    body = json.dumps({"paths": {path: sorted(languages) for path, languages in sorted(paths.items())}})
+    request = urllib.request.Request(
+        settings.FRONTEND_PURGE_URL, data=body.encode(), method="POST",
+        headers={"Content-Type": "application/json"},
+    )
+    if settings.FRONTEND_PURGE_TOKEN:
+        request.add_header("Authorization", f"Bearer {settings.FRONTEND_PURGE_TOKEN}")
+    with urllib.request.urlopen(request, timeout=settings.FRONTEND_PURGE_TIMEOUT) as response:
+        response.read()
+
+
+class PurgeQueue:
+    """Debounced, coalescing purge queue drained by one daemon thread per process"""
+
+    def __init__(self, send=None):
+        self.send = send
+        self.pending = {}
+        self.first_enqueued = self.last_enqueued = None
+        self.condition = threading.Condition()
+        self.thread = None
+
+    def enqueue(self, paths):
+        if not paths:
+            return
+        with self.condition:
+            for path, languages in paths.items():
+                self.pending.setdefault(path, set()).update(languages)
+            now = time.monotonic()
+            self.first_enqueued = self.first_enqueued or now
+            self.last_enqueued = now
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self._run, name="frontend-purge", daemon=True)
+                self.thread.start()
+            self.condition.notify()
+
+    def _due_in(self):
+        """Seconds until the pending batch should go out"""
+        quiet = self.last_enqueued + settings.FRONTEND_PURGE_DEBOUNCE
+        latest = self.first_enqueued + settings.FRONTEND_PURGE_MAX_DELAY
+        return min(quiet, latest) - time.monotonic()
+
+    def _take(self):
+        paths, self.pending = self.pending, {}
+        self.first_enqueued = self.last_enqueued = None
+        return paths
+
+    def _run(self):
+        while True:
+            with self.condition:
+                while not self.pending:
+                    self.condition.wait()
+                while self.pending and self._due_in() > 0:
+                    self.condition.wait(self._due_in())
+                paths = self._take()
+            if paths:
+                self._deliver(paths)
+
+    def _deliver(self, paths):
+        for attempt in range(settings.FRONTEND_PURGE_RETRIES + 1):
+            try:
+                (self.send or send_purge)(paths)
+                return True
+            except (OSError, urllib.error.URLError) as exc:
+                if attempt == settings.FRONTEND_PURGE_RETRIES:
+                    logger.error("Frontend purge of %d paths failed: %s", len(paths), exc)
+                    return False
+                time.sleep(settings.FRONTEND_PURGE_BACKOFF * 2 ** attempt)
+
+    def flush(self):
+        """Send whatever is pending now, on the calling thread"""
+        with self.condition:
+            paths = self._take()
+        return self._deliver(paths) if paths else True
+
+
+purge_queue = PurgeQueue()
+atexit.register(lambda: settings.FRONTEND_PURGE_URL and purge_queue.flush())
+
+
+def schedule_purge(instance, languages=None):
+    """Queue the purge of ``instance``'s responses once the current transaction commits"""
+    if not settings.FRONTEND_PURGE_URL:
+        return
+    paths = affected(instance, languages)
+    if paths:
+        transaction.on_commit(lambda: purge_queue.enqueue(paths))
@@ -0,0 +1,242 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from .cache import bump_version
+from .counts import CATEGORY, TAG, month_key, refresh_counts, refresh_post_counts
+from .models import (
+    FAQ, BlogPost, Category, HeaderNavLink, PortfolioCategory, PortfolioItem, Service, ServiceFeature,
+    SocialLink, Tag, TeamMember, Technology, Testimonial,
+)
+from .purge import PATH_BUILDERS, changed_languages, schedule_purge, tracked_columns
+from .related import rebuild_top_lists, update_related
+from .replicas import pin_primary
+from .signals import order_changed
+
+
+# Models whose cached API responses, sitemaps and feeds are retired by a version bump
+CACHED_MODELS = (
+    BlogPost, Tag, Category, get_user_model(), PortfolioItem, PortfolioCategory, Technology,
+    Service, ServiceFeature, TeamMember, SocialLink, Testimonial, FAQ, HeaderNavLink,
+)
+
+
+def data_changed(model):
+    """Retire the cached responses built from ``model`` and read them from the primary while replicas catch up"""
+    bump_version(model)
+    pin_primary()
+
+
+def invalidate_model_version(sender, **kwargs):
+    """Retire cached responses built from ``sender`` once the change is committed"""
+    transaction.on_commit(lambda: data_changed(sender))
+
+
+for model in CACHED_MODELS:
+    post_save.connect(invalidate_model_version, sender=model, dispatch_uid=f"version-save-{model._meta.label}")
+    post_delete.connect(invalidate_model_version, sender=model, dispatch_uid=f"version-delete-{model._meta.label}")
+
+
+@receiver(m2m_changed, sender=BlogPost.tags.through)
+@receiver(m2m_changed, sender=BlogPost.categories.through)
+@receiver(m2m_changed, sender=PortfolioItem.technologies.through)
+@receiver(m2m_changed, sender=PortfolioItem.categories.through)
+def invalidate_links_version(sender, action, model, instance, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        # The owning side (BlogPost/PortfolioItem) embeds the links in its responses
+        owner = model if kwargs["reverse"] else type(instance)
+        transaction.on_commit(lambda: data_changed(owner))
+
+
+@receiver(order_changed)
+def invalidate_reordered_version(sender, **kwargs):
+    # Admin reorders are a bulk UPDATE without post_save
+    data_changed(sender)
+
+
+@receiver(m2m_changed, sender=BlogPost.tags.through)
+@receiver(m2m_changed, sender=BlogPost.categories.through)
+def update_related_posts(sender, instance, action, reverse, pk_set, **kwargs):
+    """Update the related-post lists affected by a tag/category change"""
+    if action == "pre_clear" and reverse:
+        # tag.blog_posts.clear(): remember the posts before the rows are gone
+        instance._cleared_post_ids = list(instance.blog_posts.values_list("pk", flat=True))
+        return
+    if action not in ("post_add", "post_remove", "post_clear") or (action != "post_clear" and not pk_set):
+        return
+    if not reverse:
+        post_ids = [instance.pk]
+    elif action == "post_clear":
+        post_ids = getattr(instance, "_cleared_post_ids", [])
+    else:
+        post_ids = pk_set
+    if post_ids:
+        update_related(post_ids)
+
+
+@receiver(post_save, sender=BlogPost)
+def update_related_after_status_change(sender, instance, created, **kwargs):
+    """Only published posts are ranked, so (un)publishing moves a post into or out of the lists"""
+    saved = getattr(instance, "_saved_values", None)
+    if not created and saved is not None and saved.get("status") != instance.status:
+        update_related([instance.pk])
+
+
+@receiver(pre_delete, sender=Tag)
+@receiver(pre_delete, sender=Category)
+def remember_tagged_posts(sender, instance, **kwargs):
+    # Deleting a tag/category cascades to the m2m rows without m2m_changed
+    instance._cleared_post_ids = list(instance.blog_posts.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender=Tag)
+@receiver(post_delete, sender=Category)
+def update_related_posts_after_delete(sender, instance, **kwargs):
+    post_ids = getattr(instance, "_cleared_post_ids", [])
+    if post_ids:
+        update_related(post_ids)
+
+
+@receiver(pre_delete, sender=BlogPost)
+def remember_listing_posts(sender, instance, **kwargs):
+    instance._listing_post_ids = list(instance.related_by.values_list("post_id", flat=True))
+
+
+@receiver(post_delete, sender=BlogPost)
+def refill_related_lists(sender, instance, **kwargs):
+    """Posts that listed a deleted post get their list topped up again"""
+    post_ids = getattr(instance, "_listing_post_ids", [])
+    if post_ids:
+        rebuild_top_lists(post_ids)
+
+
+@receiver(pre_save, sender=BlogPost)
+@receiver(pre_save, sender=Service)
+@receiver(pre_save, sender=FAQ)
+def remember_saved_values(sender, instance, **kwargs):
+    """Keep the stored column values for the post_save receivers to diff against"""
+    # Blog post counts and related lists always diff; Service and FAQ saves only for the purge
+    if sender is not BlogPost and not settings.FRONTEND_PURGE_URL:
+        return
+    instance._saved_values = (
+        sender.objects.filter(pk=instance.pk).values(*tracked_columns(sender)).first()
+        if instance.pk else None
+    )
+
+
+@receiver(post_save, sender=BlogPost)
+def update_counts_after_save(sender, instance, created, **kwargs):
+    """Recount the months (and, on a status change, the taxonomy) a saved post moved between"""
+    saved = getattr(instance, "_saved_values", None) or {}
+    old_date, old_status = saved.get("date"), saved.get("status")
+    if (old_date, old_status) == (instance.date, instance.status) or (created and instance.status != "published"):
+        return
+    months = {month_key(instance.date)} | ({month_key(old_date)} if old_date else set())
+    if old_status == instance.status or created:
+        refresh_post_counts(months=months)
+    else:
+        refresh_post_counts(
+            months=months,
+            category_ids=instance.categories.values_list("pk", flat=True),
+            tag_ids=instance.tags.values_list("pk", flat=True),
+        )
+
+
+@receiver(pre_delete, sender=BlogPost)
+def remember_counted_links(sender, instance, **kwargs):
+    instance._counted_links = (
+        list(instance.categories.values_list("pk", flat=True)),
+        list(instance.tags.values_list("pk", flat=True)),
+    )
+
+
+@receiver(post_delete, sender=BlogPost)
+def update_counts_after_delete(sender, instance, **kwargs):
+    if instance.status == "published":
+        category_ids, tag_ids = getattr(instance, "_counted_links", ((), ()))
+        refresh_post_counts(months=[month_key(instance.date)], category_ids=category_ids, tag_ids=tag_ids)
+
+
+@receiver(m2m_changed, sender=BlogPost.tags.through)
+@receiver(m2m_changed, sender=BlogPost.categories.through)
+def update_taxonomy_counts(sender, instance, action, reverse, pk_set, **kwargs):
+    """Recount the tags/categories whose published posts changed"""
+    kind = TAG if sender is BlogPost.tags.through else CATEGORY
+    if reverse:
+        # tag.blog_posts.add(...) etc.: only this tag's bucket can change
+        if action in ("post_add", "post_remove", "post_clear"):
+            refresh_counts(kind, [instance.pk])
+    elif instance.status == "published":
+        related = instance.tags if kind == TAG else instance.categories
+        if action == "pre_clear":
+            instance._cleared_count_keys = list(related.values_list("pk", flat=True))
+        elif action == "post_clear":
+            refresh_counts(kind, getattr(instance, "_cleared_count_keys", []))
+        elif action in ("post_add", "post_remove"):
+            refresh_counts(kind, pk_set or [])
+
+
+@receiver(post_delete, sender=Tag)
+@receiver(post_delete, sender=Category)
+def remove_taxonomy_count(sender, instance, **kwargs):
+    refresh_counts(TAG if sender is Tag else CATEGORY, [instance.pk])
+
+
+@receiver(post_save, sender=BlogPost)
+@receiver(post_save, sender=Service)
+@receiver(post_save, sender=FAQ)
+def purge_after_save(sender, instance, created, **kwargs):
+    """Tell the frontend which responses, in which languages, the save changed"""
+    if not settings.FRONTEND_PURGE_URL:
+        return
+    saved = None if created else getattr(instance, "_saved_values", None)
+    schedule_purge(instance, changed_languages(instance, saved))
+
+
+@receiver(pre_delete, sender=BlogPost)
+@receiver(pre_delete, sender=Service)
+@receiver(pre_delete, sender=FAQ)
+def purge_before_delete(sender, instance, **kwargs):
+    # Before the delete, while the pages embedding the object can still be found
+    schedule_purge(instance)
+
+
+@receiver(post_save, sender=ServiceFeature)
+@receiver(post_delete, sender=ServiceFeature)
+def purge_feature_service(sender, instance, **kwargs):
+    if not settings.FRONTEND_PURGE_URL:
+        return
+    service = Service.objects.filter(pk=instance.service_id).first()
+    if service is not None:
+        schedule_purge(service)
+
+
+@receiver(order_changed)
+def purge_after_reorder(sender, pks, **kwargs):
+    # Admin reorders are a bulk UPDATE without post_save
+    if not settings.FRONTEND_PURGE_URL:
+        return
+    if sender is ServiceFeature:
+        objects = Service.objects.filter(service_features__pk__in=pks).distinct()
+    elif sender in PATH_BUILDERS:
+        objects = sender.objects.filter(pk__in=pks)
+    else:
+        return
+    for obj in objects:
+        schedule_purge(obj)
+
+
+@receiver(m2m_changed, sender=BlogPost.tags.through)
+@receiver(m2m_changed, sender=BlogPost.categories.through)
+def purge_after_taxonomy_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if not settings.FRONTEND_PURGE_URL or action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        schedule_purge(instance)
+        return
+    post_ids = getattr(instance, "_cleared_post_ids", []) if action == "post_clear" else pk_set
+    for post in BlogPost.objects.filter(pk__in=post_ids or []):
+        schedule_purge(post)
+
@@ -0,0 +1,113 @@
+"""
+Related blog posts.
+
+Two posts are scored by the weighted number of tags and categories they
+share. ``RelatedPost`` keeps only each post's top ``RELATED_POSTS_STORED``
+matches, so a detail page reads its related posts from one index range scan
+and the table grows linearly with the number of posts. Only published posts
+are ranked as matches.
+
+When a post's tags or categories change, only the posts whose top list can
+actually change are recomputed: the post itself, the posts currently listing
+it, and the posts it now overlaps strongly enough to enter their list. The
+same holds when a post is published or unpublished.
+"""
+from django.conf import settings
+from django.db import connection, transaction
+
+from .models import BlogPost, RelatedPost
+
+# A shared tag says more about two posts than a shared (broad) category
+TAG_WEIGHT = 2
+CATEGORY_WEIGHT = 1
+
+
+def _terms_sql(published_only=False):
+    """Subquery of (blogpost_id, term, weight) over the tag and category links of all (or published) posts"""
+    quote = connection.ops.quote_name
+    terms = (
+        f"SELECT blogpost_id, 't' || tag_id AS term, {TAG_WEIGHT} AS weight "
+        f"FROM {quote(BlogPost.tags.through._meta.db_table)} "
+        f"UNION ALL SELECT blogpost_id, 'c' || category_id, {CATEGORY_WEIGHT} "
+        f"FROM {quote(BlogPost.categories.through._meta.db_table)}"
+    )
+    if not published_only:
+        return terms
+    return (
+        f"SELECT links.blogpost_id, links.term, links.weight FROM ({terms}) links "
+        f"JOIN {quote(BlogPost._meta.db_table)} post ON post.id = links.blogpost_id AND post.status = 'published'"
+    )
+
+
+def _table():
+    return connection.ops.quote_name(RelatedPost._meta.db_table)
+
+
+def rebuild_top_lists(post_ids=None):
+    """Recompute the top lists of ``post_ids`` (or of every post when None)"""
+    table, terms, candidates = _table(), _terms_sql(), _terms_sql(published_only=True)
+    where, params = "", [settings.RELATED_POSTS_STORED]
+    if post_ids is not None:
+        post_ids = list(post_ids)
+        if not post_ids:
+            return
+        where, params = "WHERE a.blogpost_id = ANY(%s)", [post_ids, *params]
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        if post_ids is None:
+            cursor.execute(f"DELETE FROM {table}")
+        else:
+            cursor.execute(f"DELETE FROM {table} WHERE post_id = ANY(%s)", [post_ids])
+        cursor.execute(
+            f"INSERT INTO {table} (post_id, related_id, score) "
+            f"SELECT post_id, related_id, score FROM ("
+            f"  SELECT a.blogpost_id AS post_id, b.blogpost_id AS related_id, SUM(a.weight) AS score,"
+            f"         ROW_NUMBER() OVER (PARTITION BY a.blogpost_id"
+            f"                            ORDER BY SUM(a.weight) DESC, b.blogpost_id DESC) AS position"
+            f"  FROM ({terms}) a JOIN ({candidates}) b ON a.term = b.term AND a.blogpost_id <> b.blogpost_id"
+            f"  {where}"
+            f"  GROUP BY a.blogpost_id, b.blogpost_id"
+            f") ranked WHERE position <= %s",
+            params,
+        )
+
+
+def affected_posts(post_ids):
+    """
+    Posts whose top list may change after the tags/categories or the status
+    of ``post_ids`` changed: those listing one of them, and those one of them
+    (if published) now scores at least as high as their current weakest entry
+    (or whose list is not full).
+    """
+    table, terms, candidates = _table(), _terms_sql(), _terms_sql(published_only=True)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"WITH scores AS ("
+            f"  SELECT b.blogpost_id AS post_id, SUM(a.weight) AS score"
+            f"  FROM ({candidates}) a JOIN ({terms}) b ON a.term = b.term AND a.blogpost_id <> b.blogpost_id"
+            f"  WHERE a.blogpost_id = ANY(%s) GROUP BY b.blogpost_id, a.blogpost_id"
+            f"), lists AS ("
+            f"  SELECT post_id, COUNT(*) AS size, MIN(score) AS weakest FROM {table}"
+            f"  WHERE post_id IN (SELECT post_id FROM scores) GROUP BY post_id"
+            f") "
+            f"SELECT scores.post_id FROM scores LEFT JOIN lists ON lists.post_id = scores.post_id "
+            f"WHERE lists.size IS NULL OR lists.size < %s OR scores.score >= lists.weakest "
+            f"UNION SELECT post_id FROM {table} WHERE related_id = ANY(%s)",
+            [post_ids, settings.RELATED_POSTS_STORED, post_ids],
+        )
+        return {row[0] for row in cursor.fetchall()}
+
+
+def update_related(post_ids):
+    """Bring the top lists up to date after the tags/categories or the status of ``post_ids`` changed"""
+    post_ids = list(post_ids)
+    with transaction.atomic():
+        rebuild_top_lists(affected_posts(post_ids) | set(post_ids))
+
+
+def related_posts(queryset, post_id, limit):
+    """``queryset`` restricted to the top ``limit`` related posts of ``post_id``, best first"""
+    return (
+        queryset.filter(related_by__post_id=post_id)
+        .order_by("-related_by__score", "-related_by__related_id")[:limit]
+    )
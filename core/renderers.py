@@ -0,0 +1,66 @@
+"""
+orjson-backed JSON renderer and parser.
+
+They produce and accept exactly what DRF's ``JSONRenderer``/``JSONParser``
+do: compact separators, raw UTF-8 (``UNICODE_JSON``), ``Z`` for UTC
+datetimes, escaped U+2028/U+2029, and anything orjson does not know
+(decimals, lazy translation strings, querysets, ...) converted by DRF's own
+``JSONEncoder.default``. Output orjson cannot produce identically (indented
+JSON for the browsable API, non-UTF-8 or ASCII-only output, integers beyond
+64 bits) falls back to the stdlib implementation. The remaining differences
+are floats: exponents are spelled ``1e16`` instead of ``1e+16`` (the same
+number), and NaN/Infinity render as ``null`` where the stdlib raises.
+"""
+import codecs
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # the stdlib renderer and parser are used without the optional dependency
+    orjson = None
+
+ORJSON_OPTIONS = (orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS) if orjson else 0
+LINE_SEPARATORS = ((b"\xe2\x80\xa8", b"\\u2028"), (b"\xe2\x80\xa9", b"\\u2029"))
+
+
+class ORJSONRenderer(JSONRenderer):
+    """``JSONRenderer`` serializing with orjson"""
+    encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None
+            or data is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=self.encoder.default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # Valid JSON, but not valid JavaScript; DRF escapes these too
+        for character, escaped in LINE_SEPARATORS:
+            if character in ret:
+                ret = ret.replace(character, escaped)
+        return ret
+
+
+class ORJSONParser(JSONParser):
+    """``JSONParser`` deserializing UTF-8 bodies with orjson"""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get("encoding", "utf-8")
+        if orjson is None or not self.strict or codecs.lookup(encoding).name != "utf-8":
+            return super().parse(stream, media_type, parser_context)
+        try:
+            # orjson rejects NaN and Infinity, as the STRICT_JSON stdlib parser does
+            data = orjson.loads(stream.read())
+        except ValueError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
+        return data
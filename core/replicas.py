@@ -0,0 +1,132 @@
+"""
+Read replicas.
+
+Safe requests on the read-only API viewsets read from one of
+``DATABASE_REPLICAS`` (see ``ReplicaReadMixin``); everything else, and
+every write, uses ``default``. One replica is picked per request, so all of
+its queries see the same snapshot.
+
+A request stays on the primary when:
+
+* its client made a successful write less than
+  ``DATABASE_REPLICA_PIN_SECONDS`` ago (the ``ReplicaPinMiddleware``
+  cookie), so it reads its own writes;
+* cached data changed that recently (``pin_primary``, called where the
+  change retires the cached responses), so a response rendered right after
+  a change, and cached under the new data versions, never comes from a
+  replica that has not replayed the change yet;
+* no replica is healthy: reachable and at most ``DATABASE_REPLICA_MAX_LAG``
+  seconds behind, as checked at most every
+  ``DATABASE_REPLICA_CHECK_INTERVAL`` seconds per process.
+"""
+import logging
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, connections
+
+logger = logging.getLogger(__name__)
+
+PIN_COOKIE = "primary_pin"
+PIN_KEY = "replica:pin"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+# Seconds of WAL the replica has received but not replayed; 0 when caught up (or not a replica)
+LAG_SQL = (
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+_read_alias = ContextVar("replica_read_alias", default=None)
+# {alias: (healthy, monotonic time of the check)}
+_health = {}
+
+
+def _check(alias):
+    try:
+        with connections[alias].cursor() as cursor:
+            cursor.execute(LAG_SQL)
+            (lag,) = cursor.fetchone()
+    except DatabaseError as exc:
+        logger.warning("Replica %s is unavailable: %s", alias, exc)
+        connections[alias].close()
+        return False
+    if lag > settings.DATABASE_REPLICA_MAX_LAG:
+        logger.warning("Replica %s is %.1f s behind", alias, lag)
+        return False
+    return True
+
+
+def replica_healthy(alias):
+    """Whether ``alias`` is reachable and caught up, rechecked every ``DATABASE_REPLICA_CHECK_INTERVAL``"""
+    healthy, checked_at = _health.get(alias, (None, 0.0))
+    now = time.monotonic()
+    if healthy is None or now - checked_at >= settings.DATABASE_REPLICA_CHECK_INTERVAL:
+        healthy = _check(alias)
+        _health[alias] = (healthy, now)
+    return healthy
+
+
+def choose_replica(request):
+    """The replica ``request`` reads from, or None for the primary"""
+    replicas = settings.DATABASE_REPLICAS
+    if not replicas or request.method not in SAFE_METHODS:
+        return None
+    if PIN_COOKIE in request.COOKIES or cache.get(PIN_KEY):
+        return None
+    for alias in random.sample(replicas, len(replicas)):
+        if replica_healthy(alias):
+            return alias
+    return None
+
+
+def pin_primary():
+    """Keep every client's reads on the primary while replicas may lag behind a committed change"""
+    if settings.DATABASE_REPLICAS:
+        cache.set(PIN_KEY, 1, settings.DATABASE_REPLICA_PIN_SECONDS)
+
+
+@contextmanager
+def replica_reads(request):
+    """Route the reads made inside the block to the replica chosen for ``request``"""
+    token = _read_alias.set(choose_replica(request))
+    try:
+        yield _read_alias.get()
+    finally:
+        _read_alias.reset(token)
+
+
+class PrimaryReplicaRouter:
+    """Reads inside ``replica_reads`` go to its replica; all else goes to ``default``"""
+
+    def db_for_read(self, model, **hints):
+        return _read_alias.get()
+
+    def db_for_write(self, model, **hints):
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas get their schema through replication
+        return False if db in settings.DATABASE_REPLICAS else None
+
+
+class ReplicaPinMiddleware:
+    """Keeps a client's reads on the primary for ``DATABASE_REPLICA_PIN_SECONDS`` after its successful writes"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if settings.DATABASE_REPLICAS and request.method not in SAFE_METHODS and 200 <= response.status_code < 300:
+            response.set_cookie(
+                PIN_COOKIE, "1", max_age=settings.DATABASE_REPLICA_PIN_SECONDS, httponly=True, samesite="Lax",
+            )
+        return response
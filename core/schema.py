@@ -0,0 +1,115 @@
+"""
+Prebuilt OpenAPI schema artifacts.
+
+Generating the schema introspects every viewset and serializer, so it is
+built once per code version and language (``manage.py build_schema`` at
+deploy) and then served from memory, falling back to disk and finally to
+generating it on first use.
+"""
+import hashlib
+import os
+from functools import lru_cache
+from pathlib import Path
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils import translation
+from django.utils.cache import quote_etag
+from drf_spectacular.renderers import OpenApiJsonRenderer, OpenApiYamlRenderer
+from drf_spectacular.settings import spectacular_settings
+from drf_spectacular.views import SpectacularAPIView
+
+# Both YAML and both JSON renderers of SpectacularAPIView produce identical bytes
+RENDERERS = {"yaml": OpenApiYamlRenderer, "json": OpenApiJsonRenderer}
+
+# (version, language, kind) -> (content, etag)
+_schemas = {}
+
+
+@lru_cache(maxsize=None)
+def code_version():
+    """
+    ``settings.CODE_VERSION`` (e.g. the git SHA set at build time), or a
+    digest of the project's Python sources and the schema-relevant packages.
+    """
+    if settings.CODE_VERSION:
+        return settings.CODE_VERSION
+
+    import django
+    import drf_spectacular
+    import modeltranslation
+    import rest_framework
+
+    digest = hashlib.sha256()
+    for package in (django, rest_framework, drf_spectacular, modeltranslation):
+        digest.update(f"{package.__name__}={getattr(package, '__version__', '')};".encode())
+    base_dir = Path(settings.BASE_DIR)
+    for directory in ("backend", "core"):
+        for path in sorted((base_dir / directory).rglob("*.py")):
+            digest.update(str(path.relative_to(base_dir)).encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def schema_language(language=None):
+    """Map ``language`` onto a configured language so artifacts stay bounded"""
+    language = (language or translation.get_language() or settings.LANGUAGE_CODE).split("-")[0]
+    return language if language in dict(settings.LANGUAGES) else settings.LANGUAGE_CODE
+
+
+def schema_path(language, kind, version=None):
+    return Path(settings.SCHEMA_CACHE_DIR) / (version or code_version()) / f"{language}.{kind}"
+
+
+def generate_schema(language, kind):
+    """Generate and render the schema for ``language`` as ``kind`` ("yaml" or "json")"""
+    generator = spectacular_settings.DEFAULT_GENERATOR_CLASS()
+    with translation.override(language):
+        schema = generator.get_schema(request=None, public=True)
+        return RENDERERS[kind]().render(schema, renderer_context={})
+
+
+def write_schema(language, kind, content):
+    path = schema_path(language, kind)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_bytes(content)
+    os.replace(tmp, path)
+    return path
+
+
+def get_schema(language, kind):
+    """Return ``(content, etag)``: from memory, else disk, else generated and stored"""
+    key = (code_version(), language, kind)
+    if key not in _schemas:
+        path = schema_path(language, kind)
+        try:
+            content = path.read_bytes()
+        except FileNotFoundError:
+            content = generate_schema(language, kind)
+            try:
+                write_schema(language, kind, content)
+            except OSError:
+                pass  # read-only filesystem: keep it in memory only
+        _schemas[key] = (content, quote_etag(hashlib.sha256(content).hexdigest()[:32]))
+    return _schemas[key]
+
+
+class CachedSpectacularAPIView(SpectacularAPIView):
+    """SpectacularAPIView serving the prebuilt schema with an ETag"""
+
+    def _get_schema_response(self, request):
+        renderer = request.accepted_renderer
+        kind = "json" if "json" in renderer.format else "yaml"
+        content, etag = get_schema(schema_language(), kind)
+
+        if etag in request.headers.get("If-None-Match", ""):
+            response = HttpResponseNotModified()
+        else:
+            content_type = renderer.media_type + (f"; charset={renderer.charset}" if renderer.charset else "")
+            response = HttpResponse(content, content_type=content_type)
+            filename = f"{spectacular_settings.TITLE or 'schema'}.{renderer.format}"
+            response["Content-Disposition"] = f'inline; filename="{filename}"'
+        response["ETag"] = etag
+        response["Cache-Control"] = "no-cache"
+        return response
@@ -1,5 +1,6 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
+from .i18n import get_list_translations, get_translated_fields, get_translations
 from .models import (
     BlogPost, PortfolioItem, Service, TeamMember, Testimonial, ContactInquiry,
     Tag, Technology, ServiceFeature, SocialLink , Category  , HeaderNavLink , FAQ , PortfolioCategory
@@ -8,6 +9,23 @@ from .models import (
 User = get_user_model()
 
 
+class TranslatedFieldsMixin:
+    """Render every translation of translated fields when the view asks for all languages"""
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        if not self.context.get("all_languages"):
+            return data
+        for field_name in get_translated_fields(type(instance)):
+            if field_name in data:
+                field = self.fields[field_name]
+                data[field_name] = {
+                    language: None if value is None else field.to_representation(value)
+                    for language, value in get_translations(instance, field_name).items()
+                }
+        return data
+
+
 # --- Serializers for New Models ---
 class TagSerializer(serializers.ModelSerializer):
     """Serializer for Tag model"""
@@ -47,13 +65,29 @@ class AuthorSerializer(serializers.ModelSerializer):
         fields = ("id", "username", "first_name", "last_name", "email")
 
 
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(TranslatedFieldsMixin, serializers.ModelSerializer):
     """Serializer for Category model"""
     class Meta:
         model = Category
         fields = ("id", "name", "order")
 
-class BlogPostSerializer(serializers.ModelSerializer):
+class CategoryCountSerializer(CategorySerializer):
+    """Category with its number of published blog posts"""
+    post_count = serializers.IntegerField(read_only=True)
+
+    class Meta(CategorySerializer.Meta):
+        fields = CategorySerializer.Meta.fields + ("post_count",)
+
+
+class TagCountSerializer(TagSerializer):
+    """Tag with its number of published blog posts"""
+    post_count = serializers.IntegerField(read_only=True)
+
+    class Meta(TagSerializer.Meta):
+        fields = TagSerializer.Meta.fields + ("post_count",)
+
+
+class BlogPostSerializer(TranslatedFieldsMixin, serializers.ModelSerializer):
     """Serializer for BlogPost model with nested relationships"""
     author = AuthorSerializer(read_only=True)
     tags = TagSerializer(many=True, read_only=True)
@@ -62,7 +96,7 @@ class BlogPostSerializer(serializers.ModelSerializer):
     )
     categories = CategorySerializer(many=True, read_only=True)
     categories_list = serializers.SerializerMethodField(
-        help_text="List of category names for backward compatibility"
+        help_text="List of category names for backward compatibility, {language: [...]} with ?lang=all"
     )
 
     def get_tags_list(self, obj):
@@ -74,6 +108,8 @@ class BlogPostSerializer(serializers.ModelSerializer):
     def get_categories_list(self, obj):
         """Get list of category names for backward compatibility"""
         try:
+            if self.context.get("all_languages"):
+                return get_list_translations(obj.categories.all(), "name")
             return obj.categories_list
         except AttributeError:
             return []
@@ -81,18 +117,25 @@ class BlogPostSerializer(serializers.ModelSerializer):
     class Meta:
         model = BlogPost
         fields = (
-            "id", "title", "excerpt", "content", "date", "readTime",
+            "id", "title", "slug", "excerpt", "content", "date", "readTime",
             "image", "author", "tags", "tags_list", 'categories','categories_list',  "status", "createdAt", "updatedAt","order"
         )
 
 
-class PortfolioCategorySerializer(serializers.ModelSerializer):
+class BlogPostNeighbourSerializer(TranslatedFieldsMixin, serializers.ModelSerializer):
+    """Minimal BlogPost representation for previous/next links"""
+    class Meta:
+        model = BlogPost
+        fields = ("id", "title", "slug", "date")
+
+
+class PortfolioCategorySerializer(TranslatedFieldsMixin, serializers.ModelSerializer):
     """Serializer for PortfolioCategory model"""
     class Meta:
         model = PortfolioCategory
         fields = ("id", "name", "slug", "order")
 
-class PortfolioItemSerializer(serializers.ModelSerializer):
+class PortfolioItemSerializer(TranslatedFieldsMixin, serializers.ModelSerializer):
     """Serializer for PortfolioItem model with nested relationships"""
     technologies = TechnologySerializer(many=True, read_only=True)
     categories = PortfolioCategorySerializer(many=True, read_only=True)
@@ -101,13 +144,13 @@ class PortfolioItemSerializer(serializers.ModelSerializer):
         help_text="List of technology names for backward compatibility"
     )
     categories_list = serializers.SerializerMethodField(
-        help_text="List of category names for backward compatibility"
+        help_text="List of category names for backward compatibility, {language: [...]} with ?lang=all"
     )
 
     class Meta:
         model = PortfolioItem
         fields = (
-            "id", "title", "description", "image", "url", "categories",
+            "id", "title", "slug", "description", "image", "url", "categories",
             "technologies", "technologies_list", "categories_list",
             "client", "completionDate", "createdAt", "updatedAt","order"
         )
@@ -122,12 +165,14 @@ class PortfolioItemSerializer(serializers.ModelSerializer):
     def get_categories_list(self, obj):
         """Get list of category names for backward compatibility"""
         try:
+            if self.context.get("all_languages"):
+                return get_list_translations(obj.categories.all(), "name")
             return obj.categories_list
         except AttributeError:
             return []
 
 
-class ServiceSerializer(serializers.ModelSerializer):
+class ServiceSerializer(TranslatedFieldsMixin, serializers.ModelSerializer):
     """Serializer for Service model with nested relationships"""
     features = ServiceFeatureSerializer(source='service_features', many=True, read_only=True)
     features_list = serializers.SerializerMethodField(
@@ -144,13 +189,13 @@ class ServiceSerializer(serializers.ModelSerializer):
     class Meta:
         model = Service
         fields = (
-            "id", "title", "description", "details", "image",
+            "id", "title", "slug", "description", "details", "image",
             "features", "features_list", "pricing", "createdAt", "updatedAt",
             "order",
         )
 
 
-class TeamMemberSerializer(serializers.ModelSerializer):
+class TeamMemberSerializer(TranslatedFieldsMixin, serializers.ModelSerializer):
     """Serializer for TeamMember model with nested relationships"""
     social_links = SocialLinkSerializer(many=True, read_only=True)
     social = serializers.SerializerMethodField(
@@ -172,7 +217,7 @@ class TeamMemberSerializer(serializers.ModelSerializer):
         )
 
 
-class TestimonialSerializer(serializers.ModelSerializer):
+class TestimonialSerializer(TranslatedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Testimonial
         fields = (
@@ -188,7 +233,7 @@ class ContactInquirySerializer(serializers.ModelSerializer):
             "id", "fullName", "email", "phone", "company", "subject","order"
         )
 
-class HeaderNavLinkSerializer(serializers.ModelSerializer):
+class HeaderNavLinkSerializer(TranslatedFieldsMixin, serializers.ModelSerializer):
     """Recursive serializer for Header Navigation Links"""
     children = serializers.SerializerMethodField()
 
@@ -208,10 +253,15 @@ class HeaderNavLinkSerializer(serializers.ModelSerializer):
 
     def get_children(self, obj):
         """Recursively get active child links"""
-        children_qs = obj.children.filter(is_active=True).order_by("order", "id")
+        # {parent id: active children} of every link, loaded once by the viewset
+        load_children = self.context.get("nav_children")
+        if load_children is not None:
+            children_qs = load_children().get(obj.pk, [])
+        else:
+            children_qs = obj.children.filter(is_active=True).order_by("order", "id")
         return HeaderNavLinkSerializer(children_qs, many=True, context=self.context).data
 
-class FAQSerializer(serializers.ModelSerializer):
+class FAQSerializer(TranslatedFieldsMixin, serializers.ModelSerializer):
     """Serializer for FAQ model"""
     
     class Meta:
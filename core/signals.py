@@ -0,0 +1,5 @@
+from django.dispatch import Signal
+
+# Sent once per reorder after the new positions are committed.
+# Arguments: sender (the model class), pks (list of reordered primary keys)
+order_changed = Signal()
@@ -0,0 +1,115 @@
+"""
+Sitemap index and chunked sitemaps for the frontend's blog and portfolio
+pages, streamed from ``values()`` iterators (server-side cursors) and cached
+until the next BlogPost/PortfolioItem change.
+"""
+import math
+from xml.sax.saxutils import escape, quoteattr
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import Http404
+from django.urls import reverse
+
+from .cache import cached_stream, versioned_key
+from .models import BlogPost, PortfolioItem
+from .slugs import slug_columns
+
+CONTENT_TYPE = "application/xml; charset=utf-8"
+XML_HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n'
+
+
+class SitemapSection:
+    """One kind of frontend page; ``path`` is formatted with the row values, ``language`` and its ``slug``"""
+    name = None
+    model = None
+    path = None
+    fields = ("pk", "updatedAt")
+
+    def get_queryset(self):
+        return self.model._default_manager.all()
+
+    def location(self, language, row):
+        path = self.path.format(language=language, slug=row.get(f"slug_{language}") or row["pk"], **row)
+        return settings.FRONTEND_URL.rstrip("/") + path
+
+    def page_count(self):
+        return max(1, math.ceil(self.get_queryset().count() / settings.SITEMAP_CHUNK_SIZE))
+
+    def rows(self, page):
+        start = (page - 1) * settings.SITEMAP_CHUNK_SIZE
+        queryset = self.get_queryset().order_by("pk").values(*self.fields)
+        return queryset[start:start + settings.SITEMAP_CHUNK_SIZE].iterator(chunk_size=2000)
+
+
+class BlogSection(SitemapSection):
+    name = "blog"
+    model = BlogPost
+    path = "/{language}/blog/{slug}"
+    fields = ("pk", "updatedAt", *slug_columns())
+
+    def get_queryset(self):
+        return super().get_queryset().filter(status="published")
+
+
+class PortfolioSection(SitemapSection):
+    name = "portfolio"
+    model = PortfolioItem
+    path = "/{language}/portfolio/{slug}"
+    fields = ("pk", "updatedAt", *slug_columns())
+
+
+SECTIONS = {section.name: section for section in (BlogSection(), PortfolioSection())}
+CACHE_VERSIONS = tuple(section.model for section in SECTIONS.values())
+
+
+def page_count(section):
+    """Number of chunks of ``section``, cached along with the sitemaps themselves"""
+    key = versioned_key(CACHE_VERSIONS, "sitemap-pages", section.name, settings.SITEMAP_CHUNK_SIZE)
+    return cache.get_or_set(key, section.page_count, settings.SYNDICATION_CACHE_TIMEOUT)
+
+
+def sitemap_index(request):
+    """``sitemap.xml``: an index of every section chunk"""
+    key = versioned_key(CACHE_VERSIONS, "sitemap-index", request.get_host(), settings.SITEMAP_CHUNK_SIZE)
+
+    def stream():
+        yield XML_HEADER + '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+        for name, section in SECTIONS.items():
+            for page in range(1, page_count(section) + 1):
+                location = request.build_absolute_uri(reverse("sitemap-section", args=[name, page]))
+                yield f"<sitemap><loc>{escape(location)}</loc></sitemap>\n"
+        yield "</sitemapindex>\n"
+
+    return cached_stream(key, stream, CONTENT_TYPE, settings.SYNDICATION_CACHE_TIMEOUT)
+
+
+def sitemap_section(request, section, page):
+    """``sitemap-<section>-<page>.xml``: one URL per object and language, with hreflang alternates"""
+    if section not in SECTIONS or page < 1:
+        raise Http404
+    section = SECTIONS[section]
+    if page > page_count(section):
+        raise Http404
+    key = versioned_key(CACHE_VERSIONS, "sitemap", section.name, page, settings.SITEMAP_CHUNK_SIZE)
+
+    languages = [code for code, _ in settings.LANGUAGES]
+
+    def stream():
+        yield (
+            XML_HEADER
+            + '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" '
+            + 'xmlns:xhtml="http://www.w3.org/1999/xhtml">\n'
+        )
+        for row in section.rows(page):
+            locations = {language: section.location(language, row) for language in languages}
+            alternates = "".join(
+                f'<xhtml:link rel="alternate" hreflang="{language}" href={quoteattr(location)}/>'
+                for language, location in locations.items()
+            )
+            lastmod = row["updatedAt"].isoformat(timespec="seconds")
+            for location in locations.values():
+                yield f"<url><loc>{escape(location)}</loc><lastmod>{lastmod}</lastmod>{alternates}</url>\n"
+        yield "</urlset>\n"
+
+    return cached_stream(key, stream, CONTENT_TYPE, settings.SYNDICATION_CACHE_TIMEOUT)
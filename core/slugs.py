@@ -0,0 +1,62 @@
+"""
+Translated URL slugs.
+
+Every language column of a model's ``slug`` (``slug_en``, ``slug_az``, ...)
+is unique on its own, so ``/az/blog/<slug>`` resolves through one index. A
+slug is generated from the same language's title (falling back to the
+default language's) the first time the object is saved without one, and is
+left alone afterwards so published URLs stay stable.
+"""
+from django.db.models import Case, Q, Value, When
+from django.utils.text import slugify
+from modeltranslation.settings import AVAILABLE_LANGUAGES, DEFAULT_LANGUAGE
+from modeltranslation.utils import build_localized_fieldname, get_language
+
+
+def slug_columns(field_name="slug"):
+    return [build_localized_fieldname(field_name, language) for language in AVAILABLE_LANGUAGES]
+
+
+def unique_slug(queryset, column, value, max_length, exclude_pk=None):
+    """``value`` slugified, with ``-2``, ``-3``... appended if ``column`` already holds it"""
+    base = slugify(value, allow_unicode=True)[:max_length].strip("-") or queryset.model._meta.model_name
+    if base.isdigit():
+        # All-digit slugs would be taken for primary keys
+        base = f"{queryset.model._meta.model_name}-{base}"[:max_length]
+    taken = set(
+        queryset.exclude(pk=exclude_pk)
+        .filter(**{f"{column}__startswith": base[:max_length - 4]})
+        .values_list(column, flat=True)
+    )
+    slug, suffix = base, 1
+    while slug in taken:
+        suffix += 1
+        ending = f"-{suffix}"
+        slug = base[:max_length - len(ending)].rstrip("-") + ending
+    return slug
+
+
+def fill_slugs(instance, source="title", field_name="slug"):
+    """Generate the missing translated slugs of ``instance`` from its ``source`` field"""
+    model = type(instance)
+    max_length = model._meta.get_field(field_name).max_length
+    fallback = getattr(instance, build_localized_fieldname(source, DEFAULT_LANGUAGE)) or ""
+    for language in AVAILABLE_LANGUAGES:
+        column = build_localized_fieldname(field_name, language)
+        if not getattr(instance, column):
+            value = getattr(instance, build_localized_fieldname(source, language)) or fallback
+            setattr(instance, column, unique_slug(model._base_manager.all(), column, value, max_length, instance.pk))
+
+
+def slug_lookup(value, field_name="slug"):
+    """Q matching ``value`` in any language's slug column"""
+    condition = Q()
+    for column in slug_columns(field_name):
+        condition |= Q(**{column: value})
+    return condition
+
+
+def slug_preference(value, field_name="slug", language=None):
+    """Ordering that puts a match in the active language's slug column first"""
+    column = build_localized_fieldname(field_name, language or get_language())
+    return Case(When(**{column: value}, then=Value(0)), default=Value(1))
@@ -0,0 +1,133 @@
+/*
+ * Direct-to-bucket multipart uploads for admin image fields.
+ *
+ * On file selection: ask the admin for presigned part URLs, PUT the parts in
+ * parallel, complete the upload and put the returned token into the hidden
+ * "<name>__upload" input. The file input is cleared so the form submits only
+ * the token.
+ */
+(function () {
+  "use strict";
+
+  const CONCURRENCY = 4;
+  const RETRIES = 3;
+  const pending = new Set();
+
+  function csrfToken(form) {
+    const input = form.querySelector("input[name=csrfmiddlewaretoken]");
+    return input ? input.value : "";
+  }
+
+  async function postJSON(url, body, form) {
+    const response = await fetch(url, {
+      method: "POST",
+      credentials: "same-origin",
+      headers: { "Content-Type": "application/json", "X-CSRFToken": csrfToken(form) },
+      body: JSON.stringify(body),
+    });
+    const data = await response.json();
+    if (!response.ok) {
+      throw new Error(data.error || response.statusText);
+    }
+    return data;
+  }
+
+  async function putPart(url, blob) {
+    for (let attempt = 1; ; attempt++) {
+      try {
+        const response = await fetch(url, { method: "PUT", body: blob });
+        if (response.ok) {
+          return response.headers.get("ETag");
+        }
+        if (attempt >= RETRIES) {
+          throw new Error("Part upload failed: " + response.status);
+        }
+      } catch (error) {
+        if (attempt >= RETRIES) {
+          throw error;
+        }
+      }
+    }
+  }
+
+  async function uploadParts(file, upload, onProgress) {
+    const parts = new Array(upload.urls.length);
+    let next = 0;
+    let done = 0;
+
+    async function worker() {
+      while (next < upload.urls.length) {
+        const index = next++;
+        const start = index * upload.part_size;
+        const etag = await putPart(upload.urls[index], file.slice(start, start + upload.part_size));
+        parts[index] = { PartNumber: index + 1, ETag: etag };
+        onProgress(++done, upload.urls.length);
+      }
+    }
+
+    const workers = Math.min(CONCURRENCY, upload.urls.length);
+    await Promise.all(Array.from({ length: workers }, worker));
+    return parts;
+  }
+
+  async function handle(input) {
+    const file = input.files[0];
+    const hidden = input.form.querySelector('input[name="' + input.name + '__upload"]');
+    if (!file || !hidden) {
+      return;
+    }
+
+    const status = input.nextElementSibling && input.nextElementSibling.classList.contains("direct-upload-status")
+      ? input.nextElementSibling
+      : input.insertAdjacentElement("afterend", document.createElement("span"));
+    status.className = "direct-upload-status help";
+    hidden.value = "";
+    pending.add(input);
+
+    const field = input.dataset.directUploadField;
+    let upload = null;
+    try {
+      upload = await postJSON(input.dataset.directUploadStart, {
+        field: field,
+        filename: file.name,
+        size: file.size,
+        contentType: file.type,
+      }, input.form);
+      const parts = await uploadParts(file, upload, function (done, total) {
+        status.textContent = " Uploading… " + Math.round((done / total) * 100) + "%";
+      });
+      const completed = await postJSON(input.dataset.directUploadComplete, {
+        field: field,
+        token: upload.token,
+        parts: parts,
+      }, input.form);
+      hidden.value = completed.token;
+      input.value = "";
+      status.textContent = " Uploaded " + file.name;
+    } catch (error) {
+      status.textContent = " Upload failed: " + error.message;
+      if (upload) {
+        postJSON(input.dataset.directUploadAbort, { field: field, token: upload.token }, input.form)
+          .catch(function () {});
+      }
+    } finally {
+      pending.delete(input);
+    }
+  }
+
+  document.addEventListener("change", function (event) {
+    if (event.target.matches("input[type=file][data-direct-upload-start]")) {
+      handle(event.target);
+    }
+  });
+
+  document.addEventListener("submit", function (event) {
+    for (const input of pending) {
+      if (input.form === event.target) {
+        event.preventDefault();
+        window.alert("Please wait until the image upload has finished.");
+        return;
+      }
+    }
+  }, true);
+})();
@@ -0,0 +1,104 @@
+"""
+Static files storage writing content-hashed names plus precompressed
+``.gz``/``.br`` siblings, so nginx can serve them as immutable with
+``gzip_static``/``brotli_static``.
+
+Deploys are incremental: source hashes are cached by (path, size, mtime) in
+``STATIC_ROOT`` and a hashed file is only compressed when its siblings are
+missing (a hashed name always denotes the same content).
+"""
+import gzip
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+
+try:
+    import brotli
+except ImportError:  # .br siblings are skipped without the optional dependency
+    brotli = None
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """ManifestStaticFilesStorage that also precompresses the hashed files"""
+    hash_cache_name = "staticfiles.hashes.json"
+    compress_extensions = (
+        ".css", ".js", ".mjs", ".map", ".json", ".svg", ".txt", ".html", ".xml", ".ico", ".ttf", ".otf", ".eot",
+    )
+    # Below this size the compressed response is not worth a second file
+    min_compress_size = 512
+    # Keep a compressed sibling only if it saves at least 5%
+    max_compress_ratio = 0.95
+
+    def post_process(self, paths, dry_run=False, **options):
+        if dry_run:
+            return
+        self._hash_cache = self.load_hash_cache()
+        hashed_names = []
+        try:
+            for name, hashed_name, processed in super().post_process(paths, dry_run, **options):
+                if hashed_name and not isinstance(processed, Exception):
+                    hashed_names.append(hashed_name)
+                yield name, hashed_name, processed
+        finally:
+            self.save_hash_cache()
+        self.compress_files(hashed_names)
+
+    # --- incremental hashing ---
+
+    def load_hash_cache(self):
+        try:
+            with open(self.path(self.hash_cache_name)) as handle:
+                return json.load(handle)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def save_hash_cache(self):
+        path = self.path(self.hash_cache_name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + ".tmp", "w") as handle:
+            json.dump(self._hash_cache, handle)
+        os.replace(path + ".tmp", path)
+
+    def file_hash(self, name, content=None):
+        source = getattr(content, "name", None)
+        cache = getattr(self, "_hash_cache", None)
+        if cache is None or not isinstance(source, str) or not os.path.isfile(source):
+            # In-memory content, e.g. CSS after url() rewriting
+            return super().file_hash(name, content)
+
+        stat = os.stat(source)
+        signature = [stat.st_size, stat.st_mtime_ns]
+        cached = cache.get(source)
+        if cached and cached[:2] == signature:
+            return cached[2]
+        file_hash = super().file_hash(name, content)
+        cache[source] = signature + [file_hash]
+        return file_hash
+
+    # --- precompression ---
+
+    def compress_files(self, names):
+        names = [name for name in set(names) if name.lower().endswith(self.compress_extensions)]
+        with ThreadPoolExecutor() as executor:
+            # zlib and brotli release the GIL while compressing
+            list(executor.map(self.compress_file, names))
+
+    def compress_file(self, name):
+        path = self.path(name)
+        encoders = [(".gz", lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+        if brotli is not None:
+            encoders.append((".br", lambda data: brotli.compress(data, quality=11)))
+
+        missing = [(suffix, encode) for suffix, encode in encoders if not os.path.exists(path + suffix)]
+        if not missing or os.path.getsize(path) < self.min_compress_size:
+            return
+        with open(path, "rb") as handle:
+            data = handle.read()
+        for suffix, encode in missing:
+            compressed = encode(data)
+            if len(compressed) <= len(data) * self.max_compress_ratio:
+                with open(path + suffix + ".tmp", "wb") as handle:
+                    handle.write(compressed)
+                os.replace(path + suffix + ".tmp", path + suffix)
@@ -1,16 +1,74 @@
+import csv
+import gzip
 import json
-from django.test import TestCase, Client
+import os
+import shutil
+import tempfile
+import time
+import zipfile
+from io import BytesIO, StringIO
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock, skipUnless
+
+import requests
+from django.conf import settings
+from django.contrib import admin
+from django.core import signing
+from django.core.cache import cache
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.db import OperationalError, connection
+from django.db.models import QuerySet
+from django.http import HttpResponse
+from django.test import TestCase, TransactionTestCase, Client, RequestFactory, SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.contrib.auth import get_user_model
 from django.utils import timezone, translation
+from django.utils.translation import gettext_lazy
+from PIL import Image
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
-from datetime import date, datetime
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from datetime import date, datetime, timezone as dt_timezone
+from decimal import Decimal
+from zoneinfo import ZoneInfo
 
+from backend import gunicorn_conf
+from .admin_utils import EstimatedCountPaginator, bulk_update_order
+from .cache import cached_response
+from .compression import negotiate
+from .counts import counts, rebuild_counts
+from .management.commands import warm_cache
+from .filters import ExistsSearchFilter
+from .i18n import defer_inactive_translations
+from .json_sql import TeamMemberDatabaseJSONSerializer
+from .middleware import FullStackCsrfViewMiddleware
+from .navigation import adjacent_posts
+from .purge import PurgeQueue, purge_queue, send_purge
+from .renderers import ORJSONParser, ORJSONRenderer, orjson
+from . import replicas
+from .signals import order_changed
 from .models import (
-    BlogPost, PortfolioItem, Service, TeamMember, Testimonial, ContactInquiry,
-    Tag, Technology, ServiceFeature, SocialLink
+    BlogPost, RelatedPost, PortfolioItem, Service, TeamMember, Testimonial, ContactInquiry,
+    Tag, Technology, ServiceFeature, SocialLink, Category, PortfolioCategory, FAQ, HeaderNavLink
 )
+from .schema import _schemas as schema_cache, code_version, generate_schema
+from .storage import CompressedManifestStaticFilesStorage, brotli
+from .uploads import DirectUploadWidget, resolve_stored_name
+from .views import BlogPostViewSet, FAQViewSet, ServiceViewSet, TeamMemberViewSet, TestimonialViewSet
+
+try:
+    from moto import mock_aws
+    from storages.backends.s3boto3 import S3Boto3Storage
+except ImportError:  # optional test dependencies
+    mock_aws = None
 
 User = get_user_model()
 
@@ -269,6 +327,9 @@ class ModelTests(TestCase, BaseTestSetup):
 # API ENDPOINT TESTS
 # =============================================================================
 
+# These tests inspect response.data and change rows between requests inside one
+# transaction (so no on_commit version bump): they need uncached responses
+@override_settings(API_CACHE_TIMEOUT=0)
 class BlogPostAPITests(APITestCase, BaseTestSetup):
     """Test cases for BlogPost API endpoints"""
     
@@ -395,6 +456,7 @@ class BlogPostAPITests(APITestCase, BaseTestSetup):
         self.assertEqual(response.data['results'][0]['title'], 'Tech Post')
 
 
+@override_settings(API_CACHE_TIMEOUT=0)
 class PortfolioItemAPITests(APITestCase, BaseTestSetup):
     """Test cases for PortfolioItem API endpoints"""
     
@@ -455,6 +517,7 @@ class PortfolioItemAPITests(APITestCase, BaseTestSetup):
         self.assertEqual(response.data['results'][0]['category'], 'Web Development')
 
 
+@override_settings(API_CACHE_TIMEOUT=0)
 class ServiceAPITests(APITestCase, BaseTestSetup):
     """Test cases for Service API endpoints"""
     
@@ -503,6 +566,7 @@ class ServiceAPITests(APITestCase, BaseTestSetup):
         self.assertEqual(len(response.data['results']), 1)
 
 
+@override_settings(API_CACHE_TIMEOUT=0)
 class TeamMemberAPITests(APITestCase, BaseTestSetup):
     """Test cases for TeamMember API endpoints"""
     
@@ -545,6 +609,7 @@ class TeamMemberAPITests(APITestCase, BaseTestSetup):
         self.assertEqual(response.data['social']['linkedin'], 'https://linkedin.com/in/test')
 
 
+@override_settings(API_CACHE_TIMEOUT=0)
 class TestimonialAPITests(APITestCase, BaseTestSetup):
     """Test cases for Testimonial API endpoints"""
     
@@ -601,6 +666,7 @@ class ContactInquiryAPITests(APITestCase, BaseTestSetup):
 # TRANSLATION TESTS
 # =============================================================================
 
+@override_settings(API_CACHE_TIMEOUT=0)
 class TranslationTests(APITestCase, BaseTestSetup):
     """Test cases for model translations"""
     
@@ -870,3 +936,1799 @@ class TranslationTests(APITestCase, BaseTestSetup):
             
             self.assertEqual(response.status_code, status.HTTP_200_OK)
             self.assertEqual(len(response.data['results']), 1)
+
+
+# =============================================================================
+# SEARCH TESTS
+# =============================================================================
+
+class ExistsSearchFilterTests(APITestCase, BaseTestSetup):
+    """Test cases for EXISTS-based search over related names"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.post = BlogPost.objects.create(
+            title='ORM Notes', content='Body', date=date.today(), status='published'
+        )
+        self.post.tags.set([
+            self.create_tag(name='Django Tips', slug='django-tips'),
+            self.create_tag(name='Django ORM', slug='django-orm'),
+        ])
+        self.post.categories.set([
+            Category.objects.create(name='Django'),
+            Category.objects.create(name='Django Internals', order=1),
+        ])
+        BlogPost.objects.create(title='Unrelated', content='Body', date=date.today())
+
+    def test_related_matches_return_one_row_per_post(self):
+        """Several matching tags and categories must not duplicate the post"""
+        response = self.client.get(reverse('blog-list'), {'search': 'Django'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item['id'] for item in response.data], [self.post.pk])
+
+    def test_search_uses_exists_without_distinct(self):
+        """Related lookups become correlated EXISTS clauses, not joins plus DISTINCT"""
+        request = Request(APIRequestFactory().get('/', {'search': 'Django'}))
+        view = BlogPostViewSet(request=request, format_kwarg=None, action='list')
+        queryset = ExistsSearchFilter().filter_queryset(request, view.get_queryset(), view)
+        sql = str(queryset.query).upper()
+
+        self.assertIn('EXISTS', sql)
+        self.assertNotIn('DISTINCT', sql)
+        self.assertEqual(list(queryset), [self.post])
+
+    def test_reverse_foreign_key_search(self):
+        """Reverse FK names (service features) are searchable"""
+        service = Service.objects.create(title='Hosting')
+        ServiceFeature.objects.create(service=service, name='Backups', order=1)
+        ServiceFeature.objects.create(service=service, name='Nightly backups', order=2)
+        Service.objects.create(title='Design')
+
+        response = self.client.get(reverse('services-list'), {'search': 'backups'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item['id'] for item in response.json()], [service.pk])
+
+
+class TranslationProjectionTests(APITestCase, BaseTestSetup):
+    """Test cases for loading only the active language's translation columns"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.post = BlogPost.objects.create(
+            title='English Title', content='English content', date=date.today(), status='published'
+        )
+        self.post.title_az = 'Azərbaycan başlığı'
+        self.post.content_ru = 'Русский текст'
+        self.post.save()
+        self.post.categories.set([Category.objects.create(name='News')])
+
+    def test_inactive_columns_are_deferred(self):
+        """Only the active language and its fallback are loaded"""
+        with translation.override('az'):
+            post = defer_inactive_translations(BlogPost.objects.all()).get(pk=self.post.pk)
+
+        deferred = post.get_deferred_fields()
+        self.assertIn('content_ru', deferred)
+        self.assertIn('content', deferred)
+        self.assertNotIn('content_az', deferred)
+        self.assertNotIn('content_en', deferred)
+
+    def test_projected_values_and_fallback_without_extra_queries(self):
+        """Translated values and fallbacks render from the projected row"""
+        url = reverse('blog-detail', kwargs={'pk': self.post.pk})
+        # post, tags, categories - no per-row refetch
+        with self.assertNumQueries(3):
+            response = self.client.get(url, HTTP_ACCEPT_LANGUAGE='az')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['title'], 'Azərbaycan başlığı')
+        self.assertEqual(response.data['content'], 'English content')
+        self.assertEqual(response.data['categories'][0]['name'], 'News')
+
+
+class AllLanguagesResponseTests(APITestCase, BaseTestSetup):
+    """Test cases for ?lang=all multi-language responses"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.post = BlogPost.objects.create(
+            title='English Title', content='English content', date=date.today(), status='published'
+        )
+        self.post.title_az = 'Azərbaycan başlığı'
+        self.post.title_ru = 'Русский заголовок'
+        self.post.save()
+        category = Category.objects.create(name='News')
+        category.name_ru = 'Новости'
+        category.save()
+        self.post.categories.set([category])
+
+    def test_translated_fields_hold_every_language(self):
+        """Each translated field maps language -> value, with fallbacks applied"""
+        url = reverse('blog-detail', kwargs={'pk': self.post.pk})
+        response = self.client.get(url, {'lang': 'all'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['title'], {
+            'en': 'English Title', 'az': 'Azərbaycan başlığı', 'ru': 'Русский заголовок',
+        })
+        self.assertEqual(response.data['content'], {
+            'en': 'English content', 'az': 'English content', 'ru': 'English content',
+        })
+        self.assertEqual(response.data['categories'][0]['name'], {'en': 'News', 'az': 'News', 'ru': 'Новости'})
+        self.assertEqual(response.data['categories_list'], {'en': ['News'], 'az': ['News'], 'ru': ['Новости']})
+        self.assertEqual(response.data['date'], self.post.date.isoformat())
+
+    def test_portfolio_category_list_holds_every_language(self):
+        """categories_list follows the translated names; untranslated technology names stay a list"""
+        item = PortfolioItem.objects.create(title='Site')
+        item.categories.set([PortfolioCategory.objects.create(name='Web', name_az='Veb')])
+        item.technologies.set([Technology.objects.create(name='Django')])
+
+        response = self.client.get(reverse('portfolio-detail', kwargs={'pk': item.pk}), {'lang': 'all'})
+
+        self.assertEqual(response.data['categories_list'], {'en': ['Web'], 'az': ['Veb'], 'ru': ['Web']})
+        self.assertEqual(response.data['technologies_list'], ['Django'])
+
+    def test_single_query_pass(self):
+        """All languages come from the same queries as a single-language response"""
+        url = reverse('blog-list')
+        with self.assertNumQueries(3):
+            self.client.get(url, {'lang': 'all'})
+
+
+# =============================================================================
+# ADMIN TESTS
+# =============================================================================
+
+class AdminChangelistTests(TestCase, BaseTestSetup):
+    """Test cases for admin changelist query efficiency"""
+
+    def setUp(self):
+        self.admin_user = User.objects.create_superuser('admin', 'admin@example.com', 'password-123')
+        self.client.force_login(self.admin_user)
+
+    def create_objects(self, index):
+        """Create one related object graph per registered model"""
+        tag = self.create_tag(name=f'Tag {index}', slug=f'tag-{index}')
+        tech = self.create_technology(name=f'Tech {index}', slug=f'tech-{index}')
+        category = Category.objects.create(name=f'Category {index}', order=index)
+        portfolio_category = PortfolioCategory.objects.create(name=f'PC {index}', slug=f'pc-{index}', order=index)
+        post = BlogPost.objects.create(
+            title=f'Post {index}', content='Body', date=date.today(), order=index,
+            author=self.create_user(username=f'author{index}'),
+        )
+        post.tags.set([tag])
+        post.categories.set([category])
+        item = PortfolioItem.objects.create(title=f'Item {index}', client=f'Client {index}', order=index)
+        item.technologies.set([tech])
+        item.categories.set([portfolio_category])
+        service = Service.objects.create(title=f'Service {index}', order=index)
+        ServiceFeature.objects.create(service=service, name='Feature', order=1)
+        member = self.create_team_member(name=f'Member {index}', role=f'Role {index}', order=index)
+        SocialLink.objects.create(team_member=member, platform='github', url='https://github.com/x', order=1)
+        self.create_testimonial(name=f'Client {index}', role=f'Role {index}', order=index)
+        self.create_contact_inquiry(fullName=f'Person {index}', order=index)
+        FAQ.objects.create(question=f'Question {index}', answer='Answer', order=index)
+        parent = HeaderNavLink.objects.create(title=f'Parent {index}', url='/', order=index)
+        HeaderNavLink.objects.create(title=f'Child {index}', url='/child', parent=parent, order=index)
+
+    def changelist_query_counts(self):
+        counts = {}
+        for model, model_admin in admin.site._registry.items():
+            if model._meta.app_label != 'core':
+                continue
+            url = reverse(f'admin:core_{model._meta.model_name}_changelist')
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200, url)
+            counts[model._meta.label] = len(queries)
+        return counts
+
+    def test_changelist_queries_do_not_grow_with_rows(self):
+        """Every core changelist renders in the same number of queries for 2 and 6 rows"""
+        for index in range(2):
+            self.create_objects(index)
+        cache.clear()
+        small = self.changelist_query_counts()
+
+        for index in range(2, 6):
+            self.create_objects(index)
+        cache.clear()
+        large = self.changelist_query_counts()
+
+        self.assertEqual(small, large)
+
+    def test_filter_choices_are_cached(self):
+        """Relation and value filters do not re-query their choices"""
+        self.create_objects(0)
+        cache.clear()
+        url = reverse('admin:core_blogpost_changelist')
+        with CaptureQueriesContext(connection) as first:
+            self.client.get(url)
+        with CaptureQueriesContext(connection) as second:
+            self.client.get(url)
+
+        self.assertLess(len(second), len(first))
+
+    def test_estimated_count_above_threshold(self):
+        """Large tables are counted from planner statistics instead of COUNT(*)"""
+        for index in range(30):
+            self.create_contact_inquiry(fullName=f'Person {index}')
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE core_contactinquiry')
+
+        with self.settings(ADMIN_ESTIMATED_COUNT_THRESHOLD=10):
+            paginator = EstimatedCountPaginator(ContactInquiry.objects.all(), 10)
+            with CaptureQueriesContext(connection) as queries:
+                count = paginator.count
+
+        self.assertEqual(count, 30)
+        self.assertNotIn('COUNT(', queries[0]['sql'].upper())
+
+    def test_exact_count_below_threshold(self):
+        """Small results keep exact counts"""
+        self.create_contact_inquiry(status='handled')
+        self.create_contact_inquiry()
+
+        paginator = EstimatedCountPaginator(ContactInquiry.objects.filter(status='handled'), 10)
+
+        self.assertEqual(paginator.count, 1)
+
+
+class BulkReorderTests(TestCase, BaseTestSetup):
+    """Test cases for single-statement admin reordering"""
+
+    def setUp(self):
+        self.admin_user = User.objects.create_superuser('admin', 'admin@example.com', 'password-123')
+        self.client.force_login(self.admin_user)
+        self.faqs = [
+            FAQ.objects.create(question=f'Question {index}', answer='Answer', order=index)
+            for index in range(1, 6)
+        ]
+        self.signals = []
+        order_changed.connect(self.record_signal)
+        self.addCleanup(order_changed.disconnect, self.record_signal)
+
+    def record_signal(self, sender, pks, **kwargs):
+        self.signals.append((sender, sorted(pks)))
+
+    def test_drag_and_drop_is_one_update(self):
+        """A drag-and-drop reorder issues a single UPDATE and a single signal"""
+        items = [[self.faqs[4].pk, 1], [self.faqs[0].pk, 2], [self.faqs[1].pk, 3],
+                 [self.faqs[2].pk, 4], [self.faqs[3].pk, 5]]
+        url = reverse('admin:core_faq_sortable_update')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(url, json.dumps({'updatedItems': items}),
+                                            content_type='application/json')
+
+        self.assertEqual(response.status_code, 200)
+        updates = [query for query in queries if query['sql'].startswith('UPDATE "core_faq"')]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(
+            list(FAQ.objects.order_by('order').values_list('question', flat=True)),
+            ['Question 5', 'Question 1', 'Question 2', 'Question 3', 'Question 4'],
+        )
+        self.assertEqual(self.signals, [(FAQ, sorted(pk for pk, _ in items))])
+
+    def test_move_item_shifts_rows_in_bulk(self):
+        """Moving one item shifts the rows in between with the same statement"""
+        model_admin = admin.site._registry[FAQ]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            moved = model_admin._move_item(1, 3, {})
+
+        self.assertEqual(moved, {self.faqs[1].pk: 1, self.faqs[2].pk: 2, self.faqs[0].pk: 3})
+        self.assertEqual(
+            list(FAQ.objects.order_by('order').values_list('question', flat=True)),
+            ['Question 2', 'Question 3', 'Question 1', 'Question 4', 'Question 5'],
+        )
+        self.assertEqual(len(self.signals), 1)
+
+    def test_move_to_page_is_one_update(self):
+        """The "move to page" action applies every selected object's move with one UPDATE and one signal"""
+        model_admin = admin.site._registry[FAQ]
+        url = reverse('admin:core_faq_changelist') + '?p=1'
+        data = {'action': 'move_to_last_page', '_selected_action': [self.faqs[0].pk, self.faqs[1].pk]}
+
+        with mock.patch.object(model_admin, 'list_per_page', 2), self.captureOnCommitCallbacks(execute=True):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(url, data)
+
+        self.assertEqual(response.status_code, 302)
+        updates = [query for query in queries if query['sql'].startswith('UPDATE "core_faq"')]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(
+            list(FAQ.objects.order_by('order').values_list('question', flat=True)),
+            ['Question 3', 'Question 4', 'Question 5', 'Question 1', 'Question 2'],
+        )
+        self.assertEqual(self.signals, [(FAQ, sorted(faq.pk for faq in self.faqs))])
+
+    def test_move_item_rejects_duplicate_positions(self):
+        """Two rows at the moved position raise MultipleObjectsReturned, as adminsortable2 does"""
+        FAQ.objects.filter(pk=self.faqs[1].pk).update(order=1)
+        with self.assertRaisesMessage(FAQ.MultipleObjectsReturned, 'manage.py reorder core.FAQ'):
+            admin.site._registry[FAQ]._move_item(1, 3, {})
+        self.assertEqual(self.signals, [])
+
+    def test_reorder_touches_updated_at(self):
+        """Bulk reorders bump updatedAt of the rows they move, as save() would"""
+        before = dict(FAQ.objects.values_list('pk', 'updatedAt'))
+        bulk_update_order(FAQ, [(self.faqs[0].pk, 2), (self.faqs[1].pk, 1), (self.faqs[2].pk, 3)])
+
+        after = dict(FAQ.objects.values_list('pk', 'updatedAt'))
+        self.assertGreater(after[self.faqs[0].pk], before[self.faqs[0].pk])
+        self.assertGreater(after[self.faqs[1].pk], before[self.faqs[1].pk])
+        self.assertEqual(after[self.faqs[2].pk], before[self.faqs[2].pk])
+
+
+@skipUnless(mock_aws, 'moto is required for the S3 stand-in')
+@override_settings(DIRECT_UPLOADS=True, DIRECT_UPLOAD_PART_SIZE=5 * 1024 * 1024)
+class DirectUploadTests(TestCase, BaseTestSetup):
+    """Test cases for presigned multipart admin uploads against a mocked S3"""
+
+    def setUp(self):
+        aws = mock_aws()
+        aws.start()
+        self.addCleanup(aws.stop)
+        self.storage = S3Boto3Storage(
+            bucket_name='uploads', region_name='us-east-1', access_key='testing', secret_key='testing',
+        )
+        self.storage.connection.meta.client.create_bucket(Bucket='uploads')
+        self.field = BlogPost._meta.get_field('image')
+        patcher = mock.patch.object(self.field, 'storage', self.storage)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.admin_user = User.objects.create_superuser('admin', 'admin@example.com', 'password-123')
+        self.client.force_login(self.admin_user)
+
+    def post_step(self, step, payload):
+        url = reverse('admin:core_blogpost_direct_upload', args=[step])
+        return self.client.post(url, json.dumps(payload), content_type='application/json')
+
+    def image_bytes(self, size):
+        """A valid PNG padded to ``size`` bytes; Pillow stops reading at its end chunk"""
+        buffer = BytesIO()
+        Image.new('RGB', (8, 8), 'red').save(buffer, 'PNG')
+        return buffer.getvalue() + os.urandom(size - buffer.tell())
+
+    def put_parts(self, upload, content):
+        def put(index):
+            start = index * upload['part_size']
+            response = requests.put(upload['urls'][index], data=content[start:start + upload['part_size']])
+            response.raise_for_status()
+            return {'PartNumber': index + 1, 'ETag': response.headers['ETag']}
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            return list(executor.map(put, range(len(upload['urls']))))
+
+    def test_parallel_parts_are_assembled(self):
+        """Parts PUT in parallel to presigned URLs are completed into one object"""
+        content = self.image_bytes(11 * 1024 * 1024)
+
+        upload = self.post_step('start', {'field': 'image', 'filename': 'large.png', 'size': len(content)}).json()
+        self.assertEqual(len(upload['urls']), 3)
+        parts = self.put_parts(upload, content)
+        client = self.storage.connection.meta.client
+        with mock.patch.object(client, 'get_object', wraps=client.get_object) as get_object:
+            response = self.post_step('complete', {'field': 'image', 'token': upload['token'], 'parts': parts})
+
+        self.assertEqual(response.status_code, 200)
+        # Validation reads the image header, not the whole object
+        get_object.assert_called_once()
+        self.assertEqual(get_object.call_args.kwargs['Range'], 'bytes=0-65535')
+        name = resolve_stored_name(response.json()['token'], 'core.blogpost.image')
+        self.assertTrue(name.startswith('blog_images/'))
+        with self.storage.open(name) as stored:
+            self.assertEqual(stored.read(), content)
+
+    def test_form_records_uploaded_key(self):
+        """The admin form takes the stored key from the signed token, not a file"""
+        content = self.image_bytes(1024)
+        upload = self.post_step('start', {'field': 'image', 'filename': 'small.png', 'size': len(content)}).json()
+        completed = self.post_step('complete', {
+            'field': 'image', 'token': upload['token'], 'parts': self.put_parts(upload, content),
+        }).json()
+
+        request = RequestFactory().get('/')
+        request.user = self.admin_user
+        formfield = admin.site._registry[BlogPost].formfield_for_dbfield(self.field, request)
+        name = formfield.widget.value_from_datadict({'image__upload': completed['token']}, {}, 'image')
+
+        self.assertIsInstance(formfield.widget, DirectUploadWidget)
+        self.assertEqual(formfield.clean(name), name)
+        stored = self.storage.connection.meta.client.head_object(Bucket='uploads', Key=name)
+        self.assertEqual(stored['ContentLength'], len(content))
+
+    def test_tampered_token_is_rejected(self):
+        """A token for another field or with a bad signature fails validation"""
+        request = RequestFactory().get('/')
+        request.user = self.admin_user
+        formfield = admin.site._registry[BlogPost].formfield_for_dbfield(self.field, request)
+        foreign = signing.dumps({'field': 'core.service.image', 'name': 'x.png'}, salt='core.uploads.stored')
+
+        for token in ('garbage', foreign):
+            value = formfield.widget.value_from_datadict({'image__upload': token}, {}, 'image')
+            with self.assertRaises(ValidationError):
+                formfield.clean(value)
+
+    def test_non_image_is_rejected_and_deleted(self):
+        """A completed object that is not an image gets a 400 and is removed from the bucket"""
+        for content, content_type in ((b'not an image' * 100, ''), (self.image_bytes(1024), 'text/html')):
+            with self.subTest(content_type=content_type):
+                upload = self.post_step('start', {
+                    'field': 'image', 'filename': 'fake.png', 'size': len(content), 'contentType': content_type,
+                }).json()
+
+                response = self.post_step('complete', {
+                    'field': 'image', 'token': upload['token'], 'parts': self.put_parts(upload, content),
+                })
+
+                self.assertEqual(response.status_code, 400)
+                self.assertNotIn('token', response.json())
+                stored = self.storage.connection.meta.client.list_objects_v2(Bucket='uploads')
+                self.assertEqual(stored.get('Contents', []), [])
+
+    def test_abort_discards_parts(self):
+        """Aborting removes the pending multipart upload"""
+        upload = self.post_step('start', {'field': 'image', 'filename': 'a.jpg', 'size': 10}).json()
+
+        response = self.post_step('abort', {'field': 'image', 'token': upload['token']})
+
+        self.assertEqual(response.status_code, 200)
+        pending = self.storage.connection.meta.client.list_multipart_uploads(Bucket='uploads')
+        self.assertEqual(pending.get('Uploads', []), [])
+
+    def test_invalid_requests_are_rejected(self):
+        """Oversized files and non-image fields get a 400"""
+        with self.settings(DIRECT_UPLOAD_MAX_SIZE=100):
+            self.assertEqual(self.post_step('start', {'field': 'image', 'filename': 'a.jpg', 'size': 101}).status_code, 400)
+        self.assertEqual(self.post_step('start', {'field': 'title', 'filename': 'a.jpg', 'size': 1}).status_code, 400)
+
+
+# =============================================================================
+# STATIC FILES TESTS
+# =============================================================================
+
+class CompressedStaticFilesTests(TestCase):
+    """Test cases for hashed, precompressed collectstatic output"""
+
+    def setUp(self):
+        source = tempfile.TemporaryDirectory()
+        target = tempfile.TemporaryDirectory()
+        self.addCleanup(source.cleanup)
+        self.addCleanup(target.cleanup)
+        self.source = FileSystemStorage(location=source.name)
+        self.source.save('app/app.js', ContentFile(b'console.log("creadive");\n' * 100))
+        self.source.save('app/app.css', ContentFile(b'body { background: url("bg.png"); }\n' * 100))
+        self.source.save('app/bg.png', ContentFile(os.urandom(2048)))
+        self.target_location = target.name
+
+    def collect(self):
+        """Copy and post-process the source files the way collectstatic does"""
+        storage = CompressedManifestStaticFilesStorage(location=self.target_location)
+        paths = {}
+        for name in ('app/app.js', 'app/app.css', 'app/bg.png'):
+            if not storage.exists(name):
+                with self.source.open(name) as source_file:
+                    storage.save(name, source_file)
+            paths[name] = (self.source, name)
+        processed = list(storage.post_process(paths))
+        for _, _, result in processed:
+            self.assertNotIsInstance(result, Exception)
+        return storage
+
+    def test_hashed_files_get_compressed_siblings(self):
+        """Text assets get .gz/.br siblings of their hashed names, images do not"""
+        storage = self.collect()
+        js = storage.path(storage.stored_name('app/app.js'))
+        css = storage.path(storage.stored_name('app/app.css'))
+        png = storage.path(storage.stored_name('app/bg.png'))
+
+        self.assertRegex(js, r'app\.[0-9a-f]{12}\.js$')
+        with open(js, 'rb') as plain, gzip.open(js + '.gz') as compressed:
+            self.assertEqual(compressed.read(), plain.read())
+        self.assertTrue(os.path.exists(css + '.gz'))
+        if brotli is not None:
+            with open(css, 'rb') as plain, open(css + '.br', 'rb') as compressed:
+                self.assertEqual(brotli.decompress(compressed.read()), plain.read())
+        self.assertFalse(os.path.exists(png + '.gz'))
+
+    def test_unchanged_files_are_not_rehashed_or_recompressed(self):
+        """A second run reuses cached source hashes and existing siblings"""
+        self.collect()
+
+        original_hash = ManifestStaticFilesStorage.file_hash
+        with mock.patch('django.contrib.staticfiles.storage.HashedFilesMixin.file_hash',
+                        autospec=True, side_effect=original_hash) as file_hash, \
+                mock.patch('gzip.compress') as compress:
+            storage = self.collect()
+
+        hashed_sources = [call.args[2] for call in file_hash.call_args_list]
+        # Only the rewritten CSS (in-memory content) is hashed again
+        self.assertTrue(all(isinstance(content, ContentFile) for content in hashed_sources))
+        compress.assert_not_called()
+        self.assertRegex(storage.stored_name('app/app.js'), r'app\.[0-9a-f]{12}\.js$')
+
+
+# =============================================================================
+# SERVER CONFIGURATION TESTS
+# =============================================================================
+
+class GunicornConfigTests(SimpleTestCase):
+    """Test cases for container-aware gunicorn sizing"""
+
+    def make_cgroup(self, files):
+        root = tempfile.TemporaryDirectory()
+        self.addCleanup(root.cleanup)
+        for name, content in files.items():
+            path = os.path.join(root.name, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as handle:
+                handle.write(content)
+        return root.name
+
+    def test_cgroup_v2_limits(self):
+        """cpu.max quota/period and memory.max are read from cgroup v2"""
+        root = self.make_cgroup({'cpu.max': '150000 100000\n', 'memory.max': str(1024 * 1024 * 1024)})
+
+        with mock.patch('os.sched_getaffinity', return_value=set(range(8))):
+            self.assertEqual(gunicorn_conf.cpu_limit(root), 1.5)
+        self.assertEqual(gunicorn_conf.memory_limit(root), 1024)
+
+    def test_cgroup_v1_and_unlimited(self):
+        """Unlimited quotas fall back to the visible CPUs and no memory cap"""
+        root = self.make_cgroup({
+            'cpu/cpu.cfs_quota_us': '-1', 'cpu/cpu.cfs_period_us': '100000',
+            'memory/memory.limit_in_bytes': str(2 ** 63 - 4096),
+        })
+
+        with mock.patch('os.sched_getaffinity', return_value=set(range(4))):
+            self.assertEqual(gunicorn_conf.cpu_limit(root), 4)
+        self.assertIsNone(gunicorn_conf.memory_limit(root))
+        self.assertIsNone(gunicorn_conf.memory_limit(self.make_cgroup({'memory.max': 'max'})))
+
+    def test_worker_count(self):
+        """Workers follow the CPUs and are capped by the memory limit"""
+        self.assertEqual(gunicorn_conf.worker_count(1.5, None, 160), 3)
+        self.assertEqual(gunicorn_conf.worker_count(4, None, 160, 'asgi'), 4)
+        self.assertEqual(gunicorn_conf.worker_count(8, 512, 160), 2)
+        self.assertEqual(gunicorn_conf.worker_count(8, 200, 160), 1)
+
+    def test_memory_recycling(self):
+        """A worker above the RSS limit is told to exit after its request"""
+        worker = mock.Mock(alive=True, pid=1)
+
+        with mock.patch.object(gunicorn_conf, 'current_rss_mb', return_value=gunicorn_conf.max_worker_rss_mb + 1):
+            gunicorn_conf.post_request(worker, None, {}, None)
+
+        self.assertFalse(worker.alive)
+
+
+class PrebuiltSchemaTests(APITestCase):
+    """Test cases for the prebuilt OpenAPI schema endpoint"""
+
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        override = self.settings(SCHEMA_CACHE_DIR=cache_dir.name, CODE_VERSION='test-1')
+        override.enable()
+        self.addCleanup(override.disable)
+        code_version.cache_clear()
+        self.addCleanup(code_version.cache_clear)
+        schema_cache.clear()
+        self.addCleanup(schema_cache.clear)
+        self.cache_dir = cache_dir.name
+
+    def test_schema_is_generated_once(self):
+        """Repeated requests are served from memory without introspection"""
+        with mock.patch('core.schema.generate_schema', wraps=generate_schema) as generate:
+            first = self.client.get('/api/schema/')
+            second = self.client.get('/api/schema/')
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.content, second.content)
+        self.assertIn(b'openapi:', first.content)
+        generate.assert_called_once_with('en', 'yaml')
+
+    def test_etag_not_modified(self):
+        """A matching If-None-Match gets 304 without a body"""
+        response = self.client.get('/api/schema/', {'format': 'json'})
+        self.assertEqual(json.loads(response.content)['info']['title'], 'Creadive API')
+
+        cached = self.client.get('/api/schema/', {'format': 'json'}, HTTP_IF_NONE_MATCH=response['ETag'])
+
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.content, b'')
+
+    def test_build_command_writes_artifacts_per_version(self):
+        """build_schema writes every language/format once per code version and prunes old versions"""
+        call_command('build_schema', stdout=StringIO())
+        self.assertEqual(
+            sorted(os.listdir(os.path.join(self.cache_dir, 'test-1'))),
+            ['az.json', 'az.yaml', 'en.json', 'en.yaml', 'ru.json', 'ru.yaml'],
+        )
+
+        with mock.patch('core.management.commands.build_schema.generate_schema') as generate:
+            call_command('build_schema', stdout=StringIO())
+        generate.assert_not_called()
+
+        code_version.cache_clear()
+        with self.settings(CODE_VERSION='test-2'):
+            call_command('build_schema', stdout=StringIO())
+        self.assertEqual(os.listdir(self.cache_dir), ['test-2'])
+
+    def test_served_from_disk(self):
+        """A prebuilt artifact is served as-is"""
+        call_command('build_schema', stdout=StringIO())
+        with open(os.path.join(self.cache_dir, 'test-1', 'az.yaml'), 'rb') as handle:
+            prebuilt = handle.read()
+
+        with mock.patch('core.schema.generate_schema') as generate:
+            response = self.client.get('/api/schema/', {'lang': 'az'})
+
+        generate.assert_not_called()
+        self.assertEqual(response.content, prebuilt)
+
+
+# =============================================================================
+# SITEMAP & FEED TESTS
+# =============================================================================
+
+@override_settings(SITEMAP_CHUNK_SIZE=2, FRONTEND_URL='https://creadive.az')
+class SitemapAndFeedTests(TestCase):
+    """Test cases for cached, streamed sitemaps and blog feeds"""
+
+    def setUp(self):
+        cache.clear()
+        self.posts = [
+            BlogPost.objects.create(title_en=f'Post {index}', excerpt_en='Excerpt', content='Body',
+                                    date=date(2024, 1, index + 1), status='published')
+            for index in range(3)
+        ]
+        self.draft = BlogPost.objects.create(title_en='Draft', content='Body', date=date.today())
+        PortfolioItem.objects.create(title_en='Item')
+
+    def get_content(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        body = b''.join(response.streaming_content) if response.streaming else response.content
+        return body.decode()
+
+    def test_index_lists_chunks(self):
+        """The index points at every chunk of every section"""
+        content = self.get_content('/sitemap.xml')
+
+        self.assertIn('http://testserver/sitemap-blog-1.xml', content)
+        self.assertIn('http://testserver/sitemap-blog-2.xml', content)
+        self.assertIn('http://testserver/sitemap-portfolio-1.xml', content)
+        self.assertNotIn('sitemap-blog-3.xml', content)
+
+    def test_chunk_lists_each_language_with_alternates(self):
+        """A chunk has one URL per object and language, drafts excluded"""
+        content = self.get_content('/sitemap-blog-2.xml')
+        url = 'https://creadive.az/az/blog/post-2'
+
+        self.assertIn(f'<loc>{url}</loc>', content)
+        self.assertIn('hreflang="ru" href="https://creadive.az/ru/blog/post-2"', content)
+        self.assertEqual(content.count('<url>'), 3)
+        self.assertNotIn('/blog/draft<', content)
+        self.assertEqual(self.client.get('/sitemap-blog-3.xml').status_code, 404)
+        self.assertEqual(self.client.get('/sitemap-pages-1.xml').status_code, 404)
+
+    def test_cached_until_next_change(self):
+        """Repeated requests hit the cache; a committed save invalidates it"""
+        first = self.get_content('/sitemap-blog-1.xml')
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.get_content('/sitemap-blog-1.xml'), first)
+        self.assertEqual(len(queries), 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.posts[0].delete()
+
+        self.assertNotEqual(self.get_content('/sitemap-blog-1.xml'), first)
+
+    def test_feeds_per_language(self):
+        """RSS and Atom feeds use the language's translations with English fallback"""
+        BlogPost.objects.filter(pk=self.posts[2].pk).update(title_az='Yazı 2')
+
+        rss = self.get_content('/feeds/blog/az/rss.xml')
+        atom = self.get_content('/feeds/blog/ru/atom.xml')
+
+        self.assertIn('<title>Yazı 2</title>', rss)
+        self.assertIn('<title>Post 1</title>', rss)
+        self.assertIn('<link>https://creadive.az/az/blog/post-0</link>', rss)
+        self.assertNotIn('Draft', rss)
+        self.assertIn('xml:lang="ru"', atom)
+        self.assertIn('<title>Post 2</title>', atom)
+        self.assertEqual(self.client.get('/feeds/blog/de/rss.xml').status_code, 404)
+
+    def test_feed_cache_ignores_query_string(self):
+        """Query strings share the feed's cache entry and stay out of its self link"""
+        rss = self.get_content('/feeds/blog/en/rss.xml')
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.get_content('/feeds/blog/en/rss.xml?utm_source=x'), rss)
+        self.assertEqual(len(queries), 0)
+        self.assertNotIn('utm_source', rss)
+
+
+class ContactInquiryExportTests(TestCase, BaseTestSetup):
+    """Test cases for streaming contact inquiry exports"""
+
+    def setUp(self):
+        self.admin_user = User.objects.create_superuser('admin', 'admin@example.com', 'password-123')
+        self.client.force_login(self.admin_user)
+        self.new = self.create_contact_inquiry(fullName='Əli Məmmədov', subject='=HYPERLINK("x")')
+        self.handled = self.create_contact_inquiry(fullName='Old Lead', status='handled')
+        ContactInquiry.objects.filter(pk=self.handled.pk).update(createdAt=datetime(2023, 5, 1, tzinfo=dt_timezone.utc))
+        self.url = reverse('admin:core_contactinquiry_export')
+
+    def read_csv(self, response):
+        self.assertTrue(response.streaming)
+        content = b''.join(response.streaming_content).decode('utf-8-sig')
+        return list(csv.reader(StringIO(content)))
+
+    def test_csv_export_streams_filtered_rows(self):
+        """CSV export honours the status filter and neutralises formulas"""
+        response = self.client.get(self.url, {'format': 'csv', 'status': 'new'})
+
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        rows = self.read_csv(response)
+        self.assertEqual(rows[0][:3], ['ID', 'Created at', 'Full name'])
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[1][2], 'Əli Məmmədov')
+        self.assertEqual(rows[1][6], "'=HYPERLINK(\"x\")")
+
+    def test_date_range_filter(self):
+        """date_from/date_to filter on the creation date"""
+        rows = self.read_csv(self.client.get(self.url, {'date_from': '2023-01-01', 'date_to': '2023-12-31'}))
+
+        self.assertEqual([row[2] for row in rows[1:]], ['Old Lead'])
+        self.assertEqual(self.client.get(self.url, {'date_from': 'yesterday'}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {'status': 'spam'}).status_code, 400)
+
+    def test_xlsx_export_is_a_valid_workbook(self):
+        """The streamed XLSX is a zip with inline-string cells"""
+        response = self.client.get(self.url, {'format': 'xlsx'})
+        content = b''.join(response.streaming_content)
+
+        with zipfile.ZipFile(BytesIO(content)) as workbook:
+            self.assertIn('xl/workbook.xml', workbook.namelist())
+            sheet = workbook.read('xl/worksheets/sheet1.xml').decode()
+        self.assertEqual(sheet.count('<row>'), 3)
+        self.assertIn('Əli Məmmədov', sheet)
+
+    def test_rows_are_read_with_an_iterator(self):
+        """Exports read through a chunked iterator, not a cached queryset"""
+        with mock.patch('django.db.models.query.QuerySet.iterator', autospec=True,
+                        side_effect=QuerySet.iterator) as iterator:
+            self.read_csv(self.client.get(self.url))
+
+        self.assertEqual(iterator.call_args.kwargs, {'chunk_size': 2000})
+
+    def test_admin_action_exports_selection(self):
+        """The changelist action streams only the selected inquiries"""
+        response = self.client.post(reverse('admin:core_contactinquiry_changelist'), {
+            'action': 'export_csv', '_selected_action': [self.handled.pk],
+        })
+
+        rows = self.read_csv(response)
+        self.assertEqual([row[2] for row in rows[1:]], ['Old Lead'])
+
+
+# =============================================================================
+# RELATED POST TESTS
+# =============================================================================
+
+@override_settings(RELATED_POSTS_STORED=2)
+class RelatedPostTests(APITestCase):
+    """Test cases for the incrementally maintained related-post lists"""
+
+    def setUp(self):
+        self.django, self.python = Tag.objects.create(name='Django', slug='django'), Tag.objects.create(name='Python', slug='python')
+        self.backend = Category.objects.create(name='Backend')
+        self.posts = [
+            BlogPost.objects.create(title_en=f'Post {index}', content='Body', date=date(2024, 1, index + 1),
+                                    status='published')
+            for index in range(4)
+        ]
+        first, second, third, fourth = self.posts
+        first.tags.set([self.django, self.python])
+        first.categories.set([self.backend])
+        second.tags.set([self.django, self.python])
+        third.tags.set([self.django])
+        third.categories.set([self.backend])
+        fourth.categories.set([self.backend])
+
+    def stored(self, post):
+        return list(RelatedPost.objects.filter(post=post).order_by('-score', '-related_id')
+                    .values_list('related_id', 'score'))
+
+    def test_top_lists_are_scored_and_capped(self):
+        """Shared tags weigh 2, shared categories 1; only the top entries are kept"""
+        first, second, third, fourth = self.posts
+
+        self.assertEqual(self.stored(first), [(second.pk, 4), (third.pk, 3)])
+        self.assertEqual(self.stored(fourth), [(third.pk, 1), (first.pk, 1)])
+
+    def test_tag_changes_update_affected_lists(self):
+        """Adding a post to a tag from the tag side re-ranks the lists it enters"""
+        first, second, third, fourth = self.posts
+        self.python.blog_posts.add(fourth)
+
+        self.assertEqual(self.stored(fourth), [(first.pk, 3), (second.pk, 2)])
+        self.assertEqual(self.stored(second), [(first.pk, 4), (fourth.pk, 2)])
+
+        second.tags.clear()
+        self.assertEqual(self.stored(second), [])
+        self.assertEqual(self.stored(first), [(fourth.pk, 3), (third.pk, 3)])
+
+    def test_deleting_a_post_refills_lists(self):
+        """Lists that pointed at a deleted post are refilled from the remaining posts"""
+        first, second, third, fourth = self.posts
+        second.delete()
+
+        self.assertEqual(self.stored(first), [(third.pk, 3), (fourth.pk, 1)])
+
+    def test_drafts_are_not_ranked(self):
+        """Unpublishing a post takes it out of the lists, which refill up to the cap; publishing restores it"""
+        first, second, third, fourth = self.posts
+        second.status = 'draft'
+        second.save()
+        self.assertEqual(self.stored(first), [(third.pk, 3), (fourth.pk, 1)])
+        # A draft still has its own list of published posts
+        self.assertEqual(self.stored(second), [(first.pk, 4), (third.pk, 2)])
+
+        second.status = 'published'
+        second.save()
+        self.assertEqual(self.stored(first), [(second.pk, 4), (third.pk, 3)])
+
+    def test_related_action(self):
+        """The action returns published related posts best first, from one query"""
+        first, second, third, fourth = self.posts
+        second.status = 'draft'
+        second.save()
+        url = reverse('blog-related', args=[first.pk])
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {'limit': 2})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([post['id'] for post in response.data], [third.pk, fourth.pk])
+        self.assertEqual(sum(query['sql'].count('JOIN "core_relatedpost"') for query in queries), 1)
+        # The source post is looked up by id alone; only the related posts prefetch tags and categories
+        self.assertEqual(len(queries), 4)
+        self.assertTrue(queries[0]['sql'].startswith('SELECT "core_blogpost"."id" FROM'), queries[0]['sql'])
+
+        self.assertEqual(self.client.get(url, {'limit': 'all'}).status_code, 400)
+        response = self.client.get(reverse('blog-related', args=[first.slug_en]), {'limit': 1})
+        self.assertEqual([post['id'] for post in response.data], [third.pk])
+        self.assertEqual(self.client.get('/api/blog/abc/related/').status_code, 404)
+        self.assertEqual(self.client.get(f'/api/blog/{fourth.pk + 100}/related/').status_code, 404)
+
+
+
+class BlogPostNeighbourTests(APITestCase):
+    """Test cases for keyset previous/next navigation on blog post detail"""
+
+    def setUp(self):
+        self.older = BlogPost.objects.create(title_en='Older', content='Body', date=date(2024, 1, 1), status='published')
+        self.same_day = BlogPost.objects.create(title_en='Same day', content='Body', date=date(2024, 2, 1),
+                                                status='published')
+        self.current = BlogPost.objects.create(title_en='Current', content='Body', date=date(2024, 2, 1),
+                                               status='published')
+        BlogPost.objects.create(title_en='Draft', content='Body', date=date(2024, 3, 1))
+        self.newer = BlogPost.objects.create(title_en='Newer', title_az='Yeni', content='Body',
+                                             date=date(2024, 4, 1), status='published')
+
+    def test_neighbours_follow_list_order(self):
+        """Previous is the next newer published post, next the next older one, ties broken by id"""
+        response = self.client.get(reverse('blog-detail', args=[self.current.pk]), {'neighbours': 1})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['previous'],
+                         {'id': self.newer.pk, 'title': 'Newer', 'slug': 'newer', 'date': '2024-04-01'})
+        self.assertEqual(response.data['next']['id'], self.same_day.pk)
+
+        response = self.client.get(reverse('blog-detail', args=[self.older.pk]), {'neighbours': 'true'})
+        self.assertEqual(response.data['previous']['id'], self.same_day.pk)
+        self.assertIsNone(response.data['next'])
+
+    def test_neighbours_are_opt_in_and_translated(self):
+        """Without the parameter the payload is unchanged; titles follow the language"""
+        url = reverse('blog-detail', args=[self.current.pk])
+        self.assertNotIn('previous', self.client.get(url).data)
+
+        response = self.client.get(url, {'neighbours': 1, 'lang': 'all'})
+        self.assertEqual(response.data['previous']['title']['az'], 'Yeni')
+
+    def test_keyset_queries(self):
+        """Each neighbour is one row comparison query, not a scan of the list"""
+        with CaptureQueriesContext(connection) as queries:
+            adjacent_posts(self.current)
+
+        self.assertEqual(len(queries), 2)
+        self.assertIn('("core_blogpost"."date", "core_blogpost"."id") >', queries[0]['sql'])
+        self.assertNotIn('OVER', queries[1]['sql'])
+
+    @override_settings(API_CACHE_TIMEOUT=0)
+    def test_neighbours_cost_two_queries(self):
+        """The neighbours load every field they render up front, in one query each"""
+        url = reverse('blog-detail', args=[self.current.pk])
+        with CaptureQueriesContext(connection) as plain:
+            self.client.get(url)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {'neighbours': 1})
+
+        self.assertEqual(response.data['previous']['slug'], 'newer')
+        self.assertEqual(len(queries), len(plain) + 2)
+
+
+# =============================================================================
+# ARCHIVE & TAXONOMY COUNT TESTS
+# =============================================================================
+
+class BlogPostCountTests(APITestCase):
+    """Test cases for the maintained archive/category/tag post counts"""
+
+    def setUp(self):
+        self.news = Category.objects.create(name='News', name_az='Xəbərlər')
+        self.django = Tag.objects.create(name='Django', slug='django')
+        self.january = BlogPost.objects.create(title_en='January', content='Body', date=date(2024, 1, 5),
+                                               status='published')
+        self.march = BlogPost.objects.create(title_en='March', content='Body', date=date(2024, 3, 9),
+                                             status='published')
+        self.draft = BlogPost.objects.create(title_en='Draft', content='Body', date=date(2024, 3, 1))
+        for post in (self.january, self.march, self.draft):
+            post.categories.add(self.news)
+            post.tags.add(self.django)
+
+    def counts(self):
+        return {kind: counts(kind) for kind in ('month', 'category', 'tag')}
+
+    def test_counts_follow_saves_and_m2m_changes(self):
+        """Status/date changes, link changes and deletes keep the buckets exact"""
+        self.assertEqual(self.counts(), {
+            'month': {202401: 1, 202403: 1}, 'category': {self.news.pk: 2}, 'tag': {self.django.pk: 2},
+        })
+
+        self.draft.status = 'published'
+        self.draft.save()
+        self.january.date = date(2024, 3, 2)
+        self.january.save()
+        self.assertEqual(self.counts()['month'], {202403: 3})
+        self.assertEqual(self.counts()['tag'], {self.django.pk: 3})
+
+        self.django.blog_posts.remove(self.march)
+        self.draft.categories.clear()
+        self.assertEqual(self.counts()['tag'], {self.django.pk: 2})
+        self.assertEqual(self.counts()['category'], {self.news.pk: 2})
+
+        self.march.delete()
+        self.news.delete()
+        self.assertEqual(self.counts(), {'month': {202403: 2}, 'category': {}, 'tag': {self.django.pk: 2}})
+
+    def test_counts_match_a_rebuild(self):
+        """Incremental maintenance ends up where a full recount does"""
+        self.january.tags.clear()
+        self.march.status = 'draft'
+        self.march.save()
+        maintained = self.counts()
+
+        rebuild_counts()
+        self.assertEqual(self.counts(), maintained)
+
+    def test_endpoints_read_the_summary_table(self):
+        """Archive, categories and tags are one query each, published posts only"""
+        with CaptureQueriesContext(connection) as queries:
+            archive = self.client.get(reverse('blog-archive'))
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(archive.data, [{'year': 2024, 'month': 3, 'count': 1}, {'year': 2024, 'month': 1, 'count': 1}])
+
+        categories = self.client.get(reverse('blog-categories'), {'lang': 'all'})
+        self.assertEqual(categories.data[0]['post_count'], 2)
+        self.assertEqual(categories.data[0]['name']['az'], 'Xəbərlər')
+        self.assertEqual(self.client.get(reverse('blog-tags')).data,
+                         [{'id': self.django.pk, 'name': 'Django', 'slug': 'django', 'post_count': 2}])
+
+
+# =============================================================================
+# BULK RETRIEVE TESTS
+# =============================================================================
+
+@override_settings(BULK_IDS_MAX=3)
+class BulkRetrieveTests(APITestCase):
+    """Test cases for ?ids= bulk mode on the read-only viewsets"""
+
+    def setUp(self):
+        cache.clear()
+        self.tag = Tag.objects.create(name='Django', slug='django')
+        self.posts = [
+            BlogPost.objects.create(title_en=f'Post {index}', content='Body', date=date(2024, 1, index + 1),
+                                    status='published')
+            for index in range(3)
+        ]
+        for post in self.posts:
+            post.tags.add(self.tag)
+
+    def test_keeps_request_order(self):
+        """Objects come back in the requested order, without repeats or unknown ids"""
+        first, second, third = self.posts
+        ids = f'{third.pk},{first.pk},0,{third.pk}'
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('blog-list'), {'ids': ids})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([post['id'] for post in response.data], [third.pk, first.pk])
+        self.assertEqual(response.data[0]['tags_list'], ['Django'])
+        # posts, tags, categories: prefetched once for all objects
+        self.assertEqual(len(queries), 3)
+
+    def test_constant_queries_on_every_viewset(self):
+        """Every bulk endpoint serializes its objects' relations from prefetches, not per object"""
+        technology = Technology.objects.create(name='Python', slug='python')
+        portfolio_category = PortfolioCategory.objects.create(name='Web', slug='web')
+        expected = {'blog-list': (self.posts, 3)}
+        items = [PortfolioItem.objects.create(title_en=f'Item {index}') for index in range(3)]
+        for item in items:
+            item.technologies.add(technology)
+            item.categories.add(portfolio_category)
+        expected['portfolio-list'] = (items, 3)
+        services = [Service.objects.create(title_en=f'Service {index}') for index in range(3)]
+        for service in services:
+            ServiceFeature.objects.create(service=service, name='Feature')
+        expected['services-list'] = (services, 2)
+        members = [TeamMember.objects.create(name_en=f'Member {index}') for index in range(3)]
+        for member in members:
+            SocialLink.objects.create(team_member=member, platform='github', url='https://github.com/x')
+        expected['team-list'] = (members, 2)
+        expected['testimonials-list'] = ([Testimonial.objects.create(name_en=f'Client {index}') for index in range(3)], 1)
+        expected['faq-list'] = ([FAQ.objects.create(question_en=f'Q{index}', answer_en='A') for index in range(3)], 1)
+        links = [HeaderNavLink.objects.create(title_en=f'Menu {index}', url='/') for index in range(3)]
+        for link in links:
+            child = HeaderNavLink.objects.create(title_en='Child', url='/child', parent=link)
+            HeaderNavLink.objects.create(title_en='Grandchild', url='/grandchild', parent=child)
+        expected['headernavlink-list'] = (links, 2)
+
+        for name, (objects, query_count) in expected.items():
+            with self.subTest(name), CaptureQueriesContext(connection) as queries:
+                response = self.client.get(reverse(name), {'ids': ','.join(str(obj.pk) for obj in objects)})
+                self.assertEqual(len(response.data), 3)
+                self.assertEqual(len(queries), query_count)
+
+        response = self.client.get(reverse('headernavlink-list'), {'ids': links[0].pk})
+        self.assertEqual(response.data[0]['children'][0]['children'][0]['title'], 'Grandchild')
+        response = self.client.get(reverse('services-list'), {'ids': services[0].pk})
+        self.assertEqual(response.data[0]['features_list'], ['Feature'])
+
+    def test_filters_still_apply(self):
+        """Viewset filters narrow the bulk result"""
+        BlogPost.objects.filter(pk=self.posts[0].pk).update(status='draft')
+        ids = ','.join(str(post.pk) for post in self.posts)
+
+        response = self.client.get(reverse('blog-list'), {'ids': ids, 'status': 'published'})
+        self.assertEqual([post['id'] for post in response.data], [self.posts[1].pk, self.posts[2].pk])
+
+    def test_invalid_or_too_many_ids(self):
+        """Non-integer ids and lists over the cap are rejected"""
+        self.assertEqual(self.client.get(reverse('faq-list'), {'ids': '1,x'}).status_code, 400)
+        self.assertEqual(self.client.get(reverse('services-list'), {'ids': '1,2,3,4'}).status_code, 400)
+        self.assertEqual(self.client.get(reverse('team-list'), {'ids': ''}).data, [])
+
+
+# =============================================================================
+# SLUG TESTS
+# =============================================================================
+
+class TranslatedSlugTests(APITestCase):
+    """Test cases for generated per-language slugs and slug detail lookups"""
+
+    def setUp(self):
+        self.post = BlogPost.objects.create(title_en='Hello World', title_az='Salam Dünya', content='Body',
+                                            date=date(2024, 1, 1), status='published')
+
+    def test_slugs_generated_per_language(self):
+        """Each language gets a slug from its own title, or the English one"""
+        self.assertEqual((self.post.slug_en, self.post.slug_az, self.post.slug_ru),
+                         ('hello-world', 'salam-dünya', 'hello-world'))
+
+        self.post.title_en = 'Renamed'
+        self.post.save()
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.slug_en, 'hello-world')
+
+    def test_slugs_are_unique_per_language(self):
+        """Clashing titles get numbered slugs; numeric titles do not look like ids"""
+        duplicate = BlogPost.objects.create(title_en='Hello, world!', content='Body', date=date(2024, 1, 2))
+        service = Service.objects.create(title_en='2024')
+
+        self.assertEqual(duplicate.slug_en, 'hello-world-2')
+        self.assertEqual(duplicate.slug_ru, 'hello-world-2')
+        self.assertEqual(service.slug_en, 'service-2024')
+
+    def test_detail_by_slug_in_any_language(self):
+        """Detail routes resolve an id or any language's slug in one query"""
+        for lookup in ('hello-world', 'salam-dünya', str(self.post.pk)):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(reverse('blog-detail', args=[lookup]), HTTP_ACCEPT_LANGUAGE='az')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.data['id'], self.post.pk)
+            self.assertEqual(response.data['slug'], 'salam-dünya')
+            # post, tags, categories
+            self.assertEqual(len(queries), 3)
+
+        self.assertEqual(self.client.get(reverse('blog-detail', args=['missing'])).status_code, 404)
+        item = PortfolioItem.objects.create(title_en='Landing page')
+        self.assertEqual(self.client.get(reverse('portfolio-detail', args=['landing-page'])).data['id'], item.pk)
+
+
+
+# =============================================================================
+# FRONTEND PURGE TESTS
+# =============================================================================
+
+@override_settings(FRONTEND_PURGE_URL='https://frontend.test/api/revalidate', FRONTEND_PURGE_TOKEN='secret',
+                   FRONTEND_PURGE_DEBOUNCE=0.05, FRONTEND_PURGE_MAX_DELAY=1, FRONTEND_PURGE_BACKOFF=0)
+class FrontendPurgeTests(TestCase):
+    """Test cases for computing and delivering frontend purge webhooks"""
+
+    def setUp(self):
+        self.older = BlogPost.objects.create(title_en='Older', content='Body', date=date(2024, 1, 1),
+                                             status='published')
+        self.post = BlogPost.objects.create(title_en='Post', content='Body', date=date(2024, 2, 1),
+                                            status='published')
+
+    def purged(self, change):
+        """``{path: languages}`` queued by ``change()`` once its transaction commits"""
+        with mock.patch.object(purge_queue, 'enqueue') as enqueue:
+            with self.captureOnCommitCallbacks(execute=True):
+                change()
+        merged = {}
+        for call in enqueue.call_args_list:
+            for path, languages in call.args[0].items():
+                merged.setdefault(path, set()).update(languages)
+        return merged
+
+    def test_translation_edit_purges_only_its_language(self):
+        """A non-default translation affects one language; the default or untranslated fields affect all"""
+        def edit(**values):
+            def change():
+                for name, value in values.items():
+                    setattr(self.post, name, value)
+                self.post.save()
+            return change
+
+        purged = self.purged(edit(title_az='Yazı'))
+        self.assertEqual(purged[f'/api/blog/{self.post.pk}/'], {'az'})
+        self.assertEqual(self.purged(edit(excerpt_en='New excerpt'))['/api/blog/'], {'en', 'az', 'ru'})
+        self.assertEqual(self.purged(edit(status='draft'))['/api/blog/'], {'en', 'az', 'ru'})
+        self.assertEqual(self.purged(edit()), {})
+
+    def test_paths_cover_pages_embedding_the_post(self):
+        """Lists, slug and id details, neighbours and taxonomy endpoints are purged"""
+        purged = self.purged(lambda: self.post.tags.add(Tag.objects.create(name='Django', slug='django')))
+
+        for path in ('/api/blog/', '/api/blog/archive/', '/api/blog/tags/', f'/api/blog/{self.post.pk}/',
+                     '/api/blog/post/', f'/api/blog/{self.older.pk}/', '/api/blog/older/'):
+            self.assertIn(path, purged)
+        faq = FAQ.objects.create(question='Q?', answer='A.')
+        faq_path = f'/api/faqs/{faq.pk}/'
+        self.assertEqual(set(self.purged(faq.delete)), {'/api/faqs/', faq_path})
+
+    def test_reorders_purge_what_they_move(self):
+        """Bulk reorders, which send no post_save, purge the reordered objects and the services of features"""
+        service = Service.objects.create(title_en='Design')
+        features = [ServiceFeature.objects.create(service=service, name=f'F{index}', order=index) for index in (1, 2)]
+        purged = self.purged(lambda: bulk_update_order(ServiceFeature, [(features[0].pk, 2), (features[1].pk, 1)]))
+        self.assertEqual(set(purged), {'/api/services/', f'/api/services/{service.pk}/', '/api/services/design/'})
+
+        faq = FAQ.objects.create(question='Q?', answer='A.', order=1)
+        purged = self.purged(lambda: bulk_update_order(FAQ, [(faq.pk, 2)]))
+        self.assertEqual(set(purged), {'/api/faqs/', f'/api/faqs/{faq.pk}/'})
+
+    @override_settings(FRONTEND_PURGE_URL=None)
+    def test_disabled_without_url(self):
+        """Nothing is computed or queued when no purge URL is configured"""
+        self.assertEqual(self.purged(lambda: self.post.delete()), {})
+
+        service = Service.objects.create(title='Design', order=1)
+        feature = ServiceFeature(service=service, name='Logo', order=1)
+        # The INSERT and the UPDATE, without SELECTing the service or its stored values
+        with self.assertNumQueries(2):
+            feature.save()
+            service.save()
+
+    def test_queue_coalesces_and_retries(self):
+        """Changes within the debounce window go out as one webhook, retried on failure"""
+        send = mock.Mock(side_effect=[OSError('connection refused'), None])
+        queue = PurgeQueue(send=send)
+        queue.enqueue({'/api/blog/': {'en'}})
+        queue.enqueue({'/api/blog/': {'az'}, '/api/faqs/': {'ru'}})
+
+        deadline = time.monotonic() + 5
+        while send.call_count < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(send.call_count, 2)
+        self.assertEqual(send.call_args.args[0], {'/api/blog/': {'en', 'az'}, '/api/faqs/': {'ru'}})
+
+    def test_webhook_request(self):
+        """The webhook is a JSON POST with the bearer token"""
+        with mock.patch('urllib.request.urlopen') as urlopen:
+            send_purge({'/api/faqs/': {'ru', 'en'}})
+
+        request = urlopen.call_args.args[0]
+        self.assertEqual(request.full_url, 'https://frontend.test/api/revalidate')
+        self.assertEqual(request.get_header('Authorization'), 'Bearer secret')
+        self.assertEqual(json.loads(request.data), {'paths': {'/api/faqs/': ['en', 'ru']}})
+
+
+# =============================================================================
+# RESPONSE CACHE TESTS
+# =============================================================================
+
+class ResponseCacheTests(APITestCase):
+    """Test cases for the version-keyed API response cache"""
+
+    def setUp(self):
+        cache.clear()
+        self.faq = FAQ.objects.create(question_en='Question?', question_az='Sual?', answer='Answer.')
+        self.url = reverse('faq-list')
+
+    def test_hit_skips_the_database(self):
+        """A repeated request is served from the cache without queries"""
+        first = self.client.get(self.url)
+        with CaptureQueriesContext(connection) as queries:
+            second = self.client.get(self.url)
+
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second['Content-Type'], 'application/json')
+
+    def test_keyed_by_language_and_query(self):
+        """Languages and query strings are cached separately; parameter order does not matter"""
+        self.assertEqual(self.client.get(self.url, HTTP_ACCEPT_LANGUAGE='az').json()[0]['question'], 'Sual?')
+        self.assertEqual(self.client.get(self.url, HTTP_ACCEPT_LANGUAGE='en').json()[0]['question'], 'Question?')
+
+        self.client.get(f'{self.url}?search=Q&ordering=id')
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(f'{self.url}?ordering=id&search=Q')
+        self.assertEqual(len(queries), 0)
+
+    def test_changes_retire_entries(self):
+        """Saving a model, or a dependency of the viewset, serves fresh data"""
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            FAQ.objects.create(question='Another?', answer='Yes.')
+        self.assertEqual(len(self.client.get(self.url).json()), 2)
+
+        service = Service.objects.create(title='Design')
+        self.client.get(reverse('services-detail', args=[service.pk]))
+        with self.captureOnCommitCallbacks(execute=True):
+            ServiceFeature.objects.create(service=service, name='Logo')
+        response = self.client.get(reverse('services-detail', args=[service.pk]))
+        self.assertEqual(response.json()['features_list'], ['Logo'])
+
+    def test_only_json_get_responses_are_cached(self):
+        """The browsable API and error responses go through the view every time"""
+        self.client.get(self.url, HTTP_ACCEPT='text/html')
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.url, HTTP_ACCEPT='text/html')
+        self.assertGreater(len(queries), 0)
+
+        missing = reverse('faq-detail', args=[0])
+        self.client.get(missing)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.client.get(missing).status_code, 404)
+        self.assertGreater(len(queries), 0)
+
+
+class WarmCacheTests(TransactionTestCase):
+    """Test cases for the warm_cache management command"""
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir, ignore_errors=True)
+        self.post = BlogPost.objects.create(title_en='Post', content='Body', date=date(2024, 1, 1), status='published')
+        category = PortfolioCategory.objects.create(name='Web', slug='web')
+        PortfolioItem.objects.create(title_en='Site').categories.add(category)
+
+    def test_warms_every_language(self):
+        """Lists, list actions, category pages and recent details are cached in each language"""
+        paths = list(warm_cache.warm_paths(details=5))
+        for path in ('/api/blog/', '/api/blog/archive/', f'/api/blog/{self.post.pk}/',
+                     f'/api/blog/{self.post.pk}/related/', '/api/portfolio/category/web/', '/api/faqs/'):
+            self.assertIn(path, paths)
+        self.assertFalse(any(path.startswith('/api/contact/') for path in paths))
+
+        caches_setting = {'default': {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+                                      'LOCATION': self.cache_dir}}
+        with override_settings(CACHES=caches_setting, ALLOWED_HOSTS=['api.example.com']):
+            out = StringIO()
+            call_command('warm_cache', '--workers', '3', stdout=out)
+            self.assertIn(f'Warmed {len(set(paths)) * 3} of {len(set(paths)) * 3}', out.getvalue())
+
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get('/api/blog/', HTTP_ACCEPT_LANGUAGE='ru', HTTP_HOST='api.example.com')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(queries), 0)
+
+
+@override_settings(API_CACHE_SOFT_TIMEOUT=60, API_CACHE_LOCK_WAIT=0.2)
+class StaleWhileRevalidateTests(SimpleTestCase):
+    """Test cases for soft/hard expiry and single-flight regeneration"""
+
+    key, lock_key = 'response:en:test', 'lock:response:en:test'
+
+    def setUp(self):
+        cache.clear()
+
+    def render(self, body=b'[]', status_code=200):
+        return lambda: HttpResponse(body, content_type='application/json', status=status_code)
+
+    def test_fresh_entries_are_served_without_rendering(self):
+        """Within the soft timeout and with the same version stamp, render() is not called"""
+        cached_response(self.key, 'v1', self.render(b'[1]'))
+        response = cached_response(self.key, 'v1', mock.Mock(side_effect=AssertionError))
+        self.assertEqual(response.content, b'[1]')
+
+    def test_stale_entry_served_while_another_worker_renders(self):
+        """A changed version stamp re-renders only under the lock; others get the stale copy"""
+        cached_response(self.key, 'v1', self.render(b'[1]'))
+        cache.add(self.lock_key, 1)
+
+        response = cached_response(self.key, 'v2', mock.Mock(side_effect=AssertionError))
+        self.assertEqual(response.content, b'[1]')
+
+        cache.delete(self.lock_key)
+        self.assertEqual(cached_response(self.key, 'v2', self.render(b'[2]')).content, b'[2]')
+        self.assertIsNone(cache.get(self.lock_key))
+
+    def test_soft_timeout_expires_entries(self):
+        """Past the soft timeout the entry is regenerated even with the same stamp"""
+        with override_settings(API_CACHE_SOFT_TIMEOUT=-1):
+            cached_response(self.key, 'v1', self.render(b'[1]'))
+        self.assertEqual(cached_response(self.key, 'v1', self.render(b'[2]')).content, b'[2]')
+
+    def test_single_flight(self):
+        """Concurrent requests for a stale entry render it once"""
+        cached_response(self.key, 'v1', self.render(b'[1]'))
+        calls = []
+
+        def slow_render():
+            calls.append(1)
+            time.sleep(0.1)
+            return HttpResponse(b'[2]', content_type='application/json')
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            bodies = list(executor.map(lambda _: cached_response(self.key, 'v2', slow_render).content, range(6)))
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(sorted(set(bodies)), [b'[1]', b'[2]'])
+
+    def test_lock_holder_failure_falls_back(self):
+        """A failing render releases the lock and caches nothing; waiters render for themselves"""
+        with self.assertRaises(RuntimeError):
+            cached_response(self.key, 'v1', mock.Mock(side_effect=RuntimeError))
+        self.assertIsNone(cache.get(self.lock_key))
+        self.assertIsNone(cache.get(self.key))
+
+        cache.add(self.lock_key, 1)  # a lock holder that never finishes
+        self.assertEqual(cached_response(self.key, 'v1', self.render(b'[3]')).content, b'[3]')
+
+    def test_errors_are_not_cached(self):
+        cached_response(self.key, 'v1', self.render(b'{}', status_code=404))
+        self.assertIsNone(cache.get(self.key))
+
+    def test_gone_objects_evict_the_stale_entry(self):
+        """A 404/410 render drops the old entry, so nobody is served the deleted object meanwhile"""
+        for status_code in (404, 410):
+            cached_response(self.key, 'v1', self.render(b'{"id": 1}'))
+            response = cached_response(self.key, 'v2', self.render(b'{}', status_code=status_code))
+            self.assertEqual(response.status_code, status_code)
+            self.assertIsNone(cache.get(self.key))
+
+            cache.add(self.lock_key, 1)  # another worker re-rendering
+            response = cached_response(self.key, 'v2', self.render(b'{}', status_code=status_code))
+            self.assertEqual(response.status_code, status_code)
+            cache.delete(self.lock_key)
+
+        # Other errors keep the stale copy for the requests that run meanwhile
+        cached_response(self.key, 'v1', self.render(b'{"id": 1}'))
+        cached_response(self.key, 'v2', self.render(b'{}', status_code=500))
+        self.assertEqual(cache.get(self.key)['content'], b'{"id": 1}')
+
+
+@override_settings(COMPRESSION_MIN_SIZE=200)
+class CompressionTests(APITestCase):
+    """Test cases for brotli/gzip response compression"""
+
+    def setUp(self):
+        cache.clear()
+        for number in range(10):
+            FAQ.objects.create(question=f'Question {number}?', answer='A long enough answer. ' * 5)
+        self.url = reverse('faq-list')
+
+    def test_negotiation(self):
+        self.assertEqual(negotiate('gzip, deflate, br'), 'br' if brotli else 'gzip')
+        self.assertEqual(negotiate('br;q=0.5, gzip'), 'gzip')
+        self.assertEqual(negotiate('br;q=0, *'), 'gzip')
+        self.assertEqual(negotiate('gzip;q=0'), None)
+        self.assertEqual(negotiate('identity'), None)
+        self.assertEqual(negotiate(''), None)
+
+    def test_api_responses_are_compressed(self):
+        """Bodies above the threshold are gzip-encoded for gzip clients and vary on Accept-Encoding"""
+        plain = self.client.get(self.url)
+        self.assertFalse(plain.has_header('Content-Encoding'))
+        self.assertIn('Accept-Encoding', plain['Vary'])
+
+        cache.clear()
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(int(response['Content-Length']), len(response.content))
+        self.assertEqual(gzip.decompress(response.content), plain.content)
+
+    @skipUnless(brotli, 'Brotli is not installed')
+    def test_brotli_preferred(self):
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip, deflate, br')
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(json.loads(brotli.decompress(response.content))[0]['question'], 'Question 0?')
+
+    def test_small_bodies_are_not_compressed(self):
+        FAQ.objects.all().delete()
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(response.content, b'[]')
+
+    def test_cache_hits_serve_precompressed_bytes(self):
+        """Encoded variants are stored with the entry; a hit compresses nothing"""
+        first = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip')
+        with mock.patch('core.compression.gzip.compress', side_effect=AssertionError), \
+                CaptureQueriesContext(connection) as queries:
+            second = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(second['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(second.content), gzip.decompress(first.content))
+
+    def test_streamed_sitemaps_are_compressed(self):
+        """A sitemap streamed on a cache miss is compressed chunk by chunk, a hit from the stored variant"""
+        with override_settings(ALLOWED_HOSTS=['*']):
+            first = self.client.get(reverse('sitemap-index'), HTTP_ACCEPT_ENCODING='gzip')
+            self.assertTrue(first.streaming)
+            self.assertEqual(first['Content-Encoding'], 'gzip')
+            xml = gzip.decompress(b''.join(first.streaming_content))
+            self.assertIn(b'<sitemapindex', xml)
+
+            with override_settings(COMPRESSION_MIN_SIZE=0):
+                second = self.client.get(reverse('sitemap-index'), HTTP_ACCEPT_ENCODING='gzip')
+            self.assertFalse(second.streaming)
+            self.assertEqual(gzip.decompress(second.content), xml)
+
+    def test_other_paths_untouched(self):
+        response = self.client.get('/en/admin/login/', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+
+@skipUnless(orjson, 'orjson is not installed')
+class ORJSONTests(SimpleTestCase):
+    """Test cases for the orjson renderer and parser matching DRF's JSON ones"""
+
+    def test_renders_like_drf(self):
+        data = {
+            'utc': datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=dt_timezone.utc),
+            'baku': datetime(2024, 1, 2, 3, 4, 5, tzinfo=ZoneInfo('Asia/Baku')),
+            'naive': datetime(2024, 1, 2, 3, 4, 5),
+            'date': date(2024, 1, 2),
+            'decimal': Decimal('1.10'),
+            'lazy': gettext_lazy('Name'),
+            'keys': {1: 'one'},
+            'text': 'Şəki ',
+            'big': 2 ** 70,
+        }
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+        self.assertEqual(ORJSONRenderer().render(None), b'')
+
+    def test_indented_output_falls_back(self):
+        rendered = ORJSONRenderer().render({'a': [1]}, 'application/json; indent=4')
+        self.assertEqual(rendered, b'{\n    "a": [\n        1\n    ]\n}')
+
+    def test_parser(self):
+        parser = ORJSONParser()
+        self.assertEqual(parser.parse(BytesIO('{"name": "Əli"}'.encode())), {'name': 'Əli'})
+        for body in (b'{"value": NaN}', b'{"a": ', b'\xff'):
+            with self.assertRaises(ParseError):
+                parser.parse(BytesIO(body))
+
+    def test_api_uses_orjson(self):
+        with mock.patch('core.renderers.orjson.dumps', wraps=orjson.dumps) as dumps:
+            response = APIClient().post(
+                reverse('contact-list'), {'fullName': 'A'}, format='json', HTTP_HOST='localhost',
+            )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('email', response.json())
+        dumps.assert_called()
+
+
+# =============================================================================
+# VALUES SERIALIZER TESTS
+# =============================================================================
+
+class ListSerializerFixtures:
+    """Services, team members, testimonials and FAQs for the list fast path tests"""
+
+    def setUp(self):
+        cache.clear()
+        design = Service.objects.create(
+            title_en='Design', title_az='Dizayn', description_en='Logos', image='services/design.png', order=2,
+        )
+        Service.objects.create(title_en='Hosting', details_ru='Хостинг', order=1)
+        ServiceFeature.objects.create(service=design, name='Logo', order=2)
+        ServiceFeature.objects.create(service=design, name='Brand book', order=1)
+        member = TeamMember.objects.create(name_en='Aysel', role_az='Dizayner', image='team/aysel.jpg')
+        TeamMember.objects.create(name_en='Rauf', role_en='Developer')
+        SocialLink.objects.create(team_member=member, platform='github', url='https://github.com/aysel', order=1)
+        SocialLink.objects.create(team_member=member, platform='linkedin', url='https://linkedin.com/in/aysel')
+        Testimonial.objects.create(name_en='Client', thoughts_en='Great work', thoughts_ru='Отлично', order=1)
+        FAQ.objects.create(question_en='Why?', question_az='Niyə?', answer_en='Because.')
+        FAQ.objects.create(question_en='Hidden?', answer_en='Yes.', is_active=False)
+
+
+class ValuesSerializerTests(ListSerializerFixtures, APITestCase):
+    """Test cases for the values()-based list fast path"""
+
+    viewsets = (ServiceViewSet, TeamMemberViewSet, TestimonialViewSet, FAQViewSet)
+
+    def test_matches_the_serializers(self):
+        """Every field of every row equals the ModelSerializer output, in each language"""
+        for language in ('en', 'az', 'ru'):
+            for viewset in self.viewsets:
+                with self.subTest(language=language, viewset=viewset.__name__), translation.override(language):
+                    request = Request(APIRequestFactory().get('/api/'))
+                    view = viewset(request=request, format_kwarg=None, action='list')
+                    queryset = view.filter_queryset(view.get_queryset())
+                    expected = json.loads(JSONRenderer().render(view.get_serializer(queryset, many=True).data))
+                    fast = view.values_serializer_class(context=view.get_serializer_context()).serialize(queryset)
+                    self.assertEqual(json.loads(JSONRenderer().render(fast)), expected)
+                    self.assertEqual([list(row) for row in fast], [list(row) for row in expected])
+
+    @mock.patch.object(ServiceViewSet, 'json_serializer_class', None)
+    @mock.patch.object(TeamMemberViewSet, 'json_serializer_class', None)
+    def test_list_endpoints(self):
+        """Lists use the fast path with one query per relation; ?lang=all uses the serializer"""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('services-list'), HTTP_ACCEPT_LANGUAGE='az')
+        self.assertEqual(len(queries), 2)
+        design = response.json()[1]
+        self.assertEqual(design['title'], 'Dizayn')
+        self.assertEqual(design['features_list'], ['Brand book', 'Logo'])
+        self.assertEqual(design['image'], 'http://testserver/media/services/design.png')
+
+        social = self.client.get(reverse('team-list')).json()[0]['social']
+        self.assertEqual(social, {'github': 'https://github.com/aysel', 'linkedin': 'https://linkedin.com/in/aysel'})
+
+        response = self.client.get(reverse('faq-list'), {'lang': 'all'})
+        self.assertEqual(response.json()[0]['question'], {'en': 'Why?', 'az': 'Niyə?', 'ru': 'Why?'})
+
+
+class DatabaseJSONTests(ListSerializerFixtures, APITestCase):
+    """Test cases for list JSON assembled by Postgres"""
+
+    viewsets = (ServiceViewSet, TeamMemberViewSet, FAQViewSet)
+
+    def serialize(self, viewset, language):
+        with translation.override(language):
+            request = Request(APIRequestFactory().get('/api/'))
+            view = viewset(request=request, format_kwarg=None, action='list')
+            queryset = view.filter_queryset(view.get_queryset())
+            expected = json.loads(JSONRenderer().render(view.get_serializer(queryset, many=True).data))
+            payload = view.json_serializer_class(context=view.get_serializer_context()).render(queryset)
+            return expected, payload
+
+    def test_matches_the_serializers(self):
+        """The payload is the serializer output as JSON, keys in the same order, in each language"""
+        for language in ('en', 'az', 'ru'):
+            for viewset in self.viewsets:
+                with self.subTest(language=language, viewset=viewset.__name__):
+                    expected, payload = self.serialize(viewset, language)
+                    self.assertEqual(json.loads(payload), expected)
+                    self.assertEqual(json.loads(payload, object_pairs_hook=list),
+                                     json.loads(json.dumps(expected), object_pairs_hook=list))
+
+    def test_list_endpoints(self):
+        """A list is one query returned as it is; ?lang=all still goes through the serializer"""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('services-list'), HTTP_ACCEPT_LANGUAGE='az')
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(response.json()[1]['features_list'], ['Brand book', 'Logo'])
+
+        response = self.client.get(reverse('faq-list'), {'lang': 'all'})
+        self.assertEqual(response.json()[0]['question'], {'en': 'Why?', 'az': 'Niyə?', 'ru': 'Why?'})
+
+    def test_falls_back_when_sql_cannot_match(self):
+        """File names needing URL quoting and non-UTC timezones are left to the serializers"""
+        self.assertIsNotNone(self.serialize(TeamMemberViewSet, 'en')[1])
+        TeamMember.objects.filter(image='team/aysel.jpg').update(image='team/aysel photo.jpg')
+        self.assertIsNone(self.serialize(TeamMemberViewSet, 'en')[1])
+        response = self.client.get(reverse('team-list'))
+        self.assertEqual(response.json()[0]['image'], 'http://testserver/media/team/aysel%20photo.jpg')
+
+        with timezone.override('Asia/Baku'):
+            self.assertIsNone(TeamMemberDatabaseJSONSerializer().pairs)
+
+
+# =============================================================================
+# MIDDLEWARE TESTS
+# =============================================================================
+
+class LeanMiddlewareTests(TestCase):
+    """Test cases for the path-scoped middleware stack"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = Client(enforce_csrf_checks=True)
+
+    def test_api_runs_lean_stack(self):
+        """API requests get no session, messages or X-Frame-Options"""
+        response = self.client.get(reverse('faq-list'), HTTP_ACCEPT_LANGUAGE='az')
+        self.assertEqual(response.status_code, 200)
+        request = response.wsgi_request
+        # DRF still sets request.user, to AnonymousUser, when it authenticates
+        for attribute in ('session', '_messages'):
+            self.assertFalse(hasattr(request, attribute), attribute)
+        self.assertNotIn('X-Frame-Options', response)
+        self.assertEqual(response.cookies, {})
+        # CORS, locale and common middleware still run
+        self.assertEqual(request.LANGUAGE_CODE, 'az')
+        self.assertEqual(response['Content-Language'], 'az')
+
+    def test_api_posts_need_no_csrf_token(self):
+        """The public contact form posts without a CSRF cookie"""
+        response = self.client.post(reverse('contact-list'), {
+            'fullName': 'John Doe', 'email': 'john@example.com', 'phone': '+1234567890',
+            'company': 'Test Company', 'subject': 'Hello',
+        })
+        self.assertEqual(response.status_code, 201)
+
+    def test_admin_keeps_full_stack(self):
+        """The admin still gets sessions, CSRF protection, users and X-Frame-Options"""
+        response = self.client.get(reverse('admin:login'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['X-Frame-Options'], 'DENY')
+        self.assertIn('csrftoken', response.cookies)
+        self.assertFalse(response.wsgi_request.user.is_authenticated)
+
+        response = self.client.post(reverse('admin:login'), {'username': 'admin', 'password': 'password-123'})
+        self.assertEqual(response.status_code, 403)
+
+        User.objects.create_superuser('admin', 'admin@example.com', 'password-123')
+        self.client.force_login(User.objects.get(username='admin'))
+        response = self.client.get(reverse('admin:index'))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.wsgi_request.user.is_superuser)
+
+    def test_api_skips_csrf_view_check(self):
+        """The CSRF view check, which the handler runs outside the chain, passes on API paths only"""
+        middleware = FullStackCsrfViewMiddleware(lambda request: HttpResponse())
+        view = lambda request: HttpResponse()  # not csrf_exempt
+
+        for path, rejected in (('/api/contact/', False), ('/admin/login/', True)):
+            request = RequestFactory().post(path)
+            response = middleware.process_view(request, view, (), {})
+            self.assertEqual(response is not None and response.status_code == 403, rejected, path)
+
+    @override_settings(STATELESS_PATHS=())
+    def test_full_stack_without_lean_paths(self):
+        """An empty STATELESS_PATHS runs every middleware everywhere"""
+        response = Client().get(reverse('faq-list'))
+        self.assertEqual(response['X-Frame-Options'], 'DENY')
+        self.assertTrue(hasattr(response.wsgi_request, 'session'))
+
+
+# =============================================================================
+# READ REPLICA TESTS
+# =============================================================================
+
+@override_settings(DATABASE_REPLICAS=['replica1', 'replica2'])
+class ReplicaRoutingTests(TestCase):
+    """Test cases for routing API reads to read replicas"""
+
+    def setUp(self):
+        cache.clear()
+        replicas._health.clear()
+        self.factory = RequestFactory()
+        self.router = replicas.PrimaryReplicaRouter()
+
+    def route(self, request):
+        with replicas.replica_reads(request):
+            return FAQ.objects.all().db, self.router.db_for_write(FAQ)
+
+    @mock.patch('core.replicas.replica_healthy', return_value=True)
+    def test_safe_requests_read_from_a_replica(self, healthy):
+        """Reads inside replica_reads go to one replica, writes and reads outside it to the primary"""
+        self.assertIn(self.route(self.factory.get('/api/faqs/')), [('replica1', 'default'), ('replica2', 'default')])
+        self.assertEqual(FAQ.objects.all().db, 'default')
+        self.assertEqual(self.route(self.factory.post('/api/faqs/')), ('default', 'default'))
+        with override_settings(DATABASE_REPLICAS=[]):
+            self.assertEqual(self.route(self.factory.get('/api/faqs/')), ('default', 'default'))
+
+    @mock.patch('core.replicas.replica_healthy', side_effect=lambda alias: alias == 'replica2')
+    def test_unhealthy_replicas_are_skipped(self, healthy):
+        """Reads go to a healthy replica, or to the primary when there is none"""
+        for _ in range(5):
+            self.assertEqual(self.route(self.factory.get('/'))[0], 'replica2')
+        healthy.side_effect = lambda alias: False
+        self.assertEqual(self.route(self.factory.get('/'))[0], 'default')
+
+    def test_health_checks(self):
+        """A replica is healthy when it answers and is caught up; results are reused for the check interval"""
+        self.assertTrue(replicas._check('default'))
+        with override_settings(DATABASE_REPLICA_MAX_LAG=-1), self.assertLogs('core.replicas', 'WARNING'):
+            self.assertFalse(replicas._check('default'))
+
+        broken = mock.MagicMock()
+        broken.__getitem__.return_value.cursor.side_effect = OperationalError('connection refused')
+        with mock.patch('core.replicas.connections', broken), self.assertLogs('core.replicas', 'WARNING'):
+            self.assertFalse(replicas._check('replica1'))
+        broken.__getitem__.return_value.close.assert_called_once()
+
+        with mock.patch('core.replicas._check', return_value=True) as check, \
+                mock.patch('core.replicas.time.monotonic', return_value=100.0) as clock:
+            self.assertTrue(replicas.replica_healthy('replica1'))
+            self.assertTrue(replicas.replica_healthy('replica1'))
+            self.assertEqual(check.call_count, 1)
+            clock.return_value = 100.0 + settings.DATABASE_REPLICA_CHECK_INTERVAL
+            check.return_value = False
+            self.assertFalse(replicas.replica_healthy('replica1'))
+            self.assertEqual(check.call_count, 2)
+
+    @mock.patch('core.replicas.replica_healthy', return_value=True)
+    def test_writes_pin_reads_to_the_primary(self, healthy):
+        """A successful write pins its client (by cookie); a data change pins everyone (by cache)"""
+        response = self.client.post(reverse('contact-list'), {
+            'fullName': 'John Doe', 'email': 'john@example.com', 'phone': '+1234567890',
+            'company': 'Test Company', 'subject': 'Hello',
+        })
+        self.assertEqual(response.status_code, 201)
+        cookie = response.cookies[replicas.PIN_COOKIE]
+        self.assertEqual(cookie['max-age'], settings.DATABASE_REPLICA_PIN_SECONDS)
+        # A contact inquiry is no cached data: other clients keep reading from replicas
+        self.assertIsNone(cache.get(replicas.PIN_KEY))
+        self.assertNotEqual(self.route(self.factory.get('/'))[0], 'default')
+        request = self.factory.get('/')
+        request.COOKIES[replicas.PIN_COOKIE] = '1'
+        self.assertEqual(self.route(request)[0], 'default')
+
+        # Rejected and failed writes pin nobody
+        for response in (
+            Client().post(reverse('contact-list'), {'fullName': 'Jane'}),
+            Client().post(reverse('faq-list')),
+            Client().post('/api/missing/'),
+        ):
+            self.assertGreaterEqual(response.status_code, 400)
+            self.assertNotIn(replicas.PIN_COOKIE, response.cookies)
+        self.assertIsNone(cache.get(replicas.PIN_KEY))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            FAQ.objects.create(question='Why?', answer='Because')
+        self.assertEqual(self.route(self.factory.get('/'))[0], 'default')
+
+        with override_settings(DATABASE_REPLICAS=[]):
+            response = self.client.post(reverse('contact-list'), {
+                'fullName': 'Jane', 'email': 'jane@example.com', 'subject': 'Hi',
+            })
+        self.assertNotIn(replicas.PIN_COOKIE, response.cookies)
+
+    @mock.patch('core.replicas.replica_healthy', return_value=False)
+    def test_read_only_viewsets_choose_a_replica(self, healthy):
+        """Safe requests on the read-only viewsets, and only those, look for a replica"""
+        self.assertEqual(self.client.get(reverse('faq-list')).status_code, 200)
+        self.assertEqual(self.client.get(reverse('blog-list')).status_code, 200)
+        self.assertEqual(healthy.call_count, 4)
+        healthy.reset_mock()
+        self.client.get(reverse('contact-list'))
+        healthy.assert_not_called()
@@ -2,18 +2,18 @@ from modeltranslation.translator import translator, TranslationOptions
 from .models import BlogPost, PortfolioItem, PortfolioCategory ,Service, TeamMember, Testimonial , Category , FAQ , HeaderNavLink
 
 class BlogPostTO(TranslationOptions):
-    fields = ("title", "excerpt", "content", "readTime")
+    fields = ("title", "slug", "excerpt", "content", "readTime")
 
 class CategoryTO(TranslationOptions):
     fields = ("name",)
 class PortfolioItemTO(TranslationOptions):
-    fields = ("title", "description", "client")
+    fields = ("title", "slug", "description", "client")
 
 class PortfolioCategoryTO(TranslationOptions):
     fields = ("name",)
 
 class ServiceTO(TranslationOptions):
-    fields = ("title", "description", "details")
+    fields = ("title", "slug", "description", "details")
 
 class TeamMemberTO(TranslationOptions):
     fields = ("name", "role", "bio")
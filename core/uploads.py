@@ -0,0 +1,223 @@
+"""
+Direct-to-bucket multipart uploads for admin ImageFields.
+
+The browser asks the admin for a multipart upload, PUTs the parts in
+parallel to presigned S3 URLs and completes the upload; the admin form then
+only receives a signed token naming the stored object, so file bytes never
+pass through a gunicorn worker.
+"""
+import math
+from io import BytesIO
+
+from django import forms
+from django.conf import settings
+from django.contrib.admin.widgets import AdminFileWidget
+from django.core import signing
+from django.core.files import File
+from django.core.validators import validate_image_file_extension
+from django.utils.html import format_html
+from PIL import Image
+
+UPLOAD_SALT = "core.uploads.multipart"
+STORED_SALT = "core.uploads.stored"
+
+# S3 limits: at most 10000 parts, each at least 5 MiB except the last one
+MAX_PARTS = 10000
+MIN_PART_SIZE = 5 * 1024 * 1024
+# Leading bytes of a completed upload read to identify the image; the rest stays in the bucket
+HEADER_BYTES = 64 * 1024
+# What S3 reports when the browser sent no Content-Type
+UNTYPED = ("", "binary/octet-stream", "application/octet-stream")
+
+
+def field_label(field):
+    """Identify a model file field, e.g. ``core.blogpost.image``"""
+    return f"{field.model._meta.label_lower}.{field.name}"
+
+
+def _client(storage):
+    return storage.connection.meta.client
+
+
+def _key(storage, name):
+    # S3Storage prefixes AWS_LOCATION when it stores a name; mirror that here
+    return storage._normalize_name(name)
+
+
+def start_upload(field, filename, size, content_type="", storage=None):
+    """
+    Create a multipart upload for a new file of ``field`` and presign one URL
+    per part. Returns ``{"token", "part_size", "urls"}``.
+    """
+    size = int(size)
+    if size <= 0 or size > settings.DIRECT_UPLOAD_MAX_SIZE:
+        raise ValueError(f"File size must be between 1 and {settings.DIRECT_UPLOAD_MAX_SIZE} bytes")
+
+    storage = storage or field.storage
+    client = _client(storage)
+    name = field.generate_filename(None, filename)
+    key = _key(storage, name)
+
+    params = storage.get_object_parameters(name)
+    if content_type:
+        params["ContentType"] = content_type
+    upload = client.create_multipart_upload(Bucket=storage.bucket_name, Key=key, **params)
+
+    part_size = max(settings.DIRECT_UPLOAD_PART_SIZE, MIN_PART_SIZE, math.ceil(size / MAX_PARTS))
+    urls = [
+        client.generate_presigned_url(
+            "upload_part",
+            Params={
+                "Bucket": storage.bucket_name,
+                "Key": key,
+                "UploadId": upload["UploadId"],
+                "PartNumber": number,
+            },
+            ExpiresIn=settings.DIRECT_UPLOAD_URL_EXPIRES,
+        )
+        for number in range(1, math.ceil(size / part_size) + 1)
+    ]
+    token = signing.dumps(
+        {"field": field_label(field), "name": name, "upload_id": upload["UploadId"]},
+        salt=UPLOAD_SALT,
+    )
+    return {"token": token, "part_size": part_size, "urls": urls}
+
+
+def _load_upload(token):
+    return signing.loads(token, salt=UPLOAD_SALT, max_age=settings.DIRECT_UPLOAD_URL_EXPIRES)
+
+
+def _check_image(storage, name):
+    """
+    Raise ``ValueError`` unless the stored object ``name`` looks like an image,
+    going by its metadata and first ``HEADER_BYTES`` only. Pillow parses the
+    header (format, dimensions, decompression bomb limits) and verifies the
+    whole file when it fits in that range.
+    """
+    client, key = _client(storage), _key(storage, name)
+    head = client.head_object(Bucket=storage.bucket_name, Key=key)
+    if head["ContentLength"] > settings.DIRECT_UPLOAD_MAX_SIZE:
+        raise ValueError(f"File size must be between 1 and {settings.DIRECT_UPLOAD_MAX_SIZE} bytes")
+    if head.get("ContentType", "") not in UNTYPED and not head["ContentType"].startswith("image/"):
+        raise ValueError(f"Not an image content type: {head['ContentType']}")
+    try:
+        validate_image_file_extension(File(None, name=name))
+    except forms.ValidationError as exc:
+        raise ValueError(" ".join(exc.messages)) from exc
+
+    body = client.get_object(Bucket=storage.bucket_name, Key=key, Range=f"bytes=0-{HEADER_BYTES - 1}")["Body"]
+    try:
+        with Image.open(BytesIO(body.read())) as image:
+            if head["ContentLength"] <= HEADER_BYTES:
+                image.verify()
+    except Exception as exc:
+        # Pillow raises all sorts of exceptions on bad input, as forms.ImageField notes
+        raise ValueError(str(forms.ImageField.default_error_messages["invalid_image"])) from exc
+
+
+def complete_upload(field, token, parts, storage=None):
+    """
+    Complete the multipart upload behind ``token`` from the browser's
+    ``[{"PartNumber", "ETag"}, ...]`` and return a signed token for the form.
+    The object is deleted and ``ValueError`` raised if it is not a valid image.
+    """
+    upload = _load_upload(token)
+    if upload["field"] != field_label(field):
+        raise signing.BadSignature("Upload token belongs to another field")
+
+    storage = storage or field.storage
+    parts = sorted(
+        ({"PartNumber": int(part["PartNumber"]), "ETag": str(part["ETag"])} for part in parts),
+        key=lambda part: part["PartNumber"],
+    )
+    _client(storage).complete_multipart_upload(
+        Bucket=storage.bucket_name,
+        Key=_key(storage, upload["name"]),
+        UploadId=upload["upload_id"],
+        MultipartUpload={"Parts": parts},
+    )
+    # The form only sees the stored name, so check the object here without downloading it
+    try:
+        _check_image(storage, upload["name"])
+    except ValueError:
+        storage.delete(upload["name"])
+        raise
+    return signing.dumps({"field": upload["field"], "name": upload["name"]}, salt=STORED_SALT)
+
+
+def abort_upload(field, token, storage=None):
+    """Abort the multipart upload behind ``token`` so its parts are discarded"""
+    upload = _load_upload(token)
+    storage = storage or field.storage
+    _client(storage).abort_multipart_upload(
+        Bucket=storage.bucket_name,
+        Key=_key(storage, upload["name"]),
+        UploadId=upload["upload_id"],
+    )
+
+
+def resolve_stored_name(token, label):
+    """Return the storage name behind a completed upload token for field ``label``"""
+    stored = signing.loads(token, salt=STORED_SALT, max_age=settings.DIRECT_UPLOAD_TOKEN_MAX_AGE)
+    if stored["field"] != label:
+        raise signing.BadSignature("Upload token belongs to another field")
+    return stored["name"]
+
+
+class DirectUploadWidget(AdminFileWidget):
+    """
+    AdminFileWidget that uploads the chosen file straight to the bucket and
+    submits a signed token (``<name>__upload``) instead of the file itself.
+    """
+
+    class Media:
+        js = ["core/admin/direct_upload.js"]
+
+    def __init__(self, field, urls, attrs=None):
+        self.field_label = field_label(field)
+        attrs = {
+            **(attrs or {}),
+            "data-direct-upload-field": field.name,
+            "data-direct-upload-start": urls["start"],
+            "data-direct-upload-complete": urls["complete"],
+            "data-direct-upload-abort": urls["abort"],
+        }
+        super().__init__(attrs)
+
+    def render(self, name, value, attrs=None, renderer=None):
+        html = super().render(name, value, attrs, renderer)
+        return html + format_html('<input type="hidden" name="{}__upload" value="">', name)
+
+    def value_from_datadict(self, data, files, name):
+        token = data.get(f"{name}__upload")
+        if token:
+            try:
+                return resolve_stored_name(token, self.field_label)
+            except signing.BadSignature:
+                return DirectUploadImageField.INVALID_TOKEN
+        return super().value_from_datadict(data, files, name)
+
+    def value_omitted_from_data(self, data, files, name):
+        return not data.get(f"{name}__upload") and super().value_omitted_from_data(data, files, name)
+
+
+class DirectUploadImageField(forms.ImageField):
+    """ImageField that also accepts the storage name of an already uploaded object"""
+    INVALID_TOKEN = object()
+
+    default_error_messages = {
+        "invalid_upload": "The uploaded file could not be verified. Please upload it again.",
+    }
+
+    def to_python(self, data):
+        if data is self.INVALID_TOKEN:
+            raise forms.ValidationError(self.error_messages["invalid_upload"], code="invalid_upload")
+        if isinstance(data, str):
+            # Already stored in the bucket by the browser
+            return data
+        return super().to_python(data)
+
+    def run_validators(self, value):
+        # Validators such as the image extension check expect a File
+        super().run_validators(File(None, name=value) if isinstance(value, str) else value)
@@ -4,7 +4,8 @@ from .views import (
     BlogPostViewSet, PortfolioItemViewSet, ServiceViewSet,
     TeamMemberViewSet, TestimonialViewSet, ContactInquiryViewSet , FAQViewSet , HeaderNavLinkViewSet
 )
-from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView, SpectacularSwaggerView
+from drf_spectacular.views import SpectacularRedocView, SpectacularSwaggerView
+from .schema import CachedSpectacularAPIView
 
 router = DefaultRouter()
 router.register(r"blog", BlogPostViewSet, basename="blog")
@@ -18,7 +19,7 @@ router.register(r'header-nav-links', HeaderNavLinkViewSet, basename='headernavli
 
 urlpatterns = [
     path("", include(router.urls)),
-    path('schema/', SpectacularAPIView.as_view(), name='schema'),
+    path('schema/', CachedSpectacularAPIView.as_view(), name='schema'),
 
     # Swagger UI
     path('docs/swagger/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
@@ -0,0 +1,182 @@
+"""
+Values-based fast path for read-only list endpoints.
+
+A ``ValuesSerializer`` produces exactly the list output of its
+``serializer_class`` (a ModelSerializer) from ``values()`` rows, without
+building a model instance or running every serializer field per row:
+
+* translated fields are resolved in SQL along the descriptor's fallback
+  chain (``localized_expression``);
+* reverse foreign keys named in ``nested`` are fetched with one query per
+  relation and grouped by parent id;
+* only fields whose representation differs from the database value (dates,
+  files, choice labels) are converted, the rest are copied as they are, and
+  whatever a field looks up per value (its timezone) is looked up once;
+* ``SerializerMethodField``s are implemented as ``get_<name>(row)``, where
+  ``row`` holds the columns and the nested lists under their relation name.
+
+Fields it cannot reproduce raise ImproperlyConfigured when it is built.
+"""
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db import models
+from django.utils.encoding import force_str
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+from .i18n import get_translated_fields, localized_expression
+from .serializers import (
+    FAQSerializer, ServiceFeatureSerializer, ServiceSerializer, SocialLinkSerializer, TeamMemberSerializer,
+    TestimonialSerializer,
+)
+
+# Serializer fields whose representation of a database value is the value itself
+PLAIN_FIELDS = (serializers.CharField, serializers.IntegerField, serializers.BooleanField, serializers.ChoiceField)
+CONVERTED_FIELDS = (serializers.DateTimeField, serializers.DateField, serializers.TimeField)
+
+
+class ValuesSerializer:
+    """Builds ``serializer_class``'s list representation of a queryset from ``values()`` rows"""
+    serializer_class = None
+    # {field name: ValuesSerializer of the reverse foreign key it renders}
+    nested = {}
+
+    def __init__(self, context=None):
+        self.context = context or {}
+        self.model = self.serializer_class.Meta.model
+        self.columns = {}
+        self.converters = []
+        self.relations = {}
+        self._compile(self.serializer_class(context=self.context))
+
+    def _compile(self, serializer):
+        translated = get_translated_fields(self.model)
+        for name, field in serializer.fields.items():
+            if name in self.nested:
+                relation = self.model._meta.get_field(field.source)
+                child = self.nested[name](self.context, parent=relation.field.attname)
+                self.relations[field.source] = (relation, child)
+                self.converters.append((name, lambda row, source=field.source: row[source]))
+            elif isinstance(field, serializers.SerializerMethodField):
+                self.converters.append((name, getattr(self, f"get_{name}")))
+            else:
+                self.converters.append((name, self._field_converter(name, field, translated)))
+
+    def _field_converter(self, name, field, translated):
+        source = field.source
+        display = source.startswith("get_") and source.endswith("_display")
+        if display:
+            source = source[len("get_"):-len("_display")]
+        try:
+            model_field = self.model._meta.get_field(source)
+        except FieldDoesNotExist:
+            raise ImproperlyConfigured(f"{type(self).__name__} cannot render {name!r} from values()")
+
+        # Aliased so an annotation never clashes with the model field it reads
+        column = f"v_{source}"
+        if source in translated:
+            self.columns[column] = localized_expression(self.model, source)
+        else:
+            self.columns[column] = models.F(model_field.attname)
+
+        if display:
+            choices = dict(model_field.flatchoices)
+            return lambda row: force_str(choices.get(row[column], row[column]), strings_only=True)
+        if isinstance(model_field, models.FileField):
+            return self._file_converter(column, model_field.storage)
+        if isinstance(field, PLAIN_FIELDS):
+            return lambda row: row[column]
+        if isinstance(field, serializers.DateTimeField):
+            return self._datetime_converter(column, field)
+        if isinstance(field, CONVERTED_FIELDS):
+            return lambda row: None if row[column] is None else field.to_representation(row[column])
+        raise ImproperlyConfigured(f"{type(self).__name__} cannot render {name!r} from values()")
+
+    def _datetime_converter(self, column, field):
+        """``DateTimeField.to_representation`` with its format and timezone looked up once, not per value"""
+        output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+        field_timezone = field.timezone if hasattr(field, "timezone") else field.default_timezone()
+        if output_format is None or output_format.lower() != ISO_8601 or field_timezone is None:
+            return lambda row: None if row[column] is None else field.to_representation(row[column])
+
+        def convert(row):
+            if row[column] is None:
+                return None
+            # Aware, as read from the database with USE_TZ
+            value = row[column].astimezone(field_timezone).isoformat()
+            return value[:-6] + "Z" if value.endswith("+00:00") else value
+
+        return convert
+
+    def _file_converter(self, column, storage):
+        request = self.context.get("request")
+
+        def convert(row):
+            if not row[column]:
+                return None
+            url = storage.url(row[column])
+            return request.build_absolute_uri(url) if request is not None else url
+
+        return convert
+
+    def rows(self, queryset):
+        """``values()`` rows of ``queryset`` with the nested lists attached"""
+        # A positional field keeps values() from also selecting the model's own columns
+        rows = list(queryset.prefetch_related(None).values("pk", **self.columns))
+        if rows and self.relations:
+            ids = [row["pk"] for row in rows]
+            for source, (relation, child) in self.relations.items():
+                children = relation.related_model._default_manager.filter(**{f"{child.parent}__in": ids})
+                grouped = {}
+                for child_row in child.rows(children):
+                    grouped.setdefault(child_row["v_parent"], []).append(child.to_representation(child_row))
+                for row in rows:
+                    row[source] = grouped.get(row["pk"], [])
+        return rows
+
+    def to_representation(self, row):
+        return {name: convert(row) for name, convert in self.converters}
+
+    def serialize(self, queryset):
+        """The list ``serializer_class(queryset, many=True).data`` would produce"""
+        return [self.to_representation(row) for row in self.rows(queryset)]
+
+
+class NestedValuesSerializer(ValuesSerializer):
+    """ValuesSerializer of a reverse foreign key; its rows carry the ``parent`` column as ``v_parent``"""
+
+    def __init__(self, context=None, parent=None):
+        super().__init__(context)
+        self.parent = parent
+        self.columns["v_parent"] = models.F(parent)
+
+
+class ServiceFeatureValuesSerializer(NestedValuesSerializer):
+    serializer_class = ServiceFeatureSerializer
+
+
+class SocialLinkValuesSerializer(NestedValuesSerializer):
+    serializer_class = SocialLinkSerializer
+
+
+class ServiceValuesSerializer(ValuesSerializer):
+    serializer_class = ServiceSerializer
+    nested = {"features": ServiceFeatureValuesSerializer}
+
+    def get_features_list(self, row):
+        return [feature["name"] for feature in row["service_features"]]
+
+
+class TeamMemberValuesSerializer(ValuesSerializer):
+    serializer_class = TeamMemberSerializer
+    nested = {"social_links": SocialLinkValuesSerializer}
+
+    def get_social(self, row):
+        return {link["platform"]: link["url"] for link in row["social_links"]}
+
+
+class TestimonialValuesSerializer(ValuesSerializer):
+    serializer_class = TestimonialSerializer
+
+
+class FAQValuesSerializer(ValuesSerializer):
+    serializer_class = FAQSerializer
@@ -1,6 +1,9 @@
 import logging
+from functools import partial
+from django.conf import settings
+from django.contrib.auth import get_user_model
 from django.db import transaction
-from django.http import JsonResponse , HttpResponse
+from django.http import Http404, JsonResponse , HttpResponse
 
 from django.db.models import Count, Q
 from django.utils.translation import gettext_lazy as _ , get_language , activate
@@ -8,16 +11,34 @@ from django.core.exceptions import ValidationError
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import viewsets, filters, status
 from rest_framework.decorators import action
+from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response 
-from rest_framework.exceptions import NotFound, ValidationError as DRFValidationError
+from rest_framework.exceptions import NotAcceptable, NotFound, ValidationError as DRFValidationError
 
-from .models import BlogPost, PortfolioItem, PortfolioCategory, Service, TeamMember, Testimonial, ContactInquiry , HeaderNavLink , FAQ
+from .cache import cached_response, response_cache_key, version_stamp
+from .counts import CATEGORY, MONTH, TAG, counts, with_counts
+from .filters import ExistsSearchFilter
+from .json_sql import FAQDatabaseJSONSerializer, ServiceDatabaseJSONSerializer, TeamMemberDatabaseJSONSerializer
+from .navigation import adjacent_posts
+from .related import related_posts
+from .replicas import replica_reads
+from .slugs import slug_lookup, slug_preference
+from .values_serializers import (
+    FAQValuesSerializer, ServiceValuesSerializer, TeamMemberValuesSerializer, TestimonialValuesSerializer,
+)
+from .i18n import defer_inactive_translations, wants_all_languages
+from .models import (
+    BlogPost, Category, Tag, PortfolioItem, PortfolioCategory, Service, ServiceFeature, SocialLink, Technology,
+    TeamMember, Testimonial, ContactInquiry , HeaderNavLink , FAQ,
+)
 from .serializers import (
-    BlogPostSerializer, PortfolioItemSerializer, ServiceSerializer,
+    BlogPostSerializer, BlogPostNeighbourSerializer, CategoryCountSerializer, TagCountSerializer,
+    PortfolioItemSerializer, ServiceSerializer,
     TeamMemberSerializer, TestimonialSerializer, ContactInquirySerializer , HeaderNavLinkSerializer , FAQSerializer , PortfolioCategorySerializer
 )
 
 logger = logging.getLogger(__name__)
+User = get_user_model()
 
 
 class ErrorHandlingMixin:
@@ -44,6 +65,156 @@ class ErrorHandlingMixin:
             logger.error(f"Error filtering queryset in {self.__class__.__name__}: {str(e)}")
             return queryset.none()
 
+
+class TranslationProjectionMixin:
+    """
+    Mixin that loads only the translation columns the active language can
+    read, or every translation at once for ``?lang=all``
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if wants_all_languages(self.request):
+            return queryset
+        return defer_inactive_translations(queryset)
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["all_languages"] = wants_all_languages(self.request)
+        return context
+
+class CachedResponseMixin:
+    """
+    Mixin serving JSON GET responses from the stale-while-revalidate response
+    cache, keyed by path, query string and language, and stamped with the
+    versions of the viewset's model and ``cache_dependencies``, which are
+    bumped on every change.
+    """
+    cache_dependencies = ()
+
+    def dispatch(self, request, *args, **kwargs):
+        key = self.get_response_cache_key(request, *args, **kwargs)
+        if key is None:
+            return super().dispatch(request, *args, **kwargs)
+        stamp = version_stamp((self.queryset.model, *self.cache_dependencies))
+        return cached_response(key, stamp, partial(super().dispatch, request, *args, **kwargs))
+
+    def get_response_cache_key(self, request, *args, **kwargs):
+        """Cache key for ``request``, or None if its response is not cached"""
+        if request.method != "GET" or not settings.API_CACHE_TIMEOUT:
+            return None
+        # Negotiate up front so only JSON (not the browsable API) is cached
+        self.format_kwarg = self.get_format_suffix(**kwargs)
+        try:
+            renderer, _ = self.perform_content_negotiation(self.initialize_request(request, *args, **kwargs))
+        except NotAcceptable:
+            return None
+        if renderer.format != "json":
+            return None
+        return response_cache_key(request, get_language())
+
+
+class ReplicaReadMixin:
+    """
+    Mixin serving safe requests from a healthy read replica, unless the data
+    changed moments ago (see core.replicas)
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        with replica_reads(request):
+            return super().dispatch(request, *args, **kwargs)
+
+
+class SlugLookupMixin:
+    """
+    Detail routes accept either the numeric id or the object's slug in any
+    language; a slug resolves through the per-language unique slug indexes.
+    """
+
+    def get_object(self):
+        return self.lookup_object(self.get_queryset())
+
+    def lookup_object(self, queryset):
+        """The object of ``queryset`` the URL names by id or slug, found as ``get_object`` finds it"""
+        value = self.kwargs[self.lookup_url_kwarg or self.lookup_field]
+        queryset = self.filter_queryset(queryset)
+        if value.isdigit():
+            obj = get_object_or_404(queryset, **{self.lookup_field: value})
+        else:
+            matches = list(queryset.filter(slug_lookup(value)).order_by(slug_preference(value))[:1])
+            if not matches:
+                raise Http404
+            obj = matches[0]
+        self.check_object_permissions(self.request, obj)
+        return obj
+
+
+class DatabaseJSONListMixin:
+    """
+    Mixin answering JSON ``list`` requests with the array Postgres assembles
+    through ``json_serializer_class`` (see core.json_sql), returned as it is.
+    Requests or data it cannot reproduce go on to the regular ``list``.
+    """
+    json_serializer_class = None
+
+    def list(self, request, *args, **kwargs):
+        if (
+            self.json_serializer_class is not None
+            and self.paginator is None
+            and request.accepted_renderer.format == "json"
+            and not wants_all_languages(request)
+        ):
+            json_serializer = self.json_serializer_class(context=self.get_serializer_context())
+            payload = json_serializer.render(self.filter_queryset(self.get_queryset()))
+            if payload is not None:
+                return HttpResponse(payload, content_type=request.accepted_renderer.media_type)
+        return super().list(request, *args, **kwargs)
+
+
+class ValuesListMixin:
+    """
+    Mixin rendering ``list`` through ``values_serializer_class``, a
+    ValuesSerializer reproducing ``serializer_class``'s output from
+    ``values()`` rows. ``?lang=all`` and paginated lists use the serializer.
+    """
+    values_serializer_class = None
+
+    def list(self, request, *args, **kwargs):
+        if self.values_serializer_class is None or self.paginator is not None or wants_all_languages(request):
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        values_serializer = self.values_serializer_class(context=self.get_serializer_context())
+        return Response(values_serializer.serialize(queryset))
+
+
+class BulkRetrieveMixin:
+    """
+    Mixin adding ``?ids=1,2,3`` to ``list``: the listed objects, in request
+    order, fetched with one ``in_bulk`` over the viewset's queryset (and its
+    prefetches and filters). Unknown ids are skipped.
+    """
+    ids_param = "ids"
+
+    def list(self, request, *args, **kwargs):
+        if self.ids_param not in request.query_params:
+            return super().list(request, *args, **kwargs)
+        ids = self.get_requested_ids()
+        objects = self.filter_queryset(self.get_queryset()).in_bulk(ids)
+        serializer = self.get_serializer([objects[pk] for pk in ids if pk in objects], many=True)
+        return Response(serializer.data)
+
+    def get_requested_ids(self):
+        pk_field = self.get_queryset().model._meta.pk
+        values = [value.strip() for value in self.request.query_params[self.ids_param].split(",") if value.strip()]
+        try:
+            # dict.fromkeys drops repeats and keeps the requested order
+            ids = list(dict.fromkeys(pk_field.to_python(value) for value in values))
+        except ValidationError:
+            raise DRFValidationError({self.ids_param: "Must be a comma-separated list of ids."})
+        if len(ids) > settings.BULK_IDS_MAX:
+            raise DRFValidationError({self.ids_param: f"At most {settings.BULK_IDS_MAX} ids are allowed."})
+        return ids
+
 # def debug_language(request):
 #     # activate('ru')
 #     session_lang = request.session.get('django_language')
@@ -54,24 +225,77 @@ class ErrorHandlingMixin:
 #         f"Session: {session_lang}, Cookie: {cookie_lang}, Accept-Language: {accept_lang}, Active: {active_lang}"
 #     )
 
-class BlogPostViewSet(viewsets.ReadOnlyModelViewSet):
+class BlogPostViewSet(
+    ReplicaReadMixin, CachedResponseMixin, SlugLookupMixin, BulkRetrieveMixin, TranslationProjectionMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """ViewSet for BlogPost model with optimized queries"""
+    cache_dependencies = (Tag, Category, User)
+    queryset = BlogPost.objects.select_related("author").prefetch_related("tags", "categories").all()
     serializer_class = BlogPostSerializer
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, ExistsSearchFilter, filters.OrderingFilter]
     filterset_fields = ["status", "categories", "tags"]
     search_fields = ["title", "excerpt", "content", "categories__name", "tags__name"]
     ordering_fields = ["date", "createdAt","order"]
 
-    def get_queryset(self):
-        
-        return BlogPost.objects.select_related("author").prefetch_related("tags",'categories').all()
+    def retrieve(self, request, *args, **kwargs):
+        """Optionally (``?neighbours=1``) include the previous and next published posts"""
+        instance = self.get_object()
+        data = self.get_serializer(instance).data
+        if request.query_params.get("neighbours") in ("1", "true"):
+            queryset = BlogPost.objects.only("id", "title", "slug", "date")
+            if not wants_all_languages(request):
+                queryset = defer_inactive_translations(queryset)
+            context = self.get_serializer_context()
+            for key, post in zip(("previous", "next"), adjacent_posts(instance, queryset)):
+                data[key] = post and BlogPostNeighbourSerializer(post, context=context).data
+        return Response(data)
 
+    @action(detail=True, methods=["get"])
+    def related(self, request, pk=None):
+        """Return the published posts most related to this one by shared tags and categories"""
+        # Only its id is needed: no author, content or tag/category prefetches
+        post = self.lookup_object(self.get_queryset().select_related(None).prefetch_related(None).only("pk"))
+        try:
+            limit = int(request.query_params.get("limit", settings.RELATED_POSTS_LIMIT))
+        except ValueError:
+            raise DRFValidationError({"limit": "Must be an integer."})
+        limit = max(0, min(limit, settings.RELATED_POSTS_MAX_LIMIT))
+        queryset = related_posts(self.get_queryset().filter(status="published"), post.pk, limit)
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serializer.data)
 
-class PortfolioItemViewSet(viewsets.ReadOnlyModelViewSet):
+    @action(detail=False, methods=["get"])
+    def archive(self, request):
+        """Return year/month buckets with their number of published posts, newest first"""
+        buckets = sorted(counts(MONTH).items(), reverse=True)
+        return Response([{"year": key // 100, "month": key % 100, "count": count} for key, count in buckets])
+
+    @action(detail=False, methods=["get"])
+    def categories(self, request):
+        """Return the categories that have published posts, with their post counts"""
+        queryset = Category.objects.all()
+        if not wants_all_languages(request):
+            queryset = defer_inactive_translations(queryset)
+        data = with_counts(queryset, CATEGORY)
+        return Response(CategoryCountSerializer(data, many=True, context=self.get_serializer_context()).data)
+
+    @action(detail=False, methods=["get"])
+    def tags(self, request):
+        """Return the tags that have published posts, with their post counts"""
+        data = with_counts(Tag.objects.all(), TAG)
+        return Response(TagCountSerializer(data, many=True).data)
+
+
+class PortfolioItemViewSet(
+    ReplicaReadMixin, CachedResponseMixin, SlugLookupMixin, BulkRetrieveMixin, TranslationProjectionMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """ViewSet for PortfolioItem model with optimized queries"""
+    cache_dependencies = (PortfolioCategory, Technology)
     queryset = PortfolioItem.objects.prefetch_related("technologies", "categories").all()
     serializer_class = PortfolioItemSerializer
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, ExistsSearchFilter, filters.OrderingFilter]
     filterset_fields = ["client", "technologies", "categories"]
     search_fields = ["title", "description", "client", "technologies__name", "categories__name"]
     ordering_fields = ["completionDate", "createdAt","order"]
@@ -84,7 +308,7 @@ class PortfolioItemViewSet(viewsets.ReadOnlyModelViewSet):
             .filter(item_count__gt=0)
             .order_by("order", "name")
         )
-        serializer = PortfolioCategorySerializer(data, many=True)
+        serializer = PortfolioCategorySerializer(data, many=True, context=self.get_serializer_context())
         return Response(serializer.data)
 
     @action(detail=False, methods=["get"], url_path=r"category/(?P<slug>[^/]+)")
@@ -98,28 +322,44 @@ class PortfolioItemViewSet(viewsets.ReadOnlyModelViewSet):
         serializer = self.get_serializer(qs, many=True)
         return Response(serializer.data)
 
-class ServiceViewSet(viewsets.ReadOnlyModelViewSet):
+class ServiceViewSet(
+    ReplicaReadMixin, CachedResponseMixin, SlugLookupMixin, BulkRetrieveMixin, DatabaseJSONListMixin,
+    ValuesListMixin, TranslationProjectionMixin, viewsets.ReadOnlyModelViewSet,
+):
     """ViewSet for Service model with optimized queries"""
+    cache_dependencies = (ServiceFeature,)
     queryset = Service.objects.prefetch_related("service_features").all()
     serializer_class = ServiceSerializer
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    values_serializer_class = ServiceValuesSerializer
+    json_serializer_class = ServiceDatabaseJSONSerializer
+    filter_backends = [ExistsSearchFilter, filters.OrderingFilter]
     search_fields = ["id", "title", "description", "details", "service_features__name"]
     ordering_fields = ["id", "createdAt","order"]
 
 
-class TeamMemberViewSet(viewsets.ReadOnlyModelViewSet):
+class TeamMemberViewSet(
+    ReplicaReadMixin, CachedResponseMixin, BulkRetrieveMixin, DatabaseJSONListMixin, ValuesListMixin,
+    TranslationProjectionMixin, viewsets.ReadOnlyModelViewSet,
+):
     """ViewSet for TeamMember model with optimized queries"""
+    cache_dependencies = (SocialLink,)
     queryset = TeamMember.objects.prefetch_related("social_links").all()
     serializer_class = TeamMemberSerializer
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    values_serializer_class = TeamMemberValuesSerializer
+    json_serializer_class = TeamMemberDatabaseJSONSerializer
+    filter_backends = [ExistsSearchFilter, filters.OrderingFilter]
     search_fields = ["name", "role", "bio", "social_links__platform"]
     ordering_fields = ["order", "id"]
 
 
-class TestimonialViewSet(viewsets.ReadOnlyModelViewSet):
+class TestimonialViewSet(
+    ReplicaReadMixin, CachedResponseMixin, BulkRetrieveMixin, ValuesListMixin, TranslationProjectionMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """ViewSet for Testimonial model"""
     queryset = Testimonial.objects.all()
     serializer_class = TestimonialSerializer
+    values_serializer_class = TestimonialValuesSerializer
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ["name", "role", "thoughts"]
     ordering_fields = ["order", "id"]
@@ -141,23 +381,42 @@ class ContactInquiryViewSet(viewsets.ModelViewSet):
         return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
 
 
-class FAQViewSet(viewsets.ReadOnlyModelViewSet):
+class FAQViewSet(
+    ReplicaReadMixin, CachedResponseMixin, BulkRetrieveMixin, DatabaseJSONListMixin, ValuesListMixin,
+    TranslationProjectionMixin, viewsets.ReadOnlyModelViewSet,
+):
     """ViewSet for FAQ model"""
     queryset = FAQ.objects.filter(is_active=True).order_by("order", "id")
     serializer_class = FAQSerializer
+    values_serializer_class = FAQValuesSerializer
+    json_serializer_class = FAQDatabaseJSONSerializer
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ["question", "answer"]
     ordering_fields = ["order", "id"]
 
 
-class HeaderNavLinkViewSet(viewsets.ReadOnlyModelViewSet):
+class HeaderNavLinkViewSet(
+    ReplicaReadMixin, CachedResponseMixin, BulkRetrieveMixin, TranslationProjectionMixin, viewsets.ReadOnlyModelViewSet
+):
     """ViewSet for Header Navigation Links (supports nested dropdowns)"""
-    queryset = (
-        HeaderNavLink.objects.filter(is_active=True, parent__isnull=True)
-        .prefetch_related("children")
-        .order_by("order", "id")
-    )
+    queryset = HeaderNavLink.objects.filter(is_active=True, parent__isnull=True).order_by("order", "id")
     serializer_class = HeaderNavLinkSerializer
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ["title", "url"]
-    ordering_fields = ["order", "id"]
\ No newline at end of file
+    ordering_fields = ["order", "id"]
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["nav_children"] = self.get_children_by_parent
+        return context
+
+    def get_children_by_parent(self):
+        """Every active child link grouped by parent id, in one query for menus of any depth"""
+        if not hasattr(self, "_children_by_parent"):
+            children = HeaderNavLink.objects.filter(is_active=True, parent__isnull=False).order_by("order", "id")
+            if not wants_all_languages(self.request):
+                children = defer_inactive_translations(children)
+            self._children_by_parent = {}
+            for link in children:
+                self._children_by_parent.setdefault(link.parent_id, []).append(link)
+        return self._children_by_parent
\ No newline at end of file
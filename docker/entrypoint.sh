@@ -6,9 +6,13 @@ python -c "import os; print('Using settings:', os.getenv('DJANGO_SETTINGS_MODULE
 
 python manage.py migrate --noinput
 python manage.py collectstatic --noinput
+python manage.py build_schema
+# Fill the shared response cache before the workers accept traffic
+python manage.py warm_cache
 
 # Compile translations (safe if none exist yet)
 # django-admin compilemessages || true
 
 # Start app
-exec gunicorn backend.wsgi:application --bind 0.0.0.0:8000 --workers=3 --timeout=60 --graceful-timeout=30 --log-level=info
+# Worker model, sizing and recycling: backend/gunicorn_conf.py
+exec gunicorn -c backend/gunicorn_conf.py